@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -5,40 +6,112 @@ import matplotlib.colors as mcolors
 from scipy.cluster import hierarchy
 from scipy.spatial.distance import pdist
 
-# 1. Load the Normalized Data
-# Ensure this file exists from the previous step
-input_file = 'result/result_matrix_merged.csv'
-df = pd.read_csv(input_file)
-df = df.set_index('test_taker_id')
+from util.bitmatrix import BitResponseMatrix
 
-def visualize_response_matrix_clustered(df, filename='output/response_matrix_visualization.pdf'):
+benchmark_order = ['assistantbench', 'taubench', 'corebench',  'swebench', 'gaia', 'scienceagentbench', 'scicode',
+                   'usaco', 'colbench']
+benchmark_name_map = {
+    'assistantbench': 'AssistantBench', 'corebench': 'CORE', 'gaia': 'GAIA',
+    'scicode': 'Scicode', 'swebench': 'SWE', 'taubench': 'TAU',
+    'usaco': 'USACO', 'colbench': 'COL', 'online': 'Mind2Web',
+    'scienceagentbench': 'ScienceAgentBench'
+}
+benchmark_order_map = {b: i for i, b in enumerate(benchmark_order)}
+
+rubric_types = ['environmentalbarrier', 'instructionfollowing', 'selfcorrection', 'tooluse', 'verification']
+
+
+def get_bench_sort_key(bench_name):
+    base = bench_name.split('_')[0]
+    return benchmark_order_map.get(base, 999)
+
+
+def to_multiindex_columns(df):
     """
-    Visualizes the response matrix with fixed row and column order if provided.
+    Returns a copy of df whose 'benchmark.task' columns are split into a
+    (benchmark, task_id) MultiIndex.
     """
     df_viz = df.copy()
+    if isinstance(df_viz.columns, pd.MultiIndex):
+        return df_viz
+    new_columns = []
+    for col in df_viz.columns:
+        if '.' in col:
+            parts = col.split('.', 1)
+            bench, task = parts[0], parts[1]
+        else:
+            bench = col.split('_')[0] if '_' in col else col
+            task = col
+        new_columns.append((bench, task))
+    df_viz.columns = pd.MultiIndex.from_tuples(new_columns, names=['benchmark', 'task_id'])
+    return df_viz
+
+
+def compute_fixed_order(df, bits=None):
+    """
+    Computes the shared row/column order used for the result and rubric plots.
+    Columns are grouped by benchmark and sorted by success rate, rows are
+    ordered by ward clustering. bits is the BitResponseMatrix of df, if
+    already built.
+
+    Returns (row_order, col_order, col_display).
+    """
+    df_viz = to_multiindex_columns(df)
+
+    if bits is None:
+        bits = BitResponseMatrix.from_array(df.to_numpy(dtype=float), df.index, df.columns)
+    task_success_rate = bits.column_accuracy()
+    col_meta = pd.DataFrame({
+        'bench': df_viz.columns.get_level_values('benchmark'),
+        'task': df_viz.columns.get_level_values('task_id'),
+        'success': task_success_rate.values
+    })
+    col_meta['bench_sort_key'] = col_meta['bench'].apply(get_bench_sort_key)
+    col_meta['bench_display'] = col_meta['bench'].map(lambda x: benchmark_name_map.get(x, benchmark_name_map.get(x.split('_')[0], x)))
+    sorted_cols_idx = col_meta.sort_values(['bench_sort_key', 'success']).index
+    col_order = sorted_cols_idx
+    col_display = col_meta.iloc[sorted_cols_idx]['bench_display'].values
+    df_viz = df_viz.iloc[:, col_order]
+
+    # Rows: clustering
+    cluster_data = df_viz.fillna(0.5)
+    if len(df_viz) > 1:
+        Z = hierarchy.linkage(cluster_data, method='ward', metric='euclidean', optimal_ordering=True)
+        row_order = hierarchy.leaves_list(Z)[::-1]
+    else:
+        row_order = None
+    return row_order, col_order, col_display
+
 
-    # If columns are not MultiIndex, create them
-    if not isinstance(df_viz.columns, pd.MultiIndex):
-        new_columns = []
-        for col in df_viz.columns:
-            if '.' in col:
-                parts = col.split('.', 1)
-                bench, task = parts[0], parts[1]
-            else:
-                bench = col.split('_')[0] if '_' in col else col
-                task = col
-            new_columns.append((bench, task))
-        df_viz.columns = pd.MultiIndex.from_tuples(new_columns, names=['benchmark', 'task_id'])
-
-    # If provided, use global row/col order
-    global fixed_row_order, fixed_col_order, fixed_col_display
-    if 'fixed_row_order' in globals() and fixed_row_order is not None:
-        df_viz = df_viz.iloc[fixed_row_order]
-    if 'fixed_col_order' in globals() and fixed_col_order is not None:
-        df_viz = df_viz.iloc[:, fixed_col_order]
+def save_accuracy_statistics(bits, output_dir='result'):
+    """
+    Writes per-test-taker accuracy and the test taker x test taker co-success
+    counts (tasks both solved), computed with popcounts on the bit-packed matrix.
+    """
+    attempted, correct = bits.row_counts()
+    accuracy = pd.DataFrame({'test_taker_id': bits.index, 'attempted': attempted, 'correct': correct,
+                             'accuracy': bits.row_accuracy().values})
+    co_success = pd.DataFrame(bits.co_success(axis=0), index=bits.index, columns=bits.index)
+    os.makedirs(output_dir, exist_ok=True)
+    accuracy.to_csv(os.path.join(output_dir, 'test_taker_accuracy.csv'), index=False)
+    co_success.to_csv(os.path.join(output_dir, 'test_taker_co_success.csv'))
+    print(f"Saved accuracy and co-success of {len(accuracy)} test takers to {output_dir}")
+
+
+def visualize_response_matrix_clustered(df, filename='output/response_matrix_visualization.pdf',
+                                        row_order=None, col_order=None, col_display=None):
+    """
+    Visualizes the response matrix with fixed row and column order if provided.
+    """
+    df_viz = to_multiindex_columns(df)
+
+    if row_order is not None:
+        df_viz = df_viz.iloc[row_order]
+    if col_order is not None:
+        df_viz = df_viz.iloc[:, col_order]
         # Update display names for columns if provided
-        if 'fixed_col_display' in globals() and fixed_col_display is not None:
-            df_viz.columns = pd.MultiIndex.from_arrays([fixed_col_display, df_viz.columns.get_level_values('task_id')], names=['benchmark', 'task_id'])
+        if col_display is not None:
+            df_viz.columns = pd.MultiIndex.from_arrays([col_display, df_viz.columns.get_level_values('task_id')], names=['benchmark', 'task_id'])
 
     # --- Visualization ---
     plot_data = df_viz.fillna(-1).values
@@ -82,84 +155,52 @@ def visualize_response_matrix_clustered(df, filename='output/response_matrix_vis
     cbar.set_ticks([-1, 0, 1])
     cbar.set_ticklabels(['Not Attempted', 'Incorrect', 'Correct'])
     plt.tight_layout()
-    import os
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     plt.savefig(filename, format='pdf', bbox_inches='tight')
+    plt.close(fig)
     print(f"Saved clustered visualization to {filename}")
 
-# Visualize the result matrix
-print("\n" + "="*60)
-print("VISUALIZING RESULT MATRIX")
-print("="*60)
-
-# --- Compute fixed row/col order from result matrix ---
-df_viz = df.copy()
-# Columns: MultiIndex
-new_columns = []
-for col in df_viz.columns:
-    if '.' in col:
-        parts = col.split('.', 1)
-        bench, task = parts[0], parts[1]
-    else:
-        bench = col.split('_')[0] if '_' in col else col
-        task = col
-    new_columns.append((bench, task))
-df_viz.columns = pd.MultiIndex.from_tuples(new_columns, names=['benchmark', 'task_id'])
 
-benchmark_order = ['assistantbench', 'taubench', 'corebench',  'swebench', 'gaia', 'scienceagentbench', 'scicode',
-                   'usaco', 'colbench']
-benchmark_name_map = {
-    'assistantbench': 'AssistantBench', 'corebench': 'CORE', 'gaia': 'GAIA',
-    'scicode': 'Scicode', 'swebench': 'SWE', 'taubench': 'TAU',
-    'usaco': 'USACO', 'colbench': 'COL', 'online': 'Mind2Web',
-    'scienceagentbench': 'ScienceAgentBench'
-}
-benchmark_order_map = {b: i for i, b in enumerate(benchmark_order)}
-def get_bench_sort_key(bench_name):
-    base = bench_name.split('_')[0]
-    return benchmark_order_map.get(base, 999)
-task_success_rate = df_viz.mean()
-col_meta = pd.DataFrame({
-    'bench': df_viz.columns.get_level_values('benchmark'),
-    'task': df_viz.columns.get_level_values('task_id'),
-    'success': task_success_rate.values
-})
-col_meta['bench_sort_key'] = col_meta['bench'].apply(get_bench_sort_key)
-col_meta['bench_display'] = col_meta['bench'].map(lambda x: benchmark_name_map.get(x, benchmark_name_map.get(x.split('_')[0], x)))
-sorted_cols_idx = col_meta.sort_values(['bench_sort_key', 'success']).index
-fixed_col_order = sorted_cols_idx
-fixed_col_display = col_meta.iloc[sorted_cols_idx]['bench_display'].values
-df_viz = df_viz.iloc[:, fixed_col_order]
-df_viz.columns = pd.MultiIndex.from_arrays([fixed_col_display, df_viz.columns.get_level_values('task_id')], names=['benchmark', 'task_id'])
-
-# Rows: clustering
-cluster_data = df_viz.fillna(0.5)
-if len(df_viz) > 1:
-    Z = hierarchy.linkage(cluster_data, method='ward', metric='euclidean', optimal_ordering=True)
-    leaves_order = hierarchy.leaves_list(Z)[::-1]
-    fixed_row_order = leaves_order
-    df_viz = df_viz.iloc[fixed_row_order]
-else:
-    fixed_row_order = None
-
-# Save result matrix visualization
-visualize_response_matrix_clustered(df, filename='result/response_matrix_visualization.pdf')
-
-# Visualize all rubric matrices with fixed order
-print("\n" + "="*60)
-print("VISUALIZING RUBRIC MATRICES")
-print("="*60)
-rubric_types = ['environmentalbarrier', 'instructionfollowing', 'selfcorrection', 'tooluse', 'verification']
-for rubric_type in rubric_types:
-    print(f"\nProcessing {rubric_type}...")
-    try:
-        rubric_file = f'rubrics/rubrics_matrix_{rubric_type}.csv'
-        rubric_df = pd.read_csv(rubric_file)
-        rubric_df = rubric_df.set_index('test_taker_id')
-        output_file = f'result/rubrics_{rubric_type}_visualization.pdf'
-        visualize_response_matrix_clustered(rubric_df, filename=output_file)
-    except Exception as e:
-        print(f"  Error processing {rubric_type}: {e}")
-print("\n" + "="*60)
-print("✓ ALL VISUALIZATIONS COMPLETED")
-print("="*60)
\ No newline at end of file
+def main():
+    # 1. Load the Normalized Data
+    # Ensure this file exists from the previous step
+    input_file = 'result/result_matrix_merged.csv'
+    df = pd.read_csv(input_file)
+    df = df.set_index('test_taker_id')
+    bits = BitResponseMatrix.from_dataframe(df)
+    save_accuracy_statistics(bits)
+
+    # Visualize the result matrix
+    print("\n" + "="*60)
+    print("VISUALIZING RESULT MATRIX")
+    print("="*60)
+
+    # --- Compute fixed row/col order from result matrix ---
+    row_order, col_order, col_display = compute_fixed_order(df, bits)
+
+    # Save result matrix visualization
+    visualize_response_matrix_clustered(df, filename='result/response_matrix_visualization.pdf',
+                                        row_order=row_order, col_order=col_order, col_display=col_display)
+
+    # Visualize all rubric matrices with fixed order
+    print("\n" + "="*60)
+    print("VISUALIZING RUBRIC MATRICES")
+    print("="*60)
+    for rubric_type in rubric_types:
+        print(f"\nProcessing {rubric_type}...")
+        try:
+            rubric_file = f'rubrics/rubrics_matrix_{rubric_type}.csv'
+            rubric_df = pd.read_csv(rubric_file)
+            rubric_df = rubric_df.set_index('test_taker_id')
+            output_file = f'result/rubrics_{rubric_type}_visualization.pdf'
+            visualize_response_matrix_clustered(rubric_df, filename=output_file,
+                                                row_order=row_order, col_order=col_order, col_display=col_display)
+        except Exception as e:
+            print(f"  Error processing {rubric_type}: {e}")
+    print("\n" + "="*60)
+    print("✓ ALL VISUALIZATIONS COMPLETED")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,9 @@ from matplotlib.colors import ListedColormap
 
 from util.rename_helper import clean_rubric_name
 
-def plot_matrix_single_rubric(df: pd.DataFrame, rubric_name: str):
+rubric_names = ["selfcorrection.label","tooluse.label","environmentalbarrier.label","verification.label","instructionfollowing.label", "binary_success_rate"]
+
+def plot_matrix_single_rubric(df: pd.DataFrame, rubric_name: str, output_dir: str = "plots/rubric"):
     """
     Plot a heatmap for a single rubric across different models and tasks.
     """
@@ -40,8 +42,9 @@ def plot_matrix_single_rubric(df: pd.DataFrame, rubric_name: str):
     plt.xlabel('Task ID')
     plt.ylabel('Models')
     plt.tight_layout()
-    plt.savefig(f"plots/rubric/{rubric_name}_matrix.png", dpi=300, bbox_inches='tight')
-    print(f"\nHeatmap saved to plots/rubric/{rubric_name}_matrix.png")
+    output_path = os.path.join(output_dir, f"{rubric_name}_matrix.png")
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    print(f"\nHeatmap saved to {output_path}")
     plt.close()
     return
 
@@ -59,7 +62,6 @@ def main():
 
     # plot all rubric matrices if flag is set
     if args.plot_matrix_by_rubric:
-        rubric_names = ["selfcorrection.label","tooluse.label","environmentalbarrier.label","verification.label","instructionfollowing.label", "binary_success_rate"]
         for rubric in rubric_names:
             plot_matrix_single_rubric(merged, rubric)
     
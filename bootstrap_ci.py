@@ -0,0 +1,129 @@
+"""
+Bootstrap confidence intervals for per-test-taker accuracy, rubric flag rates and
+the correlation.py coefficients.
+
+All statistics are computed from the same replicates: tasks (and optionally runs)
+are resampled once per replicate as a weight matrix, and every statistic is a
+matrix product against it (see util/bootstrap.py).
+
+Accuracy estimates differ between the two modes. By default they come from the
+merged matrix, where a task counts as solved if any run of the test taker
+solved it (merge.py takes the max). With --runs they are the mean over every
+run/task cell of the test taker in result_matrix.csv, and runs are resampled
+within (test taker, benchmark), so the interval also covers run-to-run
+variance. A test taker with a single run per benchmark gets no run variance.
+
+Usage:
+    python bootstrap_ci.py
+    python bootstrap_ci.py --replicates 10000 --runs result/result_matrix.csv \
+        --correlation_dataset hal-paper-analysis/qualitative/results/rubrics/all_benchmarks_merged.csv
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from util.bootstrap import (Bootstrap, accuracy_statistic, flag_rate_statistic,
+                            correlation_statistic, summarize)
+from util.rename_helper import rename_labels
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent / 'tools'))
+from canonical import canonical_test_takers
+
+rubric_types = ['environmentalbarrier', 'instructionfollowing', 'selfcorrection', 'tooluse', 'verification']
+correlation_label_columns = ['Self-Correction', 'Tool Use', 'Environmental Barrier', 'Verification', 'Instruction Following']
+
+
+def load_correlation_table(path: str) -> tuple[pd.DataFrame, pd.Series]:
+    '''
+    Same preprocessing as correlation.py. Returns the numeric table and the
+    benchmark.task of each row.
+    '''
+    df = rename_labels(pd.read_csv(path))
+    for col in correlation_label_columns:
+        df[col] = (df[col] == 'match').astype(int)
+    columns = list(correlation_label_columns)
+    if 'Binary Success Rate' in df.columns:
+        df['Binary Success Rate'] = df['Binary Success Rate'].astype(float)
+        columns.append('Binary Success Rate')
+    return df[columns], df['benchmark_id'] + '.' + df['task_id'].astype(str)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bootstrap confidence intervals over tasks (and runs)')
+    parser.add_argument('--matrix', type=str, default='result/result_matrix_merged.csv', help='Merged result matrix (default: result/result_matrix_merged.csv)')
+    parser.add_argument('--runs', type=str, default=None, help='result_matrix.csv; if given, accuracy is pooled over runs and runs are resampled within each (test taker, benchmark)')
+    parser.add_argument('--rubrics_dir', type=str, default='rubrics', help='Directory with rubrics_matrix_<rubric>.csv (default: rubrics)')
+    parser.add_argument('--correlation_dataset', type=str, default=None, help='all_benchmarks_merged.csv used by correlation.py')
+    parser.add_argument('--replicates', type=int, default=10000, help='Number of bootstrap replicates (default: 10000)')
+    parser.add_argument('--confidence', type=float, default=0.95, help='Confidence level (default: 0.95)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--jobs', type=int, default=None, help='Worker threads (default: CPU count)')
+    parser.add_argument('--output', type=str, default='./result', help='Output directory (default: ./result)')
+    args = parser.parse_args()
+
+    merged = pd.read_csv(args.matrix).set_index('test_taker_id')
+    merged = merged.select_dtypes(include=[np.number])
+    tasks = list(merged.columns)
+
+    correlation_table = None
+    if args.correlation_dataset:
+        correlation_table, row_task_names = load_correlation_table(args.correlation_dataset)
+        tasks += sorted(set(row_task_names) - set(tasks))
+    task_position = {task: i for i, task in enumerate(tasks)}
+
+    boot = Bootstrap(len(tasks), n_replicates=args.replicates, seed=args.seed, n_jobs=args.jobs)
+    os.makedirs(args.output, exist_ok=True)
+    start = time.time()
+
+    # Per-test-taker accuracy
+    if args.runs:
+        runs = pd.read_csv(args.runs)
+        run_groups = np.array(canonical_test_takers(runs['agent_name'], runs['model_name']))
+        # Rows are one per (agent, model, benchmark); only repeats on the same benchmark are interchangeable
+        run_strata = pd.Series(run_groups).str.cat(runs['benchmark_name'].astype(str).values, sep='\x1f').to_numpy()
+        values = runs.reindex(columns=tasks).to_numpy(dtype=float, na_value=np.nan)
+        labels, estimate, statistic = accuracy_statistic(values, run_groups, run_strata)
+    else:
+        values = merged.reindex(columns=tasks).to_numpy(dtype=float, na_value=np.nan)
+        labels, estimate, statistic = accuracy_statistic(values)
+        labels = merged.index
+    accuracy = summarize(labels, estimate, boot.map(statistic), args.confidence, label_name='test_taker_id')
+    accuracy.to_csv(os.path.join(args.output, 'bootstrap_accuracy.csv'), index=False)
+    print(f"Accuracy intervals for {len(accuracy)} test takers")
+
+    # Rubric flag rates
+    rubric_matrices = {}
+    for rubric_type in rubric_types:
+        rubric_file = os.path.join(args.rubrics_dir, f'rubrics_matrix_{rubric_type}.csv')
+        if os.path.isfile(rubric_file):
+            rubric_df = pd.read_csv(rubric_file).set_index('test_taker_id')
+            rubric_matrices[rubric_type] = rubric_df.reindex(columns=tasks).to_numpy(dtype=float, na_value=np.nan)
+    if rubric_matrices:
+        labels, estimate, statistic = flag_rate_statistic(rubric_matrices)
+        rates = summarize(labels, estimate, boot.map(statistic), args.confidence, label_name='rubric')
+        rates.to_csv(os.path.join(args.output, 'bootstrap_rubric_rates.csv'), index=False)
+        print(f"Flag rate intervals for {len(rates)} rubrics")
+
+    # correlation.py coefficients
+    if correlation_table is not None:
+        row_tasks = row_task_names.map(task_position).values
+        pairs, estimate, statistic = correlation_statistic(correlation_table.to_numpy(dtype=float), row_tasks)
+        names = [(correlation_table.columns[i], correlation_table.columns[j]) for i, j in pairs]
+        correlations = summarize(names, estimate, boot.map(statistic), args.confidence, label_name='pair')
+        pair_columns = pd.DataFrame(correlations.pop('pair').tolist(), columns=['variable_1', 'variable_2'])
+        correlations = pd.concat([pair_columns, correlations], axis=1)
+        correlations.to_csv(os.path.join(args.output, 'bootstrap_correlation.csv'), index=False)
+        print(f"Correlation intervals for {len(correlations)} pairs")
+
+    print(f"{args.replicates} replicates in {time.time() - start:.2f}s, saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
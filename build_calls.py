@@ -0,0 +1,135 @@
+"""
+Build output/calls/, a Parquet table with one row per logged LLM call.
+
+Each trace is scanned in a worker process: logging entries are located by byte
+range (util.trace_io.iter_logging_spans) and decoded one at a time, and the
+trace's calls are written to output/calls/<trace>.parquet. Scalar fields (ids,
+timestamps, model, token counts) get their own columns; inputs, output and
+summary are kept as JSON text, so queries that do not select them never read
+them. The files are exposed as the calls view of `python -m halcollect sql`.
+
+output/calls/manifest.csv records the size and mtime of every scanned trace;
+traces that did not change since the last build are not rescanned, and the
+files of traces that no longer exist are removed.
+
+Usage:
+    python build_calls.py traces
+    python build_calls.py traces --workers 8 --full
+"""
+
+import os
+import json
+import time
+import argparse
+from functools import partial
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths, clean_model_name
+from util.trace_io import read_trace_header, iter_logging_spans, entry_task_id
+from util.trace_table import TRACE_KEY_COLUMNS, trace_stat, read_previous, update_trace_table
+from util.costs import entry_usage
+
+CALL_COLUMNS = ['run_id', 'benchmark_name', 'agent_name', 'model_name', 'task_id', 'call_id', 'op_name',
+                'model', 'started_at', 'ended_at', 'prompt_tokens', 'completion_tokens', 'cached_tokens',
+                'inputs', 'output', 'summary', 'byte_start', 'byte_end', 'trace_file']
+CALL_TYPES = {'prompt_tokens': 'int64', 'completion_tokens': 'int64', 'cached_tokens': 'int64',
+              'byte_start': 'int64', 'byte_end': 'int64'}
+COLUMNS = ['n_calls'] + TRACE_KEY_COLUMNS
+
+
+def _json(value):
+    return None if value is None else json.dumps(value)
+
+
+def scan_calls(path: str, output_dir: str) -> list[dict]:
+    '''
+    Writes the call rows of one trace to output_dir/<trace>.parquet and
+    returns its manifest row.
+    '''
+    stat = trace_stat(path)
+    header = read_trace_header(path)
+    config = header.get('config', {}) or {}
+    run = {
+        'run_id': config.get('run_id', ''),
+        'benchmark_name': config.get('benchmark_name', ''),
+        'agent_name': config.get('agent_name', ''),
+        'model_name': clean_model_name((config.get('agent_args', {}) or {}).get('model_name', '')),
+    }
+
+    rows = []
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            entry = json.loads(f.read(end - start))
+            usage = entry_usage(entry)
+            rows.append({
+                **run,
+                'task_id': entry_task_id(entry),
+                'call_id': entry.get('id'),
+                'op_name': entry.get('op_name'),
+                'model': ','.join(u['model'] for u in usage) or None,
+                'started_at': entry.get('started_at'),
+                'ended_at': entry.get('ended_at'),
+                'prompt_tokens': sum(u['prompt_tokens'] for u in usage),
+                'completion_tokens': sum(u['completion_tokens'] for u in usage),
+                'cached_tokens': sum(u['cached_tokens'] for u in usage),
+                'inputs': _json(entry.get('inputs')),
+                'output': _json(entry.get('output')),
+                'summary': _json(entry.get('summary')),
+                'byte_start': start,
+                'byte_end': end,
+                'trace_file': stat['trace_file'],
+            })
+
+    parquet_path = os.path.join(output_dir, Path(path).stem + '.parquet')
+    if rows:
+        df = pd.DataFrame(rows, columns=CALL_COLUMNS).astype(CALL_TYPES)
+        tmp_path = parquet_path + '.tmp'
+        con = duckdb.connect()
+        con.register('calls', df)
+        con.execute(f"COPY calls TO '{tmp_path}' (FORMAT PARQUET)")
+        con.close()
+        os.replace(tmp_path, parquet_path)
+    elif os.path.exists(parquet_path):
+        os.remove(parquet_path)
+    return [{'n_calls': len(rows), **stat}]
+
+
+def build_calls(traces_dir: str, output_dir: str, workers=None, full=False) -> pd.DataFrame:
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(traces_dir)))
+    calls_dir = os.path.join(output_dir, 'calls')
+    manifest_path = os.path.join(calls_dir, 'manifest.csv')
+    os.makedirs(calls_dir, exist_ok=True)
+    previous = pd.DataFrame(columns=COLUMNS) if full else read_previous(manifest_path, COLUMNS)
+    scan = partial(scan_calls, output_dir=calls_dir)
+    df = update_trace_table(paths, scan, previous, COLUMNS, workers=workers, desc="Writing calls")
+    df = df.sort_values('trace_file', kind='stable').reset_index(drop=True)
+
+    # Files of traces that were removed (or failed to scan) would otherwise stay in the view
+    current = {Path(name).stem + '.parquet' for name in df.loc[df['n_calls'] > 0, 'trace_file']}
+    for name in os.listdir(calls_dir):
+        if name.endswith('.parquet') and name not in current:
+            os.remove(os.path.join(calls_dir, name))
+    df.to_csv(manifest_path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-call Parquet table from trace files')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='./output', help='Directory for calls/ (default: ./output)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--full', action='store_true', help='Rescan every trace instead of reusing unchanged ones')
+    args = parser.parse_args()
+
+    start = time.time()
+    df = build_calls(args.directory, args.output, workers=args.workers, full=args.full)
+    print(f"{int(df['n_calls'].sum())} calls from {len(df)} traces in {time.time() - start:.2f}s, "
+          f"saved to {os.path.join(args.output, 'calls')}")
+
+
+if __name__ == "__main__":
+    main()
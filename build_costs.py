@@ -0,0 +1,147 @@
+"""
+Per-task token usage and cost, from the raw_logging_results of every trace.
+
+Each trace is scanned in a worker process: logging entries are located by byte
+range (util.trace_io.iter_logging_spans) and decoded one at a time, and their
+usage (util.costs.entry_usage) is summed per (run, weave_task_id). A task's
+cost is, in order of preference:
+
+    weave       sum of the costs weave recorded on the entries
+    prices      computed from --prices (USD per million tokens, see util/costs.py)
+    allocated   the run's results.total_cost split by the task's share of tokens
+
+Rows of traces whose size and mtime did not change since the last build are
+reused (rerun with --full after changing --prices). Writes:
+
+    output/task_costs.csv   one row per (run, task): calls, tokens, cost, cost_source
+    result/cost_matrix.csv  laid out like result/result_matrix.csv, one cost per cell
+
+Usage:
+    python build_costs.py traces
+    python build_costs.py traces --prices prices.json --value total_tokens --workers 8
+"""
+
+import os
+import json
+import time
+import argparse
+from functools import partial
+
+import pandas as pd
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths, clean_model_name
+from util.trace_io import read_trace_header, iter_logging_spans, entry_task_id
+from util.trace_table import TRACE_KEY_COLUMNS, trace_stat, read_previous, update_trace_table, task_matrix
+from util.costs import entry_usage, load_prices, price_cost
+
+COLUMNS = ['benchmark_name', 'agent_name', 'model_name', 'run_id', 'task_id', 'n_calls',
+           'prompt_tokens', 'completion_tokens', 'cached_tokens', 'total_tokens', 'cost', 'cost_source'] + TRACE_KEY_COLUMNS
+VALUES = ['cost', 'total_tokens', 'prompt_tokens', 'completion_tokens', 'cached_tokens', 'n_calls']
+
+
+def scan_costs(path: str, prices: dict = None) -> list[dict]:
+    '''
+    Per-task usage rows of one trace.
+    '''
+    prices = prices or {}
+    stat = trace_stat(path)
+    header = read_trace_header(path)
+    config = header.get('config', {}) or {}
+    results = header.get('results', {}) or {}
+
+    tasks = {}
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            entry = json.loads(f.read(end - start))
+            task_id = entry_task_id(entry)
+            if task_id is None:
+                continue
+            task = tasks.setdefault(task_id, {'n_calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0,
+                                              'cached_tokens': 0, 'weave_cost': 0.0, 'price_cost': 0.0,
+                                              'weave_missing': False, 'price_missing': False})
+            task['n_calls'] += 1
+            for usage in entry_usage(entry):
+                task['prompt_tokens'] += usage['prompt_tokens']
+                task['completion_tokens'] += usage['completion_tokens']
+                task['cached_tokens'] += usage['cached_tokens']
+                if usage['cost'] is None:
+                    task['weave_missing'] = True
+                else:
+                    task['weave_cost'] += usage['cost']
+                cost = price_cost(prices, usage['model'], usage['prompt_tokens'], usage['completion_tokens'],
+                                  usage['cached_tokens'], usage['cache_write_tokens'])
+                if cost is None:
+                    task['price_missing'] = True
+                else:
+                    task['price_cost'] += cost
+
+    run_tokens = sum(t['prompt_tokens'] + t['completion_tokens'] for t in tasks.values())
+    total_cost = results.get('total_cost')
+    rows = []
+    for task_id, task in sorted(tasks.items()):
+        tokens = task['prompt_tokens'] + task['completion_tokens']
+        if tokens and not task['weave_missing']:
+            cost, source = task['weave_cost'], 'weave'
+        elif tokens and prices and not task['price_missing']:
+            cost, source = task['price_cost'], 'prices'
+        elif tokens and isinstance(total_cost, (int, float)) and run_tokens:
+            cost, source = total_cost * tokens / run_tokens, 'allocated'
+        else:
+            cost, source = None, None
+        rows.append({
+            'benchmark_name': config.get('benchmark_name', ''),
+            'agent_name': config.get('agent_name', ''),
+            'model_name': clean_model_name((config.get('agent_args', {}) or {}).get('model_name', '')),
+            'run_id': config.get('run_id', ''),
+            'task_id': task_id,
+            'n_calls': task['n_calls'],
+            'prompt_tokens': task['prompt_tokens'],
+            'completion_tokens': task['completion_tokens'],
+            'cached_tokens': task['cached_tokens'],
+            'total_tokens': tokens,
+            'cost': cost,
+            'cost_source': source,
+            **stat,
+        })
+    return rows
+
+
+def build_costs(traces_dir: str, output_dir: str, workers=None, full=False, prices_path=None) -> pd.DataFrame:
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(traces_dir)))
+    csv_path = os.path.join(output_dir, 'task_costs.csv')
+    previous = pd.DataFrame(columns=COLUMNS) if full else read_previous(csv_path, COLUMNS, dtype={'task_id': str})
+    scan = partial(scan_costs, prices=load_prices(prices_path))
+    df = update_trace_table(paths, scan, previous, COLUMNS, workers=workers, desc="Summing usage")
+    df = df.sort_values(['trace_file', 'task_id'], kind='stable').reset_index(drop=True)
+
+    os.makedirs(output_dir, exist_ok=True)
+    df.to_csv(csv_path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-task token usage and cost from trace files')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='./output', help='Directory for task_costs.csv (default: ./output)')
+    parser.add_argument('--result_matrix', type=str, default='result/result_matrix.csv', help='Result matrix to align the cost matrix with')
+    parser.add_argument('--matrix_output', type=str, default='result/cost_matrix.csv')
+    parser.add_argument('--value', type=str, default='cost', choices=VALUES, help='Quantity in the matrix cells (default: cost)')
+    parser.add_argument('--prices', type=str, default=None, help='JSON price table (USD per million tokens) for entries without weave costs')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--full', action='store_true', help='Rescan every trace instead of reusing unchanged ones')
+    args = parser.parse_args()
+
+    start = time.time()
+    df = build_costs(args.directory, args.output, workers=args.workers, full=args.full, prices_path=args.prices)
+    sources = df['cost_source'].fillna('unknown').value_counts().to_dict()
+    print(f"{len(df)} tasks from {df['trace_file'].nunique()} traces in {time.time() - start:.2f}s, cost sources: {sources}")
+
+    matrix = task_matrix(df, args.value, result_matrix=args.result_matrix)
+    os.makedirs(os.path.dirname(args.matrix_output) or '.', exist_ok=True)
+    matrix.to_csv(args.matrix_output, index=False)
+    print(f"Saved {args.value} matrix ({len(matrix)} runs x {matrix.shape[1] - 3} tasks) to {args.matrix_output}")
+
+
+if __name__ == "__main__":
+    main()
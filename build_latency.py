@@ -0,0 +1,170 @@
+"""
+Per-task latency and timeline, from the started_at/ended_at of every logged LLM call.
+
+Each trace is scanned in a worker process. Entries are located by byte range
+(util.trace_io.iter_logging_spans) and only their task id and timestamps are
+peeked at; nothing else is decoded. The timestamps of a whole trace are then
+parsed in one vectorized batch, and the per-task metrics are computed with
+array operations:
+
+    wall_clock_s      first call start to last call end
+    llm_time_s        time with at least one call in flight (union of call intervals)
+    idle_time_s       wall_clock_s - llm_time_s (tool execution, agent code)
+    call_time_s       sum of call durations
+    mean_call_s, max_call_s
+    max_concurrency   most calls in flight at once
+    mean_concurrency  call_time_s / llm_time_s
+
+Rows of traces whose size and mtime did not change since the last build are
+reused. Writes:
+
+    output/task_latency.csv   one row per (run, task)
+    result/latency_matrix.csv laid out like result/result_matrix.csv (--value picks the metric)
+
+Usage:
+    python build_latency.py traces
+    python build_latency.py traces --value llm_time_s --workers 8
+"""
+
+import os
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths, clean_model_name
+from util.trace_io import read_trace_header, iter_logging_spans, peek_task_id, peek_timestamps
+from util.trace_table import TRACE_KEY_COLUMNS, trace_stat, read_previous, update_trace_table, task_matrix
+
+METRICS = ['wall_clock_s', 'llm_time_s', 'idle_time_s', 'call_time_s', 'mean_call_s', 'max_call_s',
+           'max_concurrency', 'mean_concurrency']
+COLUMNS = ['benchmark_name', 'agent_name', 'model_name', 'run_id', 'task_id', 'n_calls', 'n_timed',
+           'first_started_at', 'last_ended_at'] + METRICS + TRACE_KEY_COLUMNS
+
+
+def _seconds(values: list) -> np.ndarray:
+    '''
+    Epoch seconds of ISO 8601 timestamps (NaN when missing or unparsable),
+    parsed in one batch.
+    '''
+    parsed = pd.to_datetime(pd.Series(values, dtype=object), utc=True, format='ISO8601', errors='coerce')
+    seconds = parsed.to_numpy(dtype='datetime64[ns]').astype(np.int64) / 1e9
+    seconds[parsed.isna().to_numpy()] = np.nan
+    return seconds
+
+
+def task_timelines(task_ids: list, started: list, ended: list) -> pd.DataFrame:
+    '''
+    Per-task timeline metrics of a set of calls, one row per task id.
+    '''
+    calls = pd.DataFrame({'task_id': task_ids, 'start': _seconds(started), 'end': _seconds(ended)})
+    counts = calls.groupby('task_id', sort=True).size().rename('n_calls')
+    calls = calls.dropna(subset=['start'])
+    # A call without an end contributes its start only
+    calls['end'] = calls['end'].fillna(calls['start']).clip(lower=calls['start'])
+    calls = calls.sort_values(['task_id', 'start'], kind='stable').reset_index(drop=True)
+    calls['duration'] = calls['end'] - calls['start']
+    by_task = calls.groupby('task_id', sort=False)
+
+    metrics = by_task.agg(n_timed=('start', 'size'), first_start=('start', 'min'), last_end=('end', 'max'),
+                          call_time_s=('duration', 'sum'), mean_call_s=('duration', 'mean'),
+                          max_call_s=('duration', 'max'))
+
+    # Union of call intervals: a call opens a new busy block unless it starts
+    # before every earlier call of its task has ended
+    reach = by_task['end'].cummax().groupby(calls['task_id'], sort=False).shift()
+    block = (reach.isna() | (calls['start'] > reach)).cumsum()
+    blocks = calls.groupby(block).agg(task_id=('task_id', 'first'), start=('start', 'min'), end=('end', 'max'))
+    metrics['llm_time_s'] = (blocks['end'] - blocks['start']).groupby(blocks['task_id']).sum()
+
+    # Calls in flight: +1 at each start, -1 at each end (ends first on ties),
+    # running sum in (task, time) order; every task's sum returns to zero
+    n = len(calls)
+    event_task = np.concatenate([calls['task_id'].to_numpy(), calls['task_id'].to_numpy()])
+    event_time = np.concatenate([calls['start'].to_numpy(), calls['end'].to_numpy()])
+    event_delta = np.concatenate([np.ones(n, dtype=np.int64), -np.ones(n, dtype=np.int64)])
+    order = np.lexsort((event_delta, event_time, event_task))
+    in_flight = np.cumsum(event_delta[order])
+    metrics['max_concurrency'] = pd.Series(in_flight).groupby(event_task[order]).max()
+
+    metrics['wall_clock_s'] = metrics['last_end'] - metrics['first_start']
+    metrics['idle_time_s'] = metrics['wall_clock_s'] - metrics['llm_time_s']
+    metrics['mean_concurrency'] = metrics['call_time_s'] / metrics['llm_time_s'].replace(0, np.nan)
+    metrics = metrics.reindex(counts.index)
+    metrics[METRICS] = metrics[METRICS].round(6)
+    metrics['n_calls'] = counts
+    metrics['n_timed'] = metrics['n_timed'].fillna(0).astype(int)
+    for column, seconds in (('first_started_at', 'first_start'), ('last_ended_at', 'last_end')):
+        metrics[column] = pd.to_datetime(metrics[seconds], unit='s', utc=True).dt.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    return metrics.reset_index()
+
+
+def scan_latency(path: str) -> list[dict]:
+    '''
+    Per-task timeline rows of one trace.
+    '''
+    stat = trace_stat(path)
+    header = read_trace_header(path)
+    config = header.get('config', {}) or {}
+
+    task_ids, started, ended = [], [], []
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            raw = f.read(end - start)
+            task_id = peek_task_id(raw)
+            if task_id is None:
+                continue
+            started_at, ended_at = peek_timestamps(raw)
+            task_ids.append(task_id)
+            started.append(started_at)
+            ended.append(ended_at)
+    if not task_ids:
+        return []
+
+    timelines = task_timelines(task_ids, started, ended)
+    timelines['benchmark_name'] = config.get('benchmark_name', '')
+    timelines['agent_name'] = config.get('agent_name', '')
+    timelines['model_name'] = clean_model_name((config.get('agent_args', {}) or {}).get('model_name', ''))
+    timelines['run_id'] = config.get('run_id', '')
+    for key, value in stat.items():
+        timelines[key] = value
+    return timelines[COLUMNS].to_dict('records')
+
+
+def build_latency(traces_dir: str, output_dir: str, workers=None, full=False) -> pd.DataFrame:
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(traces_dir)))
+    csv_path = os.path.join(output_dir, 'task_latency.csv')
+    previous = pd.DataFrame(columns=COLUMNS) if full else read_previous(csv_path, COLUMNS, dtype={'task_id': str})
+    df = update_trace_table(paths, scan_latency, previous, COLUMNS, workers=workers, desc="Reading timestamps")
+    df = df.sort_values(['trace_file', 'task_id'], kind='stable').reset_index(drop=True)
+
+    os.makedirs(output_dir, exist_ok=True)
+    df.to_csv(csv_path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-task latency and timeline from trace files')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='./output', help='Directory for task_latency.csv (default: ./output)')
+    parser.add_argument('--result_matrix', type=str, default='result/result_matrix.csv', help='Result matrix to align the latency matrix with')
+    parser.add_argument('--matrix_output', type=str, default='result/latency_matrix.csv')
+    parser.add_argument('--value', type=str, default='wall_clock_s', choices=METRICS + ['n_calls'], help='Metric in the matrix cells (default: wall_clock_s)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--full', action='store_true', help='Rescan every trace instead of reusing unchanged ones')
+    args = parser.parse_args()
+
+    start = time.time()
+    df = build_latency(args.directory, args.output, workers=args.workers, full=args.full)
+    print(f"{len(df)} tasks from {df['trace_file'].nunique()} traces in {time.time() - start:.2f}s, saved to {args.output}")
+
+    matrix = task_matrix(df, args.value, result_matrix=args.result_matrix)
+    os.makedirs(os.path.dirname(args.matrix_output) or '.', exist_ok=True)
+    matrix.to_csv(args.matrix_output, index=False)
+    print(f"Saved {args.value} matrix ({len(matrix)} runs x {matrix.shape[1] - 3} tasks) to {args.matrix_output}")
+
+
+if __name__ == "__main__":
+    main()
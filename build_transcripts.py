@@ -0,0 +1,158 @@
+"""
+Build output/transcripts.csv (agent_run_id -> benchmark_id, task_id, run_id, model)
+from the traces, one row per (run, task).
+
+Each trace is scanned in a worker process: the header gives the run metadata
+and the raw_logging_results entries are located by byte range
+(util.trace_io.iter_logging_spans); only their task id is peeked at, so
+memory stays flat for multi-GB traces. Every row records the number of logging entries of
+the task and the byte range they span, so a transcript can be re-read without
+rescanning the file.
+
+agent_run_id is the id Docent assigned to the (run, task) transcript, which
+is what the rubric CSVs refer to. Docent ids are read from output/docent_ids.csv
+(agent_run_id, run_id, task_id); the first build over a transcripts.csv
+exported from Docent copies its ids there before replacing it. Transcripts
+never uploaded get a uuid5 of (run_id, task_id) instead; id_source tells
+them apart.
+
+Rows of traces whose size and mtime did not change since the last build are
+reused, so only new or modified traces are scanned. The table is written as
+CSV (read by match_rubrics.py) and as Parquet.
+
+Usage:
+    python build_transcripts.py traces
+    python build_transcripts.py traces --workers 8 --full
+"""
+
+import os
+import time
+import argparse
+
+import duckdb
+import pandas as pd
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths, clean_model_name
+from util.trace_io import read_trace_header, iter_logging_spans, peek_task_id, agent_run_id
+from util.trace_table import update_trace_table
+
+COLUMNS = ['agent_run_id', 'benchmark_id', 'task_id', 'run_id', 'model', 'agent_name', 'success',
+           'n_entries', 'byte_start', 'byte_end', 'trace_file', 'trace_size', 'trace_mtime_ns']
+DOCENT_ID_COLUMNS = ['agent_run_id', 'run_id', 'task_id']
+
+
+def scan_trace(path: str) -> list[dict]:
+    '''
+    Transcript rows of one trace.
+    '''
+    stat = os.stat(path)
+    header = read_trace_header(path)
+    config = header.get('config', {}) or {}
+    results = header.get('results', {}) or {}
+    run_id = config.get('run_id', '')
+    successful = {str(task) for task in results.get('successful_tasks', []) or []}
+    failed = {str(task) for task in results.get('failed_tasks', []) or []}
+
+    tasks = {}
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            task_id = peek_task_id(f.read(end - start))
+            if task_id is None:
+                continue
+            span = tasks.setdefault(task_id, [0, start, end])
+            span[0] += 1
+            span[2] = end
+
+    rows = []
+    for task_id in sorted(set(tasks) | successful | failed):
+        n_entries, byte_start, byte_end = tasks.get(task_id, (0, None, None))
+        rows.append({
+            'agent_run_id': agent_run_id(run_id, task_id),
+            'benchmark_id': config.get('benchmark_name', ''),
+            'task_id': task_id,
+            'run_id': run_id,
+            'model': clean_model_name((config.get('agent_args', {}) or {}).get('model_name', '')),
+            'agent_name': config.get('agent_name', ''),
+            'success': 1 if task_id in successful else (0 if task_id in failed else None),
+            'n_entries': n_entries,
+            'byte_start': byte_start,
+            'byte_end': byte_end,
+            'trace_file': os.path.basename(path),
+            'trace_size': stat.st_size,
+            'trace_mtime_ns': stat.st_mtime_ns,
+        })
+    return rows
+
+
+def load_previous(output_dir: str) -> pd.DataFrame:
+    parquet_path = os.path.join(output_dir, 'transcripts.parquet')
+    csv_path = os.path.join(output_dir, 'transcripts.csv')
+    if os.path.isfile(parquet_path):
+        return duckdb.read_parquet(parquet_path).df()
+    if os.path.isfile(csv_path):
+        previous = pd.read_csv(csv_path, dtype={'task_id': str})
+        if set(COLUMNS) <= set(previous.columns):
+            return previous
+    return pd.DataFrame(columns=COLUMNS)
+
+
+def load_docent_ids(output_dir: str) -> pd.DataFrame:
+    '''
+    Docent agent_run_ids by (run_id, task_id). A transcripts.csv that was not
+    written by this script (a Docent export) is saved to docent_ids.csv first,
+    so its ids survive the rebuild.
+    '''
+    ids_path = os.path.join(output_dir, 'docent_ids.csv')
+    csv_path = os.path.join(output_dir, 'transcripts.csv')
+    if not os.path.isfile(ids_path) and os.path.isfile(csv_path):
+        exported = pd.read_csv(csv_path, dtype={'task_id': str, 'run_id': str})
+        if 'id_source' not in exported.columns and set(DOCENT_ID_COLUMNS) <= set(exported.columns):
+            os.makedirs(output_dir, exist_ok=True)
+            exported[DOCENT_ID_COLUMNS].drop_duplicates().to_csv(ids_path, index=False)
+            print(f"Saved {len(exported)} Docent ids from {csv_path} to {ids_path}")
+    if not os.path.isfile(ids_path):
+        return pd.DataFrame(columns=DOCENT_ID_COLUMNS)
+    ids = pd.read_csv(ids_path, dtype=str)[DOCENT_ID_COLUMNS]
+    return ids.drop_duplicates(['run_id', 'task_id'], keep='last')
+
+
+def build_transcripts(traces_dir: str, output_dir: str, workers=None, full=False) -> pd.DataFrame:
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(traces_dir)))
+    docent_ids = load_docent_ids(output_dir)
+    previous = pd.DataFrame(columns=COLUMNS) if full else load_previous(output_dir)
+
+    df = update_trace_table(paths, scan_trace, previous[COLUMNS], COLUMNS, workers=workers)
+    df = df.sort_values(['trace_file', 'task_id'], kind='stable').reset_index(drop=True)
+
+    # Docent's ids where the transcript was uploaded, synthesized ones otherwise
+    docent = df[['run_id', 'task_id']].astype(str).merge(docent_ids, on=['run_id', 'task_id'], how='left')['agent_run_id']
+    df['id_source'] = docent.notna().map({True: 'docent', False: 'synthesized'}).values
+    df['agent_run_id'] = docent.fillna(df['agent_run_id']).values
+    print(f"{(df['id_source'] == 'docent').sum()} of {len(df)} transcripts have Docent ids")
+    df = df.astype({'n_entries': 'Int64', 'byte_start': 'Int64', 'byte_end': 'Int64', 'success': 'Int64'})
+
+    os.makedirs(output_dir, exist_ok=True)
+    df.to_csv(os.path.join(output_dir, 'transcripts.csv'), index=False)
+    con = duckdb.connect()
+    con.register('transcripts', df)
+    con.execute(f"COPY transcripts TO '{os.path.join(output_dir, 'transcripts.parquet')}' (FORMAT PARQUET)")
+    con.close()
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build output/transcripts.csv from trace files')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='./output', help='Output directory (default: ./output)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--full', action='store_true', help='Rescan every trace instead of reusing unchanged ones')
+    args = parser.parse_args()
+
+    start = time.time()
+    df = build_transcripts(args.directory, args.output, workers=args.workers, full=args.full)
+    print(f"{len(df)} transcripts from {df['trace_file'].nunique()} traces in {time.time() - start:.2f}s, saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 import pandas as pd
-import json
 import os
 from tqdm import tqdm
 import os
@@ -8,6 +7,10 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 from matplotlib.colors import ListedColormap
 
+from util.dedup import unique_paths
+from util.prefetch import prefetch, DEFAULT_DEPTH, DEFAULT_MAX_BYTES
+from util.trace_io import loads_trace, add_json_backend_argument
+
 def trace_paths_from_dir(dir: str, benchmark_filter: str = None) -> list[str]:
     '''
     Returns a list of JSON files in a directory.
@@ -21,6 +24,16 @@ def trace_paths_from_dir(dir: str, benchmark_filter: str = None) -> list[str]:
                 trace_files.append(os.path.join(dir, file))
     return trace_files
 
+def dedupe_trace_paths(trace_files: list[str]) -> list[str]:
+    '''
+    Drops byte-identical copies of the same trace (re-uploads, copies under
+    another name) before any of them is parsed.
+    '''
+    trace_files, duplicates = unique_paths(trace_files)
+    for duplicate, kept in sorted(duplicates.items()):
+        print(f"Skipping {os.path.basename(duplicate)}: identical to {os.path.basename(kept)}")
+    return trace_files
+
 def clean_model_name(name: str) -> str:
     '''
     Cleans the model name by removing unwanted characters.
@@ -31,24 +44,27 @@ def clean_model_name(name: str) -> str:
     name = name.split("/")[-1]
     return name
 
-def trace_config_summary(dir: str, output_dir: str, benchmark_filter: str = None) -> pd.DataFrame:
+def trace_config_summary(dir: str, output_dir: str, benchmark_filter: str = None,
+                         prefetch_depth: int = DEFAULT_DEPTH, prefetch_bytes: int = DEFAULT_MAX_BYTES,
+                         json_backend: str = None) -> pd.DataFrame:
     '''
     Compiles all the configs from each trace into a single DataFrame.
     '''
     configs = []
-    json_files = trace_paths_from_dir(dir, benchmark_filter)
-    for file_name in tqdm(json_files, desc="Processing files"):
+    json_files = dedupe_trace_paths(trace_paths_from_dir(dir, benchmark_filter))
+    # The next files are read while the current one is parsed
+    traces = prefetch(json_files, depth=prefetch_depth, max_bytes=prefetch_bytes)
+    for file_name, raw in tqdm(traces, total=len(json_files), desc="Processing files"):
         tqdm.write(f"Processing: {os.path.basename(file_name)}")
-        with open(file_name, "r") as f:
-            data = json.load(f)
-            model_name = data['config']['agent_args'].get('model_name', '')
-            successful_tasks = data['results'].get('successful_tasks', [])
-            failed_tasks = data['results'].get('failed_tasks', [])
-            data['config']['model_name'] = clean_model_name(model_name)
-            data['config']['successful_tasks'] = len(successful_tasks)
-            data['config']['failed_tasks'] = len(failed_tasks)
-            data['config']['total_tasks'] = len(successful_tasks) + len(failed_tasks)
-            configs.append(data['config'])
+        data = loads_trace(raw, json_backend)
+        model_name = data['config']['agent_args'].get('model_name', '')
+        successful_tasks = data['results'].get('successful_tasks', [])
+        failed_tasks = data['results'].get('failed_tasks', [])
+        data['config']['model_name'] = clean_model_name(model_name)
+        data['config']['successful_tasks'] = len(successful_tasks)
+        data['config']['failed_tasks'] = len(failed_tasks)
+        data['config']['total_tasks'] = len(successful_tasks) + len(failed_tasks)
+        configs.append(data['config'])
 
     df = pd.DataFrame(configs)
     df = df[['run_id', 'benchmark_name', 'agent_name' , 'model_name', 'successful_tasks', 'failed_tasks', 'total_tasks']]
@@ -58,44 +74,46 @@ def trace_config_summary(dir: str, output_dir: str, benchmark_filter: str = None
     df.to_csv(os.path.join(output_dir, "trace_summary.csv"), index=False)
     return df
 
-def build_matrix(dir: str, output_dir: str, benchmark_filter: str = None):
-    json_files = trace_paths_from_dir(dir, benchmark_filter)
+def build_matrix(dir: str, output_dir: str, benchmark_filter: str = None,
+                 prefetch_depth: int = DEFAULT_DEPTH, prefetch_bytes: int = DEFAULT_MAX_BYTES, json_backend: str = None):
+    json_files = dedupe_trace_paths(trace_paths_from_dir(dir, benchmark_filter))
     rows = []  # Collect all rows
     
-    for file_name in tqdm(json_files, desc="Processing files"):
-        with open(file_name, "r") as f:
-            data = json.load(f)
-            # Update progress bar with current filename
-            tqdm.write(f"Processing: {os.path.basename(file_name)}")
-            
-            benchmark_name = data["config"]["benchmark_name"]
-            raw_model_name = data["config"]["agent_args"].get("model_name", "")
-
-            # Start with base row data
-            row = {
-                "benchmark_name": benchmark_name,
-                "agent_name": data["config"]["agent_name"],
-                "model_name": clean_model_name(raw_model_name),
-            }
-
-            # Handle scienceagentbench differently - use raw_eval_results.eval_result
-            if benchmark_name == "scienceagentbench":
-                eval_results = data.get("raw_eval_results", {}).get("eval_result", {})
-                for task_id, task_data in eval_results.items():
-                    clean_task_name = f"{benchmark_name}.{task_id}"
-                    # Use success_rate as binary success (1 if success_rate > 0, else 0)
-                    success_rate = task_data.get("success_rate", 0)
-                    row[clean_task_name] = 1 if success_rate > 0 else 0
-            else:
-                # For other benchmarks, use the original logic
-                successful = data.get("results", {}).get("successful_tasks", [])
-                failed = data.get("results", {}).get("failed_tasks", [])
-                all_tasks = successful + failed
-
-                for task in all_tasks:
-                    clean_task_name = f"{benchmark_name}.{task}"
-                    row[clean_task_name] = 1 if task in successful else 0
-            rows.append(row)
+    # The next files are read while the current one is parsed
+    traces = prefetch(json_files, depth=prefetch_depth, max_bytes=prefetch_bytes)
+    for file_name, raw in tqdm(traces, total=len(json_files), desc="Processing files"):
+        data = loads_trace(raw, json_backend)
+        # Update progress bar with current filename
+        tqdm.write(f"Processing: {os.path.basename(file_name)}")
+
+        benchmark_name = data["config"]["benchmark_name"]
+        raw_model_name = data["config"]["agent_args"].get("model_name", "")
+
+        # Start with base row data
+        row = {
+            "benchmark_name": benchmark_name,
+            "agent_name": data["config"]["agent_name"],
+            "model_name": clean_model_name(raw_model_name),
+        }
+
+        # Handle scienceagentbench differently - use raw_eval_results.eval_result
+        if benchmark_name == "scienceagentbench":
+            eval_results = data.get("raw_eval_results", {}).get("eval_result", {})
+            for task_id, task_data in eval_results.items():
+                clean_task_name = f"{benchmark_name}.{task_id}"
+                # Use success_rate as binary success (1 if success_rate > 0, else 0)
+                success_rate = task_data.get("success_rate", 0)
+                row[clean_task_name] = 1 if success_rate > 0 else 0
+        else:
+            # For other benchmarks, use the original logic
+            successful = data.get("results", {}).get("successful_tasks", [])
+            failed = data.get("results", {}).get("failed_tasks", [])
+            all_tasks = successful + failed
+
+            for task in all_tasks:
+                clean_task_name = f"{benchmark_name}.{task}"
+                row[clean_task_name] = 1 if task in successful else 0
+        rows.append(row)
     
     df_new = pd.DataFrame(rows)
     
@@ -130,7 +148,13 @@ def plot_matrix_single_benchmark(output_dir: str, benchmark_name: str):
         print(f"Error: {matrix_path} not found. Run --build_matrix first.")
         return
     df = pd.read_csv(matrix_path)
+    plot_benchmark_matrix(df, benchmark_name, output_dir)
+    return
 
+def plot_benchmark_matrix(df: pd.DataFrame, benchmark_name: str, output_dir: str):
+    '''
+    Plots the task matrix of one benchmark from an already loaded result_matrix.csv DataFrame.
+    '''
     # Filter for the specific benchmark
     df_benchmark = df[df['benchmark_name'] == benchmark_name]
     
@@ -179,6 +203,9 @@ def main():
     parser.add_argument('--build_matrix', action='store_true', help='Build task success/failure matrix')
     parser.add_argument('--plot_matrix', action='store_true', help='Plot matrix for a specific benchmark', default=None)
     parser.add_argument('--benchmark', type=str, help='Benchmark name for filtering/plotting (e.g., "scienceagentbench" to match scienceagentbench* files)')
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_DEPTH, help=f'Trace files read ahead while one is parsed, 0 to disable (default: {DEFAULT_DEPTH})')
+    parser.add_argument('--prefetch_mb', type=int, default=DEFAULT_MAX_BYTES >> 20, help=f'Cap on read-ahead buffers in MB (default: {DEFAULT_MAX_BYTES >> 20})')
+    add_json_backend_argument(parser)
     
     args = parser.parse_args()
     
@@ -193,11 +220,11 @@ def main():
     
     if args.summarize:
         print(f"Generating summary for: {args.directory}")
-        trace_config_summary(args.directory, args.output, args.benchmark)
+        trace_config_summary(args.directory, args.output, args.benchmark, args.prefetch, args.prefetch_mb << 20, args.json_backend)
     
     if args.build_matrix:
         print(f"Building task matrix for: {args.directory}")
-        build_matrix(args.directory, args.output, args.benchmark)
+        build_matrix(args.directory, args.output, args.benchmark, args.prefetch, args.prefetch_mb << 20, args.json_backend)
     
     if args.plot_matrix:
         if not args.benchmark:
@@ -2,6 +2,7 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from util.rename_helper import rename_labels
+from util.pairwise import pairwise_frame
 
 # load all benchmarks
 file = "hal-paper-analysis/qualitative/results/rubrics/rubrics_merged/all_benchmarks_merged.csv"
@@ -16,7 +17,7 @@ for col in label_columns:
 df["Binary Success Rate"] = df["Binary Success Rate"].astype(float)
 
 # Compute pairwise correlations
-correlation_matrix = df[label_columns + ["Binary Success Rate"]].corr()
+correlation_matrix = pairwise_frame(df[label_columns + ["Binary Success Rate"]], metric='pearson')
 print(correlation_matrix)
 
 plt.figure(figsize=(12, 8))
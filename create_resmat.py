@@ -3,19 +3,24 @@ import pickle
 import os
 from pathlib import Path
 
+from util.resmat_store import write_resmat
+from util.input_store import open_inputs
+
 # Read the merged results
 merged_df = pd.read_csv('hal-paper-analysis/qualitative/results/rubrics/all_benchmarks_merged.csv')
 
 # Read the inputs for text_input
-inputs_df = pickle.load(open('data/all_benchmarks_inputs.pkl', 'rb'))
-
 # Create a mapping from (task_id, benchmark_id) to text_input (taking the first occurrence)
 # Since the same task can have different text_inputs for different models, we pick one representative
-inputs_mapping = {}
-for _, row in inputs_df.iterrows():
-    key = (row['task_id'], row['benchmark_id'])
-    if key not in inputs_mapping:  # Take the first one
-        inputs_mapping[key] = row['task_input']
+if Path('data/all_benchmarks_inputs.inputs').is_dir():
+    inputs_mapping = open_inputs('data/all_benchmarks_inputs.inputs').mapping()
+else:
+    inputs_df = pickle.load(open('data/all_benchmarks_inputs.pkl', 'rb'))
+    inputs_mapping = {}
+    for _, row in inputs_df.iterrows():
+        key = (row['task_id'], row['benchmark_id'])
+        if key not in inputs_mapping:  # Take the first one
+            inputs_mapping[key] = row['task_input']
 
 # Normalize scaffold names (remove extra spaces, standardize)
 def normalize_scaffold(scaffold):
@@ -130,9 +135,8 @@ for col in columns_to_process:
     resmat = resmat.sort_index()
     resmat = resmat.reindex(sorted(resmat.columns), axis=1)
     
-    # Save to pickle
-    output_path = output_dir / f'resmat_{col}.pkl'
-    resmat.to_pickle(output_path)
+    # Save as a memory-mappable resmat (see util/resmat_store.py)
+    output_path = write_resmat(resmat, output_dir / f'resmat_{col}.resmat')
     print(f"Saved {output_path} with shape {resmat.shape}")
     print(f"  Rows: {len(resmat)}, Columns: {len(resmat.columns)}")
     print()
@@ -1,34 +1,56 @@
-import importlib
+"""
+Convert HAL traces into Docent agent runs and upload them.
+
+Traces are converted with DocentConverter from hal-paper-analysis (as in
+full_pipeline.py), one task at a time. Conversion and upload are streamed
+(util/docent_stream.py): memory stays constant regardless of how many traces
+are uploaded. Uploaded agent runs are checkpointed, so an interrupted upload
+resumes where it stopped. --converter simple uses a built-in converter that
+does not need hal-paper-analysis; its transcripts and ids differ from
+DocentConverter's.
+
+Usage:
+    python docent_upload.py traces
+    python docent_upload.py traces --collection_id <id> --concurrency 16
+    python docent_upload.py traces --server_url http://localhost:8765 --converter simple   # util/docent_stub.py
+"""
 import os
-from compile_traces import trace_paths_from_dir
-
-docent_module = importlib.import_module("hal-paper-analysis.qualitative.full_pipeline")
-
-
-# You can then access its contents:
-# my_module.some_function()
-# my_module.some_variable
-all_results = []
-
-
-# connect to collection
-collection_id = "36c05561-71f8-4677-9ca5-0c1a5da436aa"
-docent_uploader = docent_module.DocentUploader(api_key=os.getenv("DOCENT_API_KEY", "dk_CrDnMTOkAP43XyWL_PCJts8Wic0HXx7rn8ZDO07gP026W8FOOygBzz0NF5penxK"))
-
-# load traces
-trace_directories = trace_paths_from_dir("/traces")
-
-# convert traces
-docent_results, conversion_stats = docent_module.DocentConverter.convert_to_docent_messages(all_results)
-print(f"✅ Conversion complete!")
-print("📊 Conversion stats:")
-print(f"   Total messages: {conversion_stats['total_messages']}")
-print(f"   Successfully converted: {conversion_stats['successful']}")
-print(f"   Failed to convert: {conversion_stats['failed']}")
-if conversion_stats['total_messages'] > 0:
-    success_rate = conversion_stats['successful']/max(1, conversion_stats['total_messages'])*100
-    print(f"   Success rate: {success_rate:.1f}%")
-
-# upload results to docent
-print(f"\n📤 Uploading to docent collection '{collection_id}'...")
-collection_id, upload_stats = docent_module.upload_to_docent(docent_uploader, docent_results, collection_id, batch_by_model=True)
\ No newline at end of file
+import argparse
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths
+from util.docent_client import DEFAULT_SERVER_URL
+from util.docent_stream import CONVERTERS, convert_and_upload
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Convert traces to Docent agent runs and upload them')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--benchmark', type=str, default=None, help='Only upload traces whose file name starts with this')
+    parser.add_argument('--collection_id', type=str, default="36c05561-71f8-4677-9ca5-0c1a5da436aa")
+    parser.add_argument('--server_url', type=str, default=DEFAULT_SERVER_URL)
+    parser.add_argument('--batch_size', type=int, default=100, help='Agent runs per request (default: 100)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Maximum concurrent requests (default: 8)')
+    parser.add_argument('--queue_size', type=int, default=256, help='Converted runs buffered ahead of the upload (default: 256)')
+    parser.add_argument('--converter', type=str, default='docent', choices=CONVERTERS, help="docent: DocentConverter from hal-paper-analysis (default); simple: built-in, longest LLM call per task")
+    parser.add_argument('--checkpoint', type=str, default=None, help='Checkpoint file (default: output/docent_uploaded_<collection_id>.txt)')
+    args = parser.parse_args()
+
+    api_key = os.getenv("DOCENT_API_KEY", "dk_CrDnMTOkAP43XyWL_PCJts8Wic0HXx7rn8ZDO07gP026W8FOOygBzz0NF5penxK")
+    # Agent runs acknowledged by Docent are recorded here; reruns only upload the rest
+    checkpoint_path = args.checkpoint or f"output/docent_uploaded_{args.collection_id}.txt"
+
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(args.directory, args.benchmark)))
+    print(f"📤 Uploading {len(paths)} traces to docent collection '{args.collection_id}'...")
+    conversion_stats = {}
+    upload_stats = convert_and_upload(paths, api_key, args.collection_id, queue_size=args.queue_size,
+                                      converter=args.converter, conversion_stats=conversion_stats,
+                                      server_url=args.server_url, batch_size=args.batch_size,
+                                      max_concurrency=args.concurrency, checkpoint_path=checkpoint_path)
+    if conversion_stats:
+        print(f"   Converted {conversion_stats.get('successful', 0)}/{conversion_stats.get('total_messages', 0)} messages ({conversion_stats.get('failed', 0)} failed)")
+    print(f"   Uploaded: {upload_stats['uploaded']}, already uploaded: {upload_stats['skipped']}, failed: {upload_stats['failed']}")
+    print(f"   {upload_stats['runs_per_second']:.1f} runs/s over {upload_stats['seconds']:.1f}s ({upload_stats['retries']} retries)")
+
+
+if __name__ == "__main__":
+    main()
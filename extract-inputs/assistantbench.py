@@ -1,8 +1,11 @@
 import pandas as pd
-import json
+import sys
 import os
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from util.trace_io import load_trace  # backend from $HAL_JSON_BACKEND
+
 # TEST MODE: Set to a number to limit tasks for testing, or None to process all
 TEST_LIMIT = None  # Process all tasks
 
@@ -45,8 +48,7 @@ for trace_file in trace_files:
     print(f"Processing {trace_file.name} (size: {trace_file.stat().st_size / 1024 / 1024:.2f} MB, {len(tasks_to_find)} tasks remaining)")
     
     try:
-        with open(trace_file, 'r') as f:
-            data = json.load(f)
+        data = load_trace(trace_file)
         
         # Check if this file has raw_logging_results
         if 'raw_logging_results' in data:
@@ -1,7 +1,10 @@
 import pandas as pd
-import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from util.trace_io import load_trace  # backend from $HAL_JSON_BACKEND
+
 # Set to None to process all tasks, or set to a small number for testing
 TEST_LIMIT = None
 
@@ -34,8 +37,7 @@ for file_path, file_size in trace_files:
     print(f"Processing {file_path.name} ({file_size / (1024*1024):.1f} MB)...")
     
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        data = load_trace(file_path)
         
         # Check raw_logging_results for task data
         if 'raw_logging_results' in data:
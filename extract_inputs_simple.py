@@ -5,11 +5,21 @@ Since agent_run_id doesn't reliably map to trace_id across all benchmarks,
 we extract one instance per (benchmark, model, task_id) combination.
 """
 
-import json
 import pandas as pd
 from pathlib import Path
 from collections import defaultdict
+from itertools import chain
 import argparse
+from functools import partial
+
+from util.text import Interner
+from util.input_store import write_inputs
+from util.prefetch import prefetch, DEFAULT_DEPTH, DEFAULT_MAX_BYTES
+from util.trace_io import loads_trace, entry_task_id, add_json_backend_argument
+from util.trace_shards import shard_paths, load_shard, map_shards, is_current, shard_dir_name
+
+# Task inputs repeat across models and runs; keep one copy of each
+_INTERNER = Interner()
 
 
 def find_trace_files(benchmark_id: str, model: str, traces_dir: Path):
@@ -81,26 +91,16 @@ def extract_assistantbench_messages(messages_wrapper):
     return result
 
 
-def normalize_whitespace(text):
-    """Normalize excessive whitespace while preserving structure."""
-    import re
-    # Collapse multiple spaces to single space
-    text = re.sub(r' {2,}', ' ', text)
-    # Collapse multiple newlines to max 2 (preserve paragraph breaks)
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    # Remove spaces at line starts/ends
-    text = '\n'.join(line.strip() for line in text.split('\n'))
-    return text
-
-
-def extract_from_trace_file(trace_file: Path, needed_task_ids: set):
-    """Extract ONLY the first input from a trace file for specific task IDs."""
+def extract_from_trace_file(trace_file: Path, needed_task_ids: set, raw: bytes = None, json_backend: str = None):
+    """Extract ONLY the first input from a trace file for specific task IDs.
+    raw is the file content when it was already read (see util.prefetch)."""
     results = {}
-    is_assistantbench = 'assistantbench' in str(trace_file)
     
     try:
-        with open(trace_file) as f:
-            data = json.load(f)
+        if raw is None:
+            with open(trace_file, 'rb') as f:
+                raw = f.read()
+        data = loads_trace(raw, json_backend)
     except Exception as e:
         print(f"      Error loading {trace_file.name}: {e}")
         return results
@@ -108,104 +108,124 @@ def extract_from_trace_file(trace_file: Path, needed_task_ids: set):
     if 'raw_logging_results' not in data:
         return results
     
-    # Group entries by weave_task_id
+    # Group entries by weave_task_id (top level or under attributes, as shard_traces.py does)
     task_entries = defaultdict(list)
     for entry in data['raw_logging_results']:
-        task_id = entry.get('attributes', {}).get('weave_task_id')
-        if task_id and str(task_id) in needed_task_ids:
-            task_entries[str(task_id)].append(entry)
+        task_id = entry_task_id(entry)
+        if task_id and task_id in needed_task_ids:
+            task_entries[task_id].append(entry)
     
     # Extract ONLY the first input message for each task
     for task_id, entries in task_entries.items():
-        best_content = None
+        best_content = extract_task_input(entries, trace_file)
+        if best_content:
+            results[task_id] = best_content
+    
+    return results
+
+
+def extract_task_input(entries: list, trace_file: Path):
+    """First task input among the logging entries of one task (None when not found)."""
+    is_assistantbench = 'assistantbench' in str(trace_file)
+    best_content = None
+    
+    # For assistantbench: find LLM call with system prompt (not the short warmup call)
+    # For others: find entry with "Instruction:" (taubench) or first valid entry
+    sorted_entries = sorted(entries, key=lambda x: x.get('started_at', ''))
+    
+    for entry in sorted_entries[:10]:
+        inputs = entry.get('inputs', {})
+        if not isinstance(inputs, dict):
+            continue
         
-        # For assistantbench: find LLM call with system prompt (not the short warmup call)
-        # For others: find entry with "Instruction:" (taubench) or first valid entry
-        sorted_entries = sorted(entries, key=lambda x: x.get('started_at', ''))
+        messages = inputs.get('messages', [])
+        if not messages:
+            continue
         
-        for entry in sorted_entries[:10]:
-            inputs = entry.get('inputs', {})
-            if not isinstance(inputs, dict):
+        # Handle assistantbench's special format
+        if is_assistantbench:
+            parsed_messages = extract_assistantbench_messages(messages)
+            if not parsed_messages:
                 continue
             
-            messages = inputs.get('messages', [])
-            if not messages:
+            # Look for LLM call with system message (length > 1000)
+            has_substantial_system = any(
+                msg['role'] in ['system'] and len(msg['content']) > 1000
+                for msg in parsed_messages
+            )
+            
+            if not has_substantial_system:
+                continue
+            
+            # Extract system + first 2 human messages
+            all_parts = []
+            for msg in parsed_messages:
+                if msg['role'] == 'system':
+                    all_parts.append(msg['content'])
+                elif msg['role'] == 'human':
+                    all_parts.append(msg['content'])
+                    if len(all_parts) >= 3:  # system + 2 human messages
+                        break
+            
+            if all_parts:
+                best_content = _INTERNER.intern('\n\n---\n\n'.join(all_parts))
+                break
+        
+        # Handle other benchmarks
+        else:
+            if not isinstance(messages, list):
                 continue
             
-            # Handle assistantbench's special format
-            if is_assistantbench:
-                parsed_messages = extract_assistantbench_messages(messages)
-                if not parsed_messages:
+            # Extract ONLY the initial task description
+            all_parts = []
+            seen_user = False
+            
+            for msg in messages:
+                if not isinstance(msg, dict):
                     continue
                 
-                # Look for LLM call with system message (length > 1000)
-                has_substantial_system = any(
-                    msg['role'] in ['system'] and len(msg['content']) > 1000
-                    for msg in parsed_messages
-                )
+                role = msg.get('role')
                 
-                if not has_substantial_system:
-                    continue
+                # Take first system/developer message
+                if role in ['system', 'developer'] and not all_parts:
+                    content = extract_text_from_content(msg.get('content', ''))
+                    if content:
+                        all_parts.append(content)
                 
-                # Extract system + first 2 human messages
-                all_parts = []
-                for msg in parsed_messages:
-                    if msg['role'] == 'system':
-                        all_parts.append(msg['content'])
-                    elif msg['role'] == 'human':
-                        all_parts.append(msg['content'])
-                        if len(all_parts) >= 3:  # system + 2 human messages
-                            break
-                
-                if all_parts:
-                    best_content = '\n\n---\n\n'.join(all_parts)
-                    break
+                # Take ONLY the first user message (the actual task)
+                elif role == 'user' and not seen_user:
+                    content = extract_text_from_content(msg.get('content', ''))
+                    # Skip generic greetings
+                    if content and content not in ['Hi! How can I help you today?', 'Hello', 'Hi']:
+                        all_parts.append(content)
+                        seen_user = True
+                        break  # Stop after first user message
             
-            # Handle other benchmarks
-            else:
-                if not isinstance(messages, list):
-                    continue
-                
-                # Extract ONLY the initial task description
-                all_parts = []
-                seen_user = False
+            if all_parts:
+                combined = '\n\n---\n\n'.join(all_parts)
+                # Normalize whitespace to fix LaTeX/Wikipedia formatting issues
+                combined = _INTERNER.normalized(combined)
                 
-                for msg in messages:
-                    if not isinstance(msg, dict):
-                        continue
-                    
-                    role = msg.get('role')
-                    
-                    # Take first system/developer message
-                    if role in ['system', 'developer'] and not all_parts:
-                        content = extract_text_from_content(msg.get('content', ''))
-                        if content:
-                            all_parts.append(content)
-                    
-                    # Take ONLY the first user message (the actual task)
-                    elif role == 'user' and not seen_user:
-                        content = extract_text_from_content(msg.get('content', ''))
-                        # Skip generic greetings
-                        if content and content not in ['Hi! How can I help you today?', 'Hello', 'Hi']:
-                            all_parts.append(content)
-                            seen_user = True
-                            break  # Stop after first user message
-                
-                if all_parts:
-                    combined = '\n\n---\n\n'.join(all_parts)
-                    # Normalize whitespace to fix LaTeX/Wikipedia formatting issues
-                    combined = normalize_whitespace(combined)
-                    
-                    # For taubench: only keep if it has "Instruction:" (task-specific)
-                    # For others: take first valid entry
-                    if 'Instruction:' in combined or 'taubench' not in str(trace_file):
-                        best_content = combined
-                        break  # Found the right entry
-        
-        if best_content:
-            results[task_id] = best_content
-    
-    return results
+                # For taubench: only keep if it has "Instruction:" (task-specific)
+                # For others: take first valid entry
+                if 'Instruction:' in combined or 'taubench' not in str(trace_file):
+                    best_content = combined
+                    break  # Found the right entry
+
+    return best_content
+
+
+def _extract_shard(path: Path, trace_file: Path, json_backend: str = None):
+    return extract_task_input(load_shard(path, json_backend), trace_file)
+
+
+def extract_from_shards(trace_file: Path, shard_dir: Path, needed_task_ids: set, workers=None, json_backend: str = None):
+    """Same as extract_from_trace_file, from the per-task shards of the trace (see shard_traces.py),
+    one task per worker process."""
+    paths = shard_paths(shard_dir, needed_task_ids)
+    extract = partial(_extract_shard, trace_file=trace_file, json_backend=json_backend)
+    # Workers intern into their own copy of _INTERNER; intern again here so results share strings
+    return {task_id: _INTERNER.intern(content) for task_id, content in map_shards(extract, paths, workers) if content}
 
 
 def main():
@@ -214,9 +234,15 @@ def main():
     parser.add_argument('--traces', default='traces')
     parser.add_argument('--output', default='all_benchmarks_inputs.csv')
     parser.add_argument('--benchmark', default=None, help='Specific benchmark to process')
+    parser.add_argument('--base_dir', default='.', help='Directory the other paths are relative to (default: current directory)')
+    parser.add_argument('--prefetch', type=int, default=DEFAULT_DEPTH, help=f'Trace files read ahead while one is parsed, 0 to disable (default: {DEFAULT_DEPTH})')
+    parser.add_argument('--prefetch_mb', type=int, default=DEFAULT_MAX_BYTES >> 20, help=f'Cap on read-ahead buffers in MB (default: {DEFAULT_MAX_BYTES >> 20})')
+    parser.add_argument('--shards', default=None, help='Shard directory written by shard_traces.py; traces with current shards are read task by task in parallel')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for sharded traces (default: CPU count)')
+    add_json_backend_argument(parser)
     args = parser.parse_args()
     
-    base_dir = Path('/home/azureuser/cloudfiles/code/hal-collect')
+    base_dir = Path(args.base_dir)
     
     # Load CSV
     df = pd.read_csv(base_dir / args.csv)
@@ -252,15 +278,27 @@ def main():
             if not trace_files:
                 continue
             
-            # Extract from each trace file
+            # Sharded traces are read per task; the others whole, reading the
+            # next ones while this one is parsed
+            shard_dirs = {}
+            if args.shards:
+                shard_dirs = {f: base_dir / args.shards / shard_dir_name(f) for f in trace_files}
+                shard_dirs = {f: d for f, d in shard_dirs.items() if is_current(f, d)}
+            unsharded = [f for f in trace_files if f not in shard_dirs]
             found_inputs = {}
-            for trace_file in trace_files:
+            traces = chain(((f, None) for f in shard_dirs),
+                           prefetch(unsharded, depth=args.prefetch, max_bytes=args.prefetch_mb << 20))
+            for trace_file, raw in traces:
                 if len(found_inputs) >= len(task_ids):
                     break
                 
                 print(f"      Checking: {trace_file.name[:55]}...")
                 needed = task_ids - set(found_inputs.keys())
-                batch_results = extract_from_trace_file(trace_file, needed)
+                if trace_file in shard_dirs:
+                    batch_results = extract_from_shards(trace_file, shard_dirs[trace_file], needed,
+                                                        workers=args.workers, json_backend=args.json_backend)
+                else:
+                    batch_results = extract_from_trace_file(trace_file, needed, raw, args.json_backend)
                 found_inputs.update(batch_results)
                 print(f"        Found {len(found_inputs)}/{len(task_ids)}")
             
@@ -282,14 +320,13 @@ def main():
     if all_results:
         output_df = pd.DataFrame(all_results)
         output_path = base_dir / args.output
-        # Save as pickle to avoid CSV formatting issues with multi-line content
-        output_path_pkl = output_path.with_suffix('.pkl')
-        output_df.to_pickle(output_path_pkl)
+        # Content-addressed segment store: shared system prompts are stored once
+        output_path_inputs = write_inputs(output_df, output_path)
         
         print(f"\n{'='*60}")
         print(f"SUMMARY")
         print(f"{'='*60}")
-        print(f"Saved {len(output_df)} entries to {output_path_pkl}")
+        print(f"Saved {len(output_df)} entries to {output_path_inputs}")
         
         # Show coverage
         for benchmark in sorted(output_df['benchmark_id'].unique()):
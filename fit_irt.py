@@ -0,0 +1,92 @@
+"""
+Fit a 1PL (Rasch) or 2PL IRT model on the merged response matrix.
+
+Reads result/result_matrix_merged.csv (test_taker_id x benchmark.task, NaN = not attempted)
+and writes:
+    result/irt_abilities.csv   test_taker_id, ability, ability_se, n_responses
+    result/irt_items.csv       task (benchmark.task), difficulty, discrimination, difficulty_se, n_responses
+
+With --incremental the fit is persisted in result/irt_state.npz, keyed to the version
+of the long-format matrix. Later runs only score new/changed test takers against the
+frozen item parameters (and calibrate new tasks against frozen abilities); every
+--refine_every updates, all parameters are refined from the warm start.
+
+Usage:
+    python fit_irt.py
+    python fit_irt.py --model 2pl --batch_size 500000
+    python fit_irt.py --incremental
+    python fit_irt.py --incremental --refine
+"""
+
+import os
+import time
+import argparse
+import pandas as pd
+
+from util.irt import (MODELS, Responses, IRTState, fit_irt, update_irt, response_counts,
+                      row_signatures, matrix_version)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fit IRT abilities and difficulties on the merged result matrix')
+    parser.add_argument('--matrix', type=str, default='result/result_matrix_merged.csv', help='Merged result matrix (default: result/result_matrix_merged.csv)')
+    parser.add_argument('--model', choices=MODELS, default='1pl', help='IRT model (default: 1pl)')
+    parser.add_argument('--max_iter', type=int, default=200, help='Maximum number of Newton iterations (default: 200)')
+    parser.add_argument('--batch_size', type=int, default=1_000_000, help='Observations per mini-batch (default: 1000000)')
+    parser.add_argument('--output', type=str, default='./result', help='Output directory (default: ./result)')
+    parser.add_argument('--verbose', action='store_true', help='Print the log-likelihood at every iteration')
+    parser.add_argument('--incremental', action='store_true', help='Update the persisted fit instead of refitting from scratch')
+    parser.add_argument('--refine', action='store_true', help='With --incremental, refine all parameters from the warm start now')
+    parser.add_argument('--refine_every', type=int, default=7, help='With --incremental, refine after this many updates (default: 7)')
+    parser.add_argument('--refine_iter', type=int, default=20, help='Maximum iterations of a refinement (default: 20)')
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.matrix).set_index('test_taker_id')
+    responses = Responses.from_dataframe(df)
+    print(f"Fitting {args.model.upper()} on {responses.n_rows} test takers x {responses.n_cols} tasks "
+          f"({len(responses)} observed responses)")
+
+    start = time.time()
+    state_path = os.path.join(args.output, 'irt_state.npz')
+    state = None
+    if args.incremental and os.path.isfile(state_path):
+        state = IRTState.load(state_path)
+        if state.params.model != args.model:
+            print(f"Persisted fit uses {state.params.model.upper()}, refitting from scratch")
+            state = None
+
+    if state is None:
+        params = fit_irt(responses, model=args.model, max_iter=args.max_iter,
+                         batch_size=args.batch_size, verbose=args.verbose)
+        signatures = row_signatures(responses)
+        state = IRTState(params, matrix_version(responses, signatures), signatures)
+        print(f"Fit completed in {time.time() - start:.2f}s")
+    else:
+        previous_version = state.version
+        # Scheduled refinements only count updates that changed the matrix
+        changed = matrix_version(responses) != previous_version
+        refine = args.refine or (changed and state.updates_since_refine + 1 >= args.refine_every)
+        state = update_irt(responses, state, refine=refine, refine_iter=args.refine_iter,
+                           batch_size=args.batch_size)
+        if state.version == previous_version and not refine:
+            print(f"Matrix version {state.version} unchanged, nothing to update")
+        else:
+            print(f"Updated {previous_version} -> {state.version}{' with refinement' if refine else ''} "
+                  f"in {time.time() - start:.2f}s")
+        params = state.params
+
+    if args.incremental:
+        os.makedirs(args.output, exist_ok=True)
+        state.save(state_path)
+
+    row_counts, col_counts = response_counts(responses)
+    os.makedirs(args.output, exist_ok=True)
+    abilities_path = os.path.join(args.output, 'irt_abilities.csv')
+    items_path = os.path.join(args.output, 'irt_items.csv')
+    params.abilities(row_counts).sort_values('ability', ascending=False).to_csv(abilities_path, index=False)
+    params.items(col_counts).to_csv(items_path, index=False)
+    print(f"Saved {abilities_path} and {items_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+'''
+Lazy query API over HAL traces, result matrices, rubrics and task inputs.
+
+    import halcollect
+    calls = halcollect.llm_calls(benchmark='corebench_hard', model='gpt-4.1', task='capsule-1234567')
+    df = calls.to_pandas()
+
+Datasets are only read when iterated or converted; see halcollect.datasets for
+how each filter is pushed down.
+'''
+from halcollect.datasets import runs, llm_calls, task_results, rubrics, task_inputs
+
+__all__ = ['runs', 'llm_calls', 'task_results', 'rubrics', 'task_inputs']
@@ -0,0 +1,81 @@
+'''
+hal-collect command line.
+
+Usage:
+    python -m halcollect sql "SELECT scaffold, avg(success) FROM task_results JOIN runs USING (agent_name) GROUP BY 1"
+    python -m halcollect sql --views
+    python -m halcollect inventory --verbose
+'''
+import sys
+import json
+import time
+import argparse
+
+
+def sql_command(args):
+    from halcollect.sql import REGISTRARS, DEFAULT_SOURCES, connect, run_sql
+
+    sources = {}
+    for override in args.source or []:
+        name, _, path = override.partition('=')
+        if name not in REGISTRARS:
+            sys.exit(f"Unknown view '{name}'; available: {', '.join(REGISTRARS)}")
+        sources[name] = path
+
+    if args.views:
+        con = connect(sources=sources)
+        registered = {row[0] for row in con.execute("SELECT table_name FROM information_schema.tables").fetchall()}
+        for name in REGISTRARS:
+            status = 'ok' if name in registered else 'missing'
+            print(f"{name:<16} {status:<8} {sources.get(name, DEFAULT_SOURCES[name])}")
+        return
+
+    query = args.query if args.query is not None else sys.stdin.read()
+    start = time.time()
+    df = run_sql(query, sources=sources)
+    if args.output:
+        df.to_csv(args.output, index=False)
+        print(f"{len(df)} rows saved to {args.output} in {time.time() - start:.2f}s")
+    else:
+        print(df.to_string(index=False, max_rows=args.max_rows))
+        print(f"({len(df)} rows, {time.time() - start:.2f}s)")
+
+
+def inventory_command(args):
+    from halcollect.inventory import inventory, format_inventory
+
+    start = time.time()
+    report = inventory(args.traces, resmat_dir=args.resmat, leaderboard_dir=args.leaderboard)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_inventory(report, verbose=args.verbose))
+        print(f"({(time.time() - start) * 1000:.0f} ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='hal-collect', description='Query HAL traces, result matrices and rubrics')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    sql_parser = subparsers.add_parser('sql', help='Run a SQL query over the project artifacts (DuckDB)')
+    sql_parser.add_argument('query', type=str, nargs='?', default=None, help='SQL query (read from stdin if omitted)')
+    sql_parser.add_argument('--views', action='store_true', help='List the available views and their sources')
+    sql_parser.add_argument('--source', type=str, action='append', help='Override a view source, e.g. --source task_results=other/result_matrix.csv')
+    sql_parser.add_argument('--output', type=str, default=None, help='Write the result to a CSV file instead of printing it')
+    sql_parser.add_argument('--max_rows', type=int, default=50, help='Rows to print (default: 50)')
+    sql_parser.set_defaults(func=sql_command)
+
+    inventory_parser = subparsers.add_parser('inventory', help='Scaffolds, models, test takers and trace counts from persisted metadata')
+    inventory_parser.add_argument('--traces', type=str, default='traces', help='Trace directory (default: traces)')
+    inventory_parser.add_argument('--resmat', type=str, default='resmat', help='Directory of .resmat response matrices (default: resmat)')
+    inventory_parser.add_argument('--leaderboard', type=str, default='leaderboard', help='Directory of leaderboard CSVs (default: leaderboard)')
+    inventory_parser.add_argument('--verbose', action='store_true', help='List the models of every scaffold and the rows of every matrix')
+    inventory_parser.add_argument('--json', action='store_true', help='Print the inventory as JSON')
+    inventory_parser.set_defaults(func=inventory_command)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
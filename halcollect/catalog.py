@@ -0,0 +1,132 @@
+'''
+Persisted index of trace file headers.
+
+Reading config/results of a trace still means tokenizing the file up to those
+keys, so the catalog caches one small summary per trace in
+output/halcollect_index/<traces_dir name>-<hash of its path>.json, keyed by
+file name, size and mtime. A trace is only re-read when it changed. The index
+is kept out of the traces directory so that it is never taken for a trace.
+'''
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+
+from util.trace_io import read_trace_header
+
+INDEX_DIR = Path(__file__).parent.parent / 'output' / 'halcollect_index'
+INDEX_VERSION = 1
+
+_TIMESTAMP_PATTERN = re.compile(r'(\d{10})(?!.*\d{10})')
+
+
+def run_timestamp(run_id: str):
+    '''
+    Unix timestamp embedded in a HAL run_id (e.g. corebench_hard_..._1747247518), or None.
+    '''
+    match = _TIMESTAMP_PATTERN.search(run_id or '')
+    return int(match.group(1)) if match else None
+
+
+def default_index_path(traces_dir) -> Path:
+    traces_dir = Path(traces_dir).resolve()
+    digest = hashlib.blake2b(str(traces_dir).encode(), digest_size=4).hexdigest()
+    return INDEX_DIR / f"{traces_dir.name}-{digest}.json"
+
+
+def summarize_header(header: dict) -> dict:
+    config = header.get('config', {}) or {}
+    results = header.get('results', {}) or {}
+    run_id = config.get('run_id', '')
+    return {
+        'run_id': run_id,
+        'benchmark_name': config.get('benchmark_name', ''),
+        'agent_name': config.get('agent_name', ''),
+        'model_name': (config.get('agent_args', {}) or {}).get('model_name', ''),
+        'timestamp': run_timestamp(run_id),
+        'successful_tasks': [str(t) for t in results.get('successful_tasks', []) or []],
+        'failed_tasks': [str(t) for t in results.get('failed_tasks', []) or []],
+    }
+
+
+class TraceCatalog:
+    '''
+    Header summaries of the *.json traces in a directory.
+    '''
+
+    def __init__(self, traces_dir='traces', index_path=None):
+        self.traces_dir = Path(traces_dir)
+        self.index_path = Path(index_path) if index_path else default_index_path(self.traces_dir)
+        self._index = None
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            self._index = {}
+            if self.index_path.is_file():
+                with open(self.index_path, 'r') as f:
+                    data = json.load(f)
+                if data.get('version') == INDEX_VERSION:
+                    self._index = data.get('files', {})
+        return self._index
+
+    def save(self):
+        if self._index is None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'files': self._index}, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _scan(self, name_prefixes=None) -> list[os.DirEntry]:
+        if not self.traces_dir.is_dir():
+            return []
+        files = []
+        with os.scandir(self.traces_dir) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                if name_prefixes and not any(entry.name.startswith(p) for p in name_prefixes):
+                    continue
+                files.append(entry)
+        files.sort(key=lambda entry: entry.name)
+        return files
+
+    def trace_files(self, name_prefixes=None) -> list[Path]:
+        '''
+        Trace files in the directory, optionally only those whose file name
+        starts with one of name_prefixes (no file is opened).
+        '''
+        return [Path(entry.path) for entry in self._scan(name_prefixes)]
+
+    def entries(self, name_prefixes=None) -> list[dict]:
+        '''
+        Header summaries (plus path/size) of the matching trace files. Stale or
+        missing summaries are refreshed and the index is saved.
+        '''
+        index = self._load_index()
+        changed = False
+        entries = []
+        for dir_entry in self._scan(name_prefixes):
+            stat = dir_entry.stat()
+            cached = index.get(dir_entry.name)
+            if cached is None or cached['size'] != stat.st_size or cached['mtime_ns'] != stat.st_mtime_ns:
+                try:
+                    summary = summarize_header(read_trace_header(dir_entry.path))
+                except Exception as e:
+                    print(f"  Error reading {dir_entry.name}: {e}")
+                    continue
+                cached = dict(summary, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                index[dir_entry.name] = cached
+                changed = True
+            entries.append(dict(cached, path=dir_entry.path, file_name=dir_entry.name))
+        if not name_prefixes:
+            # Full scan: drop summaries of traces that no longer exist
+            present = {entry['file_name'] for entry in entries}
+            for name in [name for name in index if name not in present]:
+                del index[name]
+                changed = True
+        if changed:
+            self.save()
+        return entries
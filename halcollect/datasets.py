@@ -0,0 +1,307 @@
+'''
+Lazy datasets over traces, result matrices, rubrics and task inputs.
+
+A dataset only records its source and filters; nothing is read until it is
+iterated or converted with to_pandas(). Filters are applied as early as the
+storage allows:
+
+- runs / llm_calls: benchmark filters select trace files by name before any
+  file is opened; scaffold, model, run and time filters use the cached trace
+  headers (halcollect.catalog); task filters are applied per logging entry
+  by peeking at its weave_task_id, so non-matching entries are never decoded.
+- task_results: only the result_matrix.csv columns of the selected
+  benchmarks/tasks are parsed.
+- rubrics: the CSV is read in chunks and filtered chunk by chunk.
+- task_inputs: filters select rows of the segment store before any input is
+  decompressed.
+'''
+import sys
+import abc
+import json
+import pickle
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from halcollect.catalog import TraceCatalog
+from util.trace_io import iter_logging_spans, peek_task_id, entry_task_id
+from util.input_store import open_inputs, SUFFIX as INPUTS_SUFFIX
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+from canonical import canonical_scaffold, canonical_model
+
+RESULT_MATRIX_META_COLUMNS = ['benchmark_name', 'agent_name', 'model_name']
+DEFAULT_RUBRICS_PATH = 'hal-paper-analysis/qualitative/results/rubrics/all_benchmarks_merged.csv'
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return {str(v) for v in value}
+
+
+def _model_key(model: str) -> str:
+    # Provider prefixes (openai/gpt-4.1) are not part of the model name
+    return canonical_model(model.split('/')[-1])
+
+
+def _as_epoch(value):
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value.timestamp()
+
+
+class Filters:
+    '''
+    Normalized filter values shared by every dataset.
+    '''
+
+    def __init__(self, benchmark=None, scaffold=None, model=None, task=None,
+                 since=None, until=None, run_id=None):
+        self.benchmark = _as_set(benchmark)
+        self.scaffold = {canonical_scaffold(s) for s in _as_set(scaffold)} if scaffold is not None else None
+        self.model = {_model_key(m) for m in _as_set(model)} if model is not None else None
+        self.task = _as_set(task)
+        self.since = _as_epoch(since)
+        self.until = _as_epoch(until)
+        self.run_id = _as_set(run_id)
+
+    def match_benchmark(self, name) -> bool:
+        return self.benchmark is None or any(str(name).startswith(b) for b in self.benchmark)
+
+    def match_scaffold(self, agent_name) -> bool:
+        return self.scaffold is None or canonical_scaffold(agent_name) in self.scaffold
+
+    def match_model(self, model_name) -> bool:
+        if self.model is None:
+            return True
+        return _model_key(str(model_name)) in self.model
+
+    def match_task(self, task_id) -> bool:
+        return self.task is None or str(task_id) in self.task
+
+    def match_time(self, timestamp) -> bool:
+        if self.since is None and self.until is None:
+            return True
+        if timestamp is None:
+            return False
+        return (self.since is None or timestamp >= self.since) and (self.until is None or timestamp < self.until)
+
+    def match_run(self, run_id) -> bool:
+        return self.run_id is None or run_id in self.run_id
+
+
+class Dataset(abc.ABC):
+    '''
+    Base class: holds the source and the filters, evaluates lazily.
+    '''
+    supported_filters = set()
+
+    def __init__(self, source, **filters):
+        unsupported = {k for k, v in filters.items() if v is not None} - self.supported_filters
+        if unsupported:
+            raise ValueError(f"{type(self).__name__} does not support filters {sorted(unsupported)}; "
+                             f"supported: {sorted(self.supported_filters)}")
+        self.source = source
+        self._filter_kwargs = {k: v for k, v in filters.items() if v is not None}
+        self.filters = Filters(**self._filter_kwargs)
+
+    def filter(self, **filters) -> 'Dataset':
+        '''
+        Returns a new dataset with additional filters (later values win).
+        '''
+        return type(self)(self.source, **{**self._filter_kwargs, **filters})
+
+    def __iter__(self):
+        return self._scan()
+
+    @abc.abstractmethod
+    def _scan(self):
+        '''
+        Yields the rows of the dataset as dicts, applying the filters.
+        '''
+
+    def to_pandas(self) -> pd.DataFrame:
+        return pd.DataFrame(list(self._scan()))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self.source)!r}, {self._filter_kwargs})"
+
+
+class RunDataset(Dataset):
+    '''
+    One row per trace file (run), from the cached trace headers.
+    '''
+    supported_filters = {'benchmark', 'scaffold', 'model', 'since', 'until', 'run_id'}
+
+    def _entries(self):
+        catalog = TraceCatalog(self.source)
+        f = self.filters
+        for entry in catalog.entries(name_prefixes=f.benchmark):
+            if not (f.match_benchmark(entry['benchmark_name']) and f.match_scaffold(entry['agent_name'])
+                    and f.match_model(entry['model_name']) and f.match_time(entry['timestamp'])
+                    and f.match_run(entry['run_id'])):
+                continue
+            yield entry
+
+    def _scan(self):
+        for entry in self._entries():
+            yield {
+                'run_id': entry['run_id'],
+                'benchmark_name': entry['benchmark_name'],
+                'agent_name': entry['agent_name'],
+                'scaffold': canonical_scaffold(entry['agent_name']),
+                'model_name': entry['model_name'],
+                'timestamp': entry['timestamp'],
+                'successful_tasks': len(entry['successful_tasks']),
+                'failed_tasks': len(entry['failed_tasks']),
+                'file_name': entry['file_name'],
+                'size': entry['size'],
+            }
+
+
+class LLMCallDataset(RunDataset):
+    '''
+    One row per raw_logging_results entry of the matching runs, streamed.
+    '''
+    supported_filters = RunDataset.supported_filters | {'task'}
+
+    def _calls(self, path):
+        # Entries are located by byte range and only the matching ones are decoded
+        tasks = self.filters.task
+        with open(path, 'rb') as f:
+            for start, end in iter_logging_spans(path):
+                f.seek(start)
+                raw = f.read(end - start)
+                if tasks is None or peek_task_id(raw) in tasks:
+                    yield json.loads(raw)
+
+    def _scan(self):
+        for entry in self._entries():
+            if self.filters.task is not None:
+                tasks = set(entry['successful_tasks']) | set(entry['failed_tasks'])
+                # Skip runs that cannot contain the requested tasks (when results list them)
+                if tasks and not tasks & self.filters.task:
+                    continue
+            for call in self._calls(entry['path']):
+                yield {
+                    'run_id': entry['run_id'],
+                    'benchmark_name': entry['benchmark_name'],
+                    'agent_name': entry['agent_name'],
+                    'model_name': entry['model_name'],
+                    'task_id': entry_task_id(call),
+                    'call_id': call.get('id'),
+                    'op_name': call.get('op_name'),
+                    'started_at': call.get('started_at'),
+                    'ended_at': call.get('ended_at'),
+                    'inputs': call.get('inputs'),
+                    'output': call.get('output'),
+                    'summary': call.get('summary'),
+                }
+
+
+class TaskResultDataset(Dataset):
+    '''
+    Long-format (run, task, success) rows from result/result_matrix.csv.
+    '''
+    supported_filters = {'benchmark', 'scaffold', 'model', 'task'}
+
+    def _scan(self):
+        f = self.filters
+        header = pd.read_csv(self.source, nrows=0).columns
+        task_columns = [col for col in header if col not in RESULT_MATRIX_META_COLUMNS
+                        and f.match_benchmark(col.split('.', 1)[0])
+                        and f.match_task(col.split('.', 1)[-1])]
+        if not task_columns:
+            return
+        for chunk in pd.read_csv(self.source, usecols=RESULT_MATRIX_META_COLUMNS + task_columns, chunksize=2000):
+            mask = (chunk['benchmark_name'].map(f.match_benchmark)
+                    & chunk['agent_name'].map(f.match_scaffold)
+                    & chunk['model_name'].map(f.match_model))
+            long = chunk[mask].melt(id_vars=RESULT_MATRIX_META_COLUMNS, var_name='task_column',
+                                    value_name='success').dropna(subset=['success'])
+            for row in long.itertuples(index=False):
+                yield {
+                    'benchmark_name': row.benchmark_name,
+                    'agent_name': row.agent_name,
+                    'model_name': row.model_name,
+                    'task_id': row.task_column.split('.', 1)[-1],
+                    'task_column': row.task_column,
+                    'success': int(row.success),
+                }
+
+
+class RubricDataset(Dataset):
+    '''
+    Rows of the merged rubric CSV (all_benchmarks_merged.csv).
+    '''
+    supported_filters = {'benchmark', 'scaffold', 'model', 'task'}
+
+    def _scan(self):
+        f = self.filters
+        for chunk in pd.read_csv(self.source, chunksize=20000):
+            mask = np.ones(len(chunk), dtype=bool)
+            if f.benchmark is not None:
+                mask &= chunk['benchmark_id'].map(f.match_benchmark).to_numpy()
+            if f.model is not None:
+                mask &= chunk['model'].map(f.match_model).to_numpy()
+            if f.task is not None:
+                mask &= chunk['task_id'].astype(str).isin(f.task).to_numpy()
+            if f.scaffold is not None:
+                if 'scaffold' not in chunk.columns:
+                    raise ValueError(f"{self.source} has no scaffold column")
+                mask &= chunk['scaffold'].map(f.match_scaffold).to_numpy()
+            yield from chunk[mask].to_dict('records')
+
+
+class TaskInputDataset(Dataset):
+    '''
+    Extracted task inputs (extract_inputs_simple.py output, a util.input_store
+    .inputs directory or a legacy pickle). With a .inputs store, filters are
+    applied to the row table and only matching inputs are decompressed.
+    '''
+    supported_filters = {'benchmark', 'model', 'task'}
+
+    def _scan(self):
+        f = self.filters
+        if self.source.suffix == '.pkl' and not self.source.with_suffix(INPUTS_SUFFIX).is_dir():
+            with open(self.source, 'rb') as fh:
+                df = pickle.load(fh)
+            for row in df.to_dict('records'):
+                if f.match_benchmark(row['benchmark_id']) and f.match_model(row['model']) and f.match_task(row['task_id']):
+                    yield row
+            return
+        store = open_inputs(self.source)
+        for row in store.rows.to_dict('records'):
+            if f.match_benchmark(row['benchmark_id']) and f.match_model(row['model']) and f.match_task(row['task_id']):
+                row['task_input'] = store.text(row.pop('segments'))
+                yield row
+
+
+def runs(traces_dir='traces', **filters) -> RunDataset:
+    return RunDataset(Path(traces_dir), **filters)
+
+
+def llm_calls(traces_dir='traces', **filters) -> LLMCallDataset:
+    return LLMCallDataset(Path(traces_dir), **filters)
+
+
+def task_results(matrix='result/result_matrix.csv', **filters) -> TaskResultDataset:
+    return TaskResultDataset(Path(matrix), **filters)
+
+
+def rubrics(path=DEFAULT_RUBRICS_PATH, **filters) -> RubricDataset:
+    return RubricDataset(Path(path), **filters)
+
+
+def task_inputs(path='data/all_benchmarks_inputs.inputs', **filters) -> TaskInputDataset:
+    return TaskInputDataset(Path(path), **filters)
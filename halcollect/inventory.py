@@ -0,0 +1,163 @@
+'''
+Inventory of the collected runs, answered from persisted metadata only.
+
+Trace facts come from the header index (halcollect.catalog), which costs a
+stat() per trace once it is warm; matrix facts from the row tables of .resmat
+directories (util.resmat_store); leaderboard and rubric facts from the name
+columns of their CSVs. No trace body or matrix payload is read, except for
+legacy resmat pickles that have not been converted to .resmat yet.
+list_scaffolds.py, check_hal_generalist.py, util/list_all_models.py and the
+leaderboard listing scripts print parts of this report.
+'''
+import csv
+import sys
+import pickle
+from pathlib import Path
+from collections import defaultdict, Counter
+
+from halcollect.catalog import TraceCatalog
+from util.resmat_store import open_resmat, SUFFIX as RESMAT_SUFFIX
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+from canonical import canonical_scaffold, canonical_test_taker
+
+MERGED_RESMAT = 'response_matrix_merged'
+RUBRICS_DIR = Path(__file__).parent.parent / 'hal-trait-analysis' / 'rubrics_merged'
+
+
+def _resmat_rows(resmat_dir) -> dict:
+    '''
+    {matrix name: row labels} of the .resmat directories in resmat_dir.
+
+    Legacy resmat_dir/*.pkl matrices without a .resmat conversion are still
+    listed; those have to be unpickled to reach their index (convert them with
+    python -m util.resmat_store to avoid it).
+    '''
+    resmat_dir = Path(resmat_dir)
+    if not resmat_dir.is_dir():
+        return {}
+    result = {}
+    for path in sorted(resmat_dir.glob('*.pkl')):
+        if not path.with_suffix(RESMAT_SUFFIX).is_dir():
+            with open(path, 'rb') as f:
+                result[path.stem] = [str(label) for label in pickle.load(f).index]
+    for path in sorted(resmat_dir.glob(f'*{RESMAT_SUFFIX}')):
+        if path.is_dir():
+            result[path.stem] = [str(label) for label in open_resmat(path).index]
+    return dict(sorted(result.items()))
+
+
+def _leaderboard_pairs(leaderboard_dir) -> dict:
+    '''
+    {leaderboard csv: set of (scaffold, model)} (2nd and 3rd columns).
+    '''
+    leaderboard_dir = Path(leaderboard_dir)
+    if not leaderboard_dir.is_dir():
+        return {}
+    result = {}
+    for path in sorted(leaderboard_dir.glob('*.csv')):
+        with open(path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            result[path.name] = {(row[1], row[2]) for row in reader if len(row) >= 3 and row[1] and row[2]}
+    return result
+
+
+def _rubric_models(rubrics_dir) -> dict:
+    '''
+    {rubric csv: set of model names} of the CSVs in rubrics_dir with a model column.
+    '''
+    rubrics_dir = Path(rubrics_dir) if rubrics_dir else None
+    if rubrics_dir is None or not rubrics_dir.is_dir():
+        return {}
+    result = {}
+    for path in sorted(rubrics_dir.glob('*.csv')):
+        with open(path, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if 'model' in header:
+                column = header.index('model')
+                result[path.name] = {row[column] for row in reader if len(row) > column and row[column]}
+    return result
+
+
+def inventory(traces_dir='traces', resmat_dir='resmat', leaderboard_dir='leaderboard', rubrics_dir=RUBRICS_DIR) -> dict:
+    # Any source can be None to skip it
+    entries = TraceCatalog(traces_dir).entries() if traces_dir else []
+    test_taker_ids = {}
+    traces_per_benchmark = Counter()
+    scaffold_benchmarks = defaultdict(Counter)
+    scaffold_models = defaultdict(set)
+    raw_test_takers = set()
+    for entry in entries:
+        agent, model, benchmark = entry['agent_name'], entry['model_name'], entry['benchmark_name']
+        test_taker_ids[(agent, model)] = canonical_test_taker(agent, model)
+        scaffold = canonical_scaffold(agent)
+        traces_per_benchmark[benchmark] += 1
+        scaffold_benchmarks[scaffold][benchmark] += 1
+        if model:
+            scaffold_models[scaffold].add(model)
+        raw_test_takers.add((benchmark, agent, model))
+
+    resmats = _resmat_rows(resmat_dir) if resmat_dir else {}
+    merged = resmats.pop(MERGED_RESMAT, None)
+    leaderboard_pairs = _leaderboard_pairs(leaderboard_dir) if leaderboard_dir else {}
+    leaderboards = {name: {f"{scaffold} + {model}" for scaffold, model in pairs}
+                    for name, pairs in leaderboard_pairs.items()}
+    rubric_models = _rubric_models(rubrics_dir)
+    return {
+        'traces': len(entries),
+        'traces_per_benchmark': dict(sorted(traces_per_benchmark.items())),
+        'scaffold_benchmarks': {s: dict(sorted(c.items())) for s, c in sorted(scaffold_benchmarks.items())},
+        'scaffold_models': {s: sorted(m) for s, m in sorted(scaffold_models.items())},
+        'test_takers': {
+            # (benchmark, agent_name, model_name) as written in the traces
+            'raw': len(raw_test_takers),
+            # distinct (agent_name, model_name) across benchmarks
+            'agent_model_pairs': len(test_taker_ids),
+            # after canonicalization (canonical.canonical_test_taker)
+            'test_taker_ids': len(set(test_taker_ids.values())),
+        },
+        'resmat': {
+            'rows_per_matrix': {name: len(rows) for name, rows in resmats.items()},
+            'rows_before_merge': sum(len(rows) for rows in resmats.values()),
+            'rows_after_merge': None if merged is None else len(merged),
+            'rows': resmats,
+            'merged_rows': merged,
+        },
+        'leaderboard_test_takers': {name: len(takers) for name, takers in leaderboards.items()},
+        'leaderboard_test_takers_total': len(set().union(*leaderboards.values())) if leaderboards else 0,
+        'leaderboard_pairs': {name: sorted(pairs) for name, pairs in leaderboard_pairs.items()},
+        'rubric_models': {name: sorted(models) for name, models in rubric_models.items()},
+    }
+
+
+def format_inventory(report: dict, verbose: bool = False) -> str:
+    lines = [f"Traces: {report['traces']}"]
+    for benchmark, count in report['traces_per_benchmark'].items():
+        lines.append(f"  {benchmark}: {count}")
+
+    lines.append(f"\nScaffolds ({len(report['scaffold_benchmarks'])}), traces per benchmark:")
+    for scaffold, benchmarks in report['scaffold_benchmarks'].items():
+        models = report['scaffold_models'].get(scaffold, [])
+        counts = ', '.join(f"{benchmark} {count}" for benchmark, count in benchmarks.items())
+        lines.append(f"  {scaffold} [{len(models)} model(s)]: {counts}")
+        if verbose:
+            lines.extend(f"      {model}" for model in models)
+
+    takers = report['test_takers']
+    lines.append(f"\nTest takers: {takers['raw']} (benchmark, agent, model) runs, {takers['agent_model_pairs']} "
+                 f"agent/model pairs, {takers['test_taker_ids']} after canonicalization")
+
+    resmat = report['resmat']
+    if resmat['rows_per_matrix'] or resmat['rows_after_merge'] is not None:
+        after = resmat['rows_after_merge'] if resmat['rows_after_merge'] is not None else 'n/a'
+        lines.append(f"Response matrices: {resmat['rows_before_merge']} rows before merge, {after} after")
+        if verbose:
+            lines.extend(f"  {name}: {rows}" for name, rows in resmat['rows_per_matrix'].items())
+
+    if report['leaderboard_test_takers']:
+        lines.append(f"Leaderboards: {report['leaderboard_test_takers_total']} unique test takers")
+        lines.extend(f"  {name}: {count}" for name, count in report['leaderboard_test_takers'].items())
+    return '\n'.join(lines)
@@ -0,0 +1,213 @@
+'''
+DuckDB views over the project artifacts.
+
+CSV artifacts are exposed as views over DuckDB's own (parallel, vectorized) CSV
+reader, so creating them costs nothing and each query only scans the columns
+it uses. Wide task matrices are unpivoted into long form inside the view.
+Parquet artifacts (transcripts, per-call rows) are read with read_parquet, so
+filters and column selections are pushed into the scan. Artifacts that are
+neither (trace headers, task inputs) are registered as in-memory tables.
+Trace contents are only queryable through the calls view, which requires
+build_calls.py to have run; runs holds header summaries only.
+
+Views (only those whose artifact exists are created):
+
+    task_results     result/result_matrix.csv, one row per (run, task), with scaffold and test_taker_id
+    merged_results   result/result_matrix_merged.csv, one row per (test_taker_id, task)
+    rubrics          all_benchmarks_merged.csv, as written by compile_rubric_results.py
+    rubric_matrix    rubrics/rubrics_matrix_<rubric>.csv, one row per (rubric, test_taker_id, task)
+    transcripts      output/transcripts.csv (or the Parquet copy next to it)
+    calls            output/calls/*.parquet, one row per logged LLM call, from build_calls.py
+    runs             header summary of every trace in traces/ (halcollect.catalog)
+    task_inputs      data/all_benchmarks_inputs.inputs (util.input_store, or a legacy .pkl)
+    task_costs       output/task_costs.csv, tokens and cost per (run, task) from build_costs.py
+    task_latency     output/task_latency.csv, wall-clock/LLM/idle time per (run, task) from build_latency.py
+'''
+import os
+import re
+import csv
+import sys
+import glob
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+
+from halcollect.catalog import TraceCatalog
+from halcollect.datasets import RESULT_MATRIX_META_COLUMNS, DEFAULT_RUBRICS_PATH
+from util.input_store import load_inputs
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+from canonical import canonical_scaffold, canonical_test_taker, canonical_test_takers
+
+DEFAULT_SOURCES = {
+    'task_results': 'result/result_matrix.csv',
+    'merged_results': 'result/result_matrix_merged.csv',
+    'rubrics': DEFAULT_RUBRICS_PATH,
+    'rubric_matrix': 'rubrics',
+    'transcripts': 'output/transcripts.csv',
+    'calls': 'output/calls',
+    'runs': 'traces',
+    'task_inputs': 'data/all_benchmarks_inputs.inputs',
+    'task_costs': 'output/task_costs.csv',
+    'task_latency': 'output/task_latency.csv',
+}
+
+
+def _quote(path) -> str:
+    return "'" + str(path).replace("'", "''") + "'"
+
+
+def _matrix_source(path, id_columns: list[str]) -> str:
+    '''
+    read_csv() over a wide task matrix with an explicit schema (id columns as
+    VARCHAR, task columns as DOUBLE). Sniffing thousands of columns is far
+    slower than the scan itself.
+    '''
+    with open(path, 'r', newline='') as f:
+        header = next(csv.reader(f))
+    columns = ', '.join(f"{_quote(col)}: '{'VARCHAR' if col in id_columns else 'DOUBLE'}'" for col in header)
+    return f"read_csv({_quote(path)}, header = true, auto_detect = false, columns = {{{columns}}})"
+
+
+def _unpivot_tasks(path, id_columns: list[str]) -> str:
+    '''
+    SELECT that turns a wide <benchmark>.<task> matrix into (id_columns..., success, task_column, task_benchmark, task_id).
+    '''
+    ids = ', '.join(id_columns)
+    return f"""
+        SELECT * EXCLUDE (task_column),
+               task_column,
+               split_part(task_column, '.', 1) AS task_benchmark,
+               substr(task_column, strpos(task_column, '.') + 1) AS task_id
+        FROM (
+            UNPIVOT (SELECT * FROM {_matrix_source(path, id_columns)})
+            ON COLUMNS(* EXCLUDE ({ids}))
+            INTO NAME task_column VALUE success
+        )
+    """
+
+
+def _register_task_results(con, path):
+    # scaffold/test_taker_id are resolved once per (agent, model), not per row
+    agents = pd.read_csv(path, usecols=RESULT_MATRIX_META_COLUMNS).drop_duplicates(['agent_name', 'model_name'])
+    agents['scaffold'] = agents['agent_name'].map(canonical_scaffold)
+    agents['test_taker_id'] = canonical_test_takers(agents['agent_name'], agents['model_name'])
+    con.register('task_results_agents', agents[['agent_name', 'model_name', 'scaffold', 'test_taker_id']])
+    con.execute(f"""
+        CREATE OR REPLACE VIEW task_results AS
+        SELECT t.*, a.scaffold, a.test_taker_id
+        FROM ({_unpivot_tasks(path, RESULT_MATRIX_META_COLUMNS)}) t
+        LEFT JOIN task_results_agents a USING (agent_name, model_name)
+    """)
+
+
+def _register_merged_results(con, path):
+    con.execute(f"CREATE OR REPLACE VIEW merged_results AS {_unpivot_tasks(path, ['test_taker_id'])}")
+
+
+def _register_rubrics(con, path):
+    con.execute(f"CREATE OR REPLACE VIEW rubrics AS SELECT * FROM read_csv_auto({_quote(path)}, header = true)")
+
+
+def _register_rubric_matrix(con, path):
+    files = sorted(glob.glob(os.path.join(path, 'rubrics_matrix_*.csv')))
+    selects = []
+    for file in files:
+        rubric = Path(file).stem[len('rubrics_matrix_'):]
+        selects.append(f"SELECT '{rubric}' AS rubric, * FROM ({_unpivot_tasks(file, ['test_taker_id'])})")
+    if selects:
+        con.execute("CREATE OR REPLACE VIEW rubric_matrix AS " + ' UNION ALL '.join(selects))
+
+
+def _register_transcripts(con, path):
+    # build_transcripts.py writes a Parquet copy next to the CSV
+    parquet_path = Path(path).with_suffix('.parquet')
+    if parquet_path.is_file():
+        con.execute(f"CREATE OR REPLACE VIEW transcripts AS SELECT * FROM read_parquet({_quote(parquet_path)})")
+    else:
+        con.execute(f"CREATE OR REPLACE VIEW transcripts AS SELECT * FROM read_csv_auto({_quote(path)}, header = true)")
+
+
+def _register_calls(con, path):
+    # One Parquet file per trace (build_calls.py)
+    if glob.glob(os.path.join(path, '*.parquet')):
+        con.execute(f"CREATE OR REPLACE VIEW calls AS SELECT * FROM "
+                    f"read_parquet({_quote(os.path.join(path, '*.parquet'))}, union_by_name = true)")
+
+
+def _per_task_csv_registrar(name):
+    def register(con, path):
+        con.execute(f"CREATE OR REPLACE VIEW {name} AS SELECT * FROM "
+                    f"read_csv_auto({_quote(path)}, header = true, types = {{'task_id': 'VARCHAR'}})")
+    return register
+
+
+def _register_runs(con, path):
+    entries = TraceCatalog(path).entries()
+    df = pd.DataFrame([{
+        'run_id': entry['run_id'],
+        'benchmark_name': entry['benchmark_name'],
+        'agent_name': entry['agent_name'],
+        'scaffold': canonical_scaffold(entry['agent_name']),
+        'model_name': entry['model_name'],
+        'test_taker_id': canonical_test_taker(entry['agent_name'], entry['model_name']),
+        'timestamp': entry['timestamp'],
+        'successful_tasks': len(entry['successful_tasks']),
+        'failed_tasks': len(entry['failed_tasks']),
+        'file_name': entry['file_name'],
+        'size': entry['size'],
+    } for entry in entries])
+    if not df.empty:
+        con.register('runs', df)
+
+
+def _register_task_inputs(con, path):
+    con.register('task_inputs', load_inputs(path))
+
+
+REGISTRARS = {
+    'task_results': _register_task_results,
+    'merged_results': _register_merged_results,
+    'rubrics': _register_rubrics,
+    'rubric_matrix': _register_rubric_matrix,
+    'transcripts': _register_transcripts,
+    'calls': _register_calls,
+    'runs': _register_runs,
+    'task_inputs': _register_task_inputs,
+    'task_costs': _per_task_csv_registrar('task_costs'),
+    'task_latency': _per_task_csv_registrar('task_latency'),
+}
+
+
+def connect(views=None, sources=None, database=':memory:') -> duckdb.DuckDBPyConnection:
+    '''
+    DuckDB connection with the project views registered. views restricts which
+    views are created (default: all); sources overrides DEFAULT_SOURCES paths.
+    '''
+    sources = {**DEFAULT_SOURCES, **(sources or {})}
+    con = duckdb.connect(database)
+    con.create_function('scaffold', canonical_scaffold, ['VARCHAR'], 'VARCHAR')
+    con.create_function('test_taker_id', canonical_test_taker, ['VARCHAR', 'VARCHAR'], 'VARCHAR')
+    for name in views if views is not None else REGISTRARS:
+        path = sources[name]
+        if os.path.exists(path):
+            REGISTRARS[name](con, path)
+    return con
+
+
+def referenced_views(query: str) -> list[str]:
+    '''
+    Project views named in a query; used to avoid loading artifacts the query does not touch.
+    '''
+    tokens = {token.lower() for token in re.findall(r'\w+', query)}
+    return [name for name in REGISTRARS if name in tokens]
+
+
+def run_sql(query: str, sources=None) -> pd.DataFrame:
+    con = connect(views=referenced_views(query), sources=sources)
+    try:
+        return con.sql(query).df()
+    finally:
+        con.close()
@@ -0,0 +1,170 @@
+"""
+Parse saved HAL leaderboard pages into one typed table.
+
+Every *.html file in the pages directory is one benchmark leaderboard (the
+file stem is used as the benchmark key, e.g. pages/corebench_hard.html). Pages
+are parsed in a thread pool with lxml, which releases the GIL while parsing.
+
+Usage:
+    python leaderboard/ingest.py leaderboard/pages
+    python leaderboard/ingest.py leaderboard/pages --output result/leaderboard.csv
+"""
+import os
+import re
+import time
+import argparse
+from pathlib import Path
+from urllib.parse import urlparse, unquote
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+from lxml import html as lxml_html
+
+# Visible header label -> column name. Unlisted headers (e.g. GAIA's "Level 1")
+# are kept as extra numeric columns.
+HEADER_COLUMNS = {
+    'Rank': 'rank',
+    'Scaffold': 'scaffold',
+    'Primary Model': 'model',
+    'Models': 'model',
+    'Verified': 'verified',
+    'Accuracy': 'accuracy',
+    'Cost (USD)': 'cost',
+    'Runs': 'runs',
+    'Traces': 'trace_url',
+}
+
+COLUMNS = ['benchmark', 'benchmark_title', 'rank', 'scaffold', 'model', 'verified',
+           'accuracy', 'accuracy_low', 'accuracy_high', 'cost', 'cost_low', 'cost_high',
+           'runs', 'trace_url', 'trace_file']
+
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+_INTERVAL = re.compile(r'\(\s*-\s*(\d+(?:\.\d+)?)\s*/\s*\+\s*(\d+(?:\.\d+)?)\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _text(element) -> str:
+    return _WHITESPACE.sub(' ', element.text_content()).strip()
+
+
+def header_label(th) -> str:
+    '''
+    Visible label of a header cell; tooltip headers wrap it in span.cursor-help
+    next to the (hidden) tooltip text.
+    '''
+    label = th.xpath('./span[contains(@class, "cursor-help")]')
+    return _text(label[0] if label else th)
+
+
+def parse_number(text: str):
+    '''
+    First number in a cell ("51.11%", "$1,412.42"), or None.
+    '''
+    match = _NUMBER.search(text.replace(',', '').replace('$', ''))
+    return float(match.group()) if match else None
+
+
+def parse_interval(text: str):
+    '''
+    (value, low, high) from "74.55% (-0.00/+0.00)"; low/high equal value when no interval is shown.
+    '''
+    value = parse_number(_INTERVAL.sub('', text))
+    match = _INTERVAL.search(text.replace(',', ''))
+    if value is None or match is None:
+        return value, value, value
+    return value, round(value - float(match.group(1)), 4), round(value + float(match.group(2)), 4)
+
+
+def trace_file(url):
+    '''
+    File name of a trace download URL, e.g. corebench_hard_coreagent_1754492675_UPLOAD.zip.
+    '''
+    if not url:
+        return None
+    return unquote(os.path.basename(urlparse(url).path)) or None
+
+
+def parse_leaderboard(content, benchmark: str = '') -> list[dict]:
+    '''
+    Rows of the leaderboard table in one saved page.
+    '''
+    root = lxml_html.fromstring(content)
+    title = root.xpath('//h3')
+    benchmark_title = _text(title[0]).removesuffix(' Leaderboard') if title else ''
+    table = root.xpath('//table')
+    if not table:
+        return []
+    table = table[0]
+    headers = [header_label(th) for th in table.xpath('./thead//th')]
+    columns = [HEADER_COLUMNS.get(h, re.sub(r'\W+', '_', h.lower()).strip('_')) for h in headers]
+
+    rows = []
+    for tr in table.xpath('./tbody/tr'):
+        cells = tr.xpath('./td')
+        if len(cells) != len(columns):
+            continue
+        row = {'benchmark': benchmark, 'benchmark_title': benchmark_title}
+        for column, td in zip(columns, cells):
+            text = _text(td)
+            if column == 'rank':
+                row['rank'] = int(parse_number(text)) if parse_number(text) is not None else None
+            elif column == 'scaffold':
+                row['scaffold'] = text.replace('Pareto optimal', '').strip()
+            elif column == 'model':
+                models = [_text(a) for a in td.xpath('.//a')]
+                row['model'] = ', '.join(models) if models else text
+            elif column == 'verified':
+                row['verified'] = bool(td.xpath('.//span[contains(@class, "text-green-600")]'))
+            elif column in ('accuracy', 'cost'):
+                row[column], row[f'{column}_low'], row[f'{column}_high'] = parse_interval(text)
+            elif column == 'runs':
+                row['runs'] = int(parse_number(text)) if parse_number(text) is not None else None
+            elif column == 'trace_url':
+                links = td.xpath('.//a/@href')
+                row['trace_url'] = links[0] if links else None
+                row['trace_file'] = trace_file(row['trace_url'])
+            else:
+                row[column] = parse_number(text)
+        rows.append(row)
+    return rows
+
+
+def parse_page(path) -> list[dict]:
+    path = Path(path)
+    with open(path, 'rb') as f:
+        return parse_leaderboard(f.read(), benchmark=path.stem)
+
+
+def ingest_directory(pages_dir, workers=None) -> pd.DataFrame:
+    '''
+    One typed table with the rows of every *.html page in pages_dir.
+    '''
+    pages = sorted(Path(pages_dir).glob('*.html'))
+    with ThreadPoolExecutor(max_workers=workers or min(len(pages), os.cpu_count() or 1) or 1) as pool:
+        rows = [row for page_rows in pool.map(parse_page, pages) for row in page_rows]
+    df = pd.DataFrame(rows)
+    extra = [col for col in df.columns if col not in COLUMNS]
+    df = df.reindex(columns=COLUMNS + extra)
+    return df.astype({
+        'rank': 'Int64', 'runs': 'Int64', 'verified': 'boolean',
+        'accuracy': float, 'accuracy_low': float, 'accuracy_high': float,
+        'cost': float, 'cost_low': float, 'cost_high': float,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parse saved HAL leaderboard pages into one table')
+    parser.add_argument('pages_dir', type=str, nargs='?', default=str(Path(__file__).parent / 'pages'), help='Directory of saved leaderboard pages (default: leaderboard/pages)')
+    parser.add_argument('--output', type=str, default='result/leaderboard.csv', help='Output CSV (default: result/leaderboard.csv)')
+    parser.add_argument('--workers', type=int, default=None, help='Parser threads (default: one per page, up to CPU count)')
+    args = parser.parse_args()
+
+    start = time.time()
+    df = ingest_directory(args.pages_dir, workers=args.workers)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    df.to_csv(args.output, index=False)
+    print(f"{len(df)} rows from {df['benchmark'].nunique() if len(df) else 0} leaderboards in {time.time() - start:.2f}s, saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
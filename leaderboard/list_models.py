@@ -1,75 +1,60 @@
-import pandas as pd
-import glob
-import os
+"""
+List the unique models of the leaderboard CSVs, grouped by base model
+(without the High/Low/Medium reasoning effort).
+
+Only the scaffold and model columns are read (halcollect.inventory).
+"""
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from halcollect.inventory import inventory
+
 
 def extract_models_from_csvs():
-    """Extract all unique models from CSV files in the current directory."""
-    
-    # Find all CSV files in the current directory
-    csv_files = glob.glob("*.csv")
-    
+    """Extract all unique models from the leaderboard CSV files."""
+    pairs = inventory(None, resmat_dir=None, leaderboard_dir=Path(__file__).parent, rubrics_dir=None)['leaderboard_pairs']
+
     all_models = set()
-    
-    for csv_file in csv_files:
+    for name, file_pairs in pairs.items():
+        models = sorted({model for _, model in file_pairs})
         print(f"\n{'='*60}")
-        print(f"Processing: {csv_file}")
+        print(f"Processing: {name}")
         print(f"{'='*60}")
-        
-        try:
-            df = pd.read_csv(csv_file)
-            
-            # Try different column names that might contain model information
-            model_columns = [col for col in df.columns if 'model' in col.lower() or 'primary' in col.lower()]
-            
-            if model_columns:
-                # Use the first matching column
-                model_col = model_columns[0]
-                models = df[model_col].dropna().unique()
-                
-                print(f"Found {len(models)} unique models in column '{model_col}':")
-                for model in sorted(models):
-                    print(f"  - {model}")
-                    all_models.add(model)
-            else:
-                print("No model column found")
-                
-        except Exception as e:
-            print(f"Error processing {csv_file}: {e}")
-    
+        print(f"Found {len(models)} unique models:")
+        for model in models:
+            print(f"  - {model}")
+        all_models.update(models)
+
     print(f"\n{'='*60}")
     print(f"ALL UNIQUE MODELS ACROSS ALL FILES ({len(all_models)} total)")
     print(f"{'='*60}")
     for model in sorted(all_models):
         print(f"  - {model}")
-    
-    # Extract base model names (removing variations like High, Low, Medium)
-    import re
+
+    # Group variations: remove " (High|Low|Medium)" before the date
     base_models = {}
     for model in all_models:
-        # Remove common variation suffixes and parentheses content for grouping
-        # Pattern: remove " (High|Low|Medium)" before the date
         base_name = re.sub(r'\s+(High|Low|Medium)\s+\(', ' (', model)
-        
-        if base_name not in base_models:
-            base_models[base_name] = []
-        base_models[base_name].append(model)
-    
+        base_models.setdefault(base_name, []).append(model)
+
     print(f"\n{'='*60}")
     print(f"UNIQUE BASE MODELS ({len(base_models)} total)")
     print(f"{'='*60}")
-    for base_name in sorted(base_models.keys()):
-        variations = sorted(base_models[base_name])
+    for base_name in sorted(base_models):
         print(f"\n{base_name}:")
-        for variation in variations:
+        for variation in sorted(base_models[base_name]):
             print(f"  - {variation}")
-    
+
     print(f"\n{'='*60}")
     print(f"SUMMARY")
     print(f"{'='*60}")
     print(f"Total unique model variations: {len(all_models)}")
     print(f"Total unique base models: {len(base_models)}")
-    
+
     return sorted(all_models)
 
+
 if __name__ == "__main__":
     models = extract_models_from_csvs()
@@ -0,0 +1,149 @@
+"""
+Reconcile leaderboard entries with local traces and the result matrix.
+
+Leaderboard rows (leaderboard/ingest.py) are joined to local traces by trace
+file stem (falling back to the trace's run_id), and local traces to result
+matrix rows by (benchmark_name, test_taker_id). Trace headers come from the
+cached halcollect catalog, so this is a single pass without parsing traces.
+
+Status of each row:
+    ok       on the leaderboard, present locally and reflected in the result matrix
+    missing  on the leaderboard but not in the traces directory (fetch it)
+    stale    present locally but absent from the result matrix, or modified after
+             the matrix was written (recompute it)
+    extra    present locally but not on the leaderboard
+
+Usage:
+    python leaderboard/reconcile.py
+    python leaderboard/reconcile.py --leaderboard result/leaderboard.csv --traces_dir traces --matrix result/result_matrix.csv
+"""
+import os
+import re
+import sys
+import argparse
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from halcollect.catalog import TraceCatalog
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+from canonical import canonical_test_taker
+
+STATUSES = ['ok', 'missing', 'stale', 'extra']
+
+_STEM_SUFFIX = re.compile(r'(_UPLOAD)?(\.(json|zip|enc|gz))*$')
+
+
+def trace_stem(file_name) -> str:
+    '''
+    Run stem shared by the leaderboard download and the local trace, e.g.
+    corebench_hard_coreagent_1754492675_UPLOAD.zip -> corebench_hard_coreagent_1754492675.
+    '''
+    if not isinstance(file_name, str) or not file_name:
+        return ''
+    return _STEM_SUFFIX.sub('', os.path.basename(file_name))
+
+
+def matrix_test_takers(matrix_path) -> tuple[set, float]:
+    '''
+    (benchmark_name, test_taker_id) pairs present in result_matrix.csv and the
+    time it was written (None when it does not exist).
+    '''
+    if not matrix_path or not os.path.isfile(matrix_path):
+        return set(), None
+    runs = pd.read_csv(matrix_path, usecols=['benchmark_name', 'agent_name', 'model_name'])
+    pairs = {(benchmark, canonical_test_taker(agent, model))
+             for benchmark, agent, model in runs.itertuples(index=False)}
+    return pairs, os.path.getmtime(matrix_path)
+
+
+def reconcile(leaderboard: pd.DataFrame, traces: list[dict], matrix_pairs: set, matrix_mtime=None) -> pd.DataFrame:
+    '''
+    One row per leaderboard entry plus one per local trace not on the leaderboard.
+    traces are TraceCatalog entries.
+    '''
+    by_stem = {trace_stem(trace['file_name']): trace for trace in traces}
+    by_run_id = {trace['run_id']: trace for trace in traces if trace['run_id']}
+
+    def local_status(trace):
+        test_taker_id = canonical_test_taker(trace['agent_name'], trace['model_name'])
+        in_matrix = (trace['benchmark_name'], test_taker_id) in matrix_pairs
+        modified = matrix_mtime is not None and trace['mtime_ns'] / 1e9 > matrix_mtime
+        return test_taker_id, in_matrix, ('ok' if in_matrix and not modified else 'stale')
+
+    rows = []
+    matched = set()
+    for entry in leaderboard.to_dict('records'):
+        stem = trace_stem(entry.get('trace_file'))
+        trace = by_stem.get(stem) or by_run_id.get(stem)
+        row = {
+            'benchmark': entry.get('benchmark'),
+            'scaffold': entry.get('scaffold'),
+            'model': entry.get('model'),
+            'trace_file': entry.get('trace_file'),
+            'stem': stem,
+            'local_file': None,
+            'run_id': None,
+            'test_taker_id': None,
+            'in_matrix': False,
+            'status': 'missing',
+        }
+        if trace is not None:
+            matched.add(trace['file_name'])
+            test_taker_id, in_matrix, status = local_status(trace)
+            row.update(local_file=trace['file_name'], run_id=trace['run_id'], test_taker_id=test_taker_id,
+                       in_matrix=in_matrix, status=status)
+        rows.append(row)
+
+    for trace in traces:
+        if trace['file_name'] in matched:
+            continue
+        test_taker_id, in_matrix, _ = local_status(trace)
+        rows.append({
+            'benchmark': trace['benchmark_name'],
+            'scaffold': trace['agent_name'],
+            'model': trace['model_name'],
+            'trace_file': None,
+            'stem': trace_stem(trace['file_name']),
+            'local_file': trace['file_name'],
+            'run_id': trace['run_id'],
+            'test_taker_id': test_taker_id,
+            'in_matrix': in_matrix,
+            'status': 'extra',
+        })
+    return pd.DataFrame(rows, columns=['benchmark', 'scaffold', 'model', 'trace_file', 'stem', 'local_file',
+                                       'run_id', 'test_taker_id', 'in_matrix', 'status'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconcile leaderboard entries with local traces and the result matrix')
+    parser.add_argument('--leaderboard', type=str, default='result/leaderboard.csv', help='Output of leaderboard/ingest.py (default: result/leaderboard.csv)')
+    parser.add_argument('--traces_dir', type=str, default='traces', help='Local traces directory (default: traces)')
+    parser.add_argument('--matrix', type=str, default='result/result_matrix.csv', help='result_matrix.csv from compile_traces.py (default: result/result_matrix.csv)')
+    parser.add_argument('--output', type=str, default='result/leaderboard_reconciliation.csv', help='Output CSV (default: result/leaderboard_reconciliation.csv)')
+    args = parser.parse_args()
+
+    leaderboard = pd.read_csv(args.leaderboard)
+    traces = TraceCatalog(args.traces_dir).entries()
+    matrix_pairs, matrix_mtime = matrix_test_takers(args.matrix)
+
+    index = reconcile(leaderboard, traces, matrix_pairs, matrix_mtime)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    index.to_csv(args.output, index=False)
+
+    counts = index['status'].value_counts()
+    print(' '.join(f"{status}={counts.get(status, 0)}" for status in STATUSES))
+    for status in ['missing', 'stale']:
+        names = index.loc[index['status'] == status, 'trace_file' if status == 'missing' else 'local_file']
+        if len(names):
+            print(f"\n{status}:")
+            for name in names:
+                print(f"  {name}")
+    print(f"\nSaved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,7 +25,7 @@ from pathlib import Path
 
 # Add tools to path for shared naming utilities
 sys.path.insert(0, str(Path(__file__).parent / 'tools'))
-from naming import generate_test_taker_id
+from canonical import canonical_test_takers
 
 
 def load_data():
@@ -88,6 +88,9 @@ def match_rubrics_to_result_matrix(rubrics, transcript, result_matrix_orig, resu
     
     matched_count = rubrics_with_transcript['benchmark_id_transcript'].notna().sum()
     print(f"    Matched {matched_count}/{len(rubrics)} rubrics with transcript")
+    if matched_count == 0 and len(rubrics) > 0:
+        raise SystemExit("No rubric agent_run_id matches output/transcripts.csv. The rubrics use Docent's ids; "
+                         "put them in output/docent_ids.csv (agent_run_id, run_id, task_id) and rerun build_transcripts.py")
     
     # Use model from transcript as authoritative source (it's cleaned in compile_traces)
     rubrics_with_transcript['model_final'] = rubrics_with_transcript['model_transcript'].fillna(
@@ -129,9 +132,8 @@ def match_rubrics_to_result_matrix(rubrics, transcript, result_matrix_orig, resu
     # Solution: We need to extract the effort from the rubric's model name and match exactly.
     
     print(f"  Generating test_taker_id for result_matrix rows...")
-    result_matrix_orig['test_taker_id'] = result_matrix_orig.apply(
-        lambda row: generate_test_taker_id(row['agent_name'], row['model_name']),
-        axis=1
+    result_matrix_orig['test_taker_id'] = canonical_test_takers(
+        result_matrix_orig['agent_name'], result_matrix_orig['model_name']
     )
     
     # Step 3: For each rubric, find the matching row in result_matrix_orig
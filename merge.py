@@ -5,22 +5,17 @@ from pathlib import Path
 
 # Add tools to path for shared naming utilities
 sys.path.insert(0, str(Path(__file__).parent / 'tools'))
-from naming import generate_test_taker_id
+from canonical import canonical_test_takers
 
 # Load the dataset
 # Ensure the directory 'result' exists or update path as needed
 file_path = 'result/result_matrix.csv' 
 df = pd.read_csv(file_path)
 
-def process_row(row):
-    """
-    Generates the unique test_taker_id using format: scaffold:model_effort
-    """
-    return generate_test_taker_id(row['agent_name'], row['model_name'])
-
 # --- Execution ---
 
-df['test_taker_id'] = df.apply(process_row, axis=1)
+# Unique test_taker_id in format scaffold:model_effort (see tools/canonical.py)
+df['test_taker_id'] = canonical_test_takers(df['agent_name'], df['model_name'])
 
 # Select columns to keep (ID + numeric benchmarks)
 numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
@@ -0,0 +1,231 @@
+"""
+Render every benchmark, result and rubric visualization in one go.
+
+The inputs (result_matrix.csv, result_matrix_merged.csv, the rubric matrices and
+all_benchmarks_merged.csv) are loaded once and handed read-only to a process pool,
+which renders the figures concurrently. The hash of each figure's input slice is
+kept in a manifest next to the outputs, so figures whose data did not change since
+the last run are skipped.
+
+Usage:
+    python render_all.py
+    python render_all.py --rubric_dataset hal-paper-analysis/qualitative/results/rubrics/all_benchmarks_merged.csv
+    python render_all.py --workers 8 --force
+"""
+
+import os
+import json
+import hashlib
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')
+
+import numpy as np
+import pandas as pd
+
+MANIFEST_NAME = '.render_manifest.json'
+
+# Inputs shared with the worker processes. Filled in the parent before the pool
+# is forked (or by the pool initializer on platforms without fork).
+_DATA = {}
+
+
+def _init_worker(data):
+    _DATA.update(data)
+
+
+def load_inputs(args) -> dict:
+    '''
+    Loads every input of the render step once. Missing inputs are skipped.
+    '''
+    data = {}
+    result_matrix_path = os.path.join(args.output, 'result_matrix.csv')
+    if os.path.isfile(result_matrix_path):
+        data['result_matrix'] = pd.read_csv(result_matrix_path)
+        print(f"Loaded {result_matrix_path}: {data['result_matrix'].shape}")
+
+    merged_path = os.path.join(args.output, 'result_matrix_merged.csv')
+    if os.path.isfile(merged_path):
+        data['merged'] = pd.read_csv(merged_path).set_index('test_taker_id')
+        print(f"Loaded {merged_path}: {data['merged'].shape}")
+
+    from analysis import rubric_types
+    data['rubric_matrices'] = {}
+    for rubric_type in rubric_types:
+        rubric_file = os.path.join(args.rubrics_dir, f'rubrics_matrix_{rubric_type}.csv')
+        if os.path.isfile(rubric_file):
+            data['rubric_matrices'][rubric_type] = pd.read_csv(rubric_file).set_index('test_taker_id')
+            print(f"Loaded {rubric_file}")
+
+    if args.rubric_dataset and os.path.isfile(args.rubric_dataset):
+        rubric_dataset = pd.read_csv(args.rubric_dataset)
+        rubric_dataset['task_column'] = rubric_dataset['benchmark_id'] + '.' + rubric_dataset['task_id']
+        data['rubric_dataset'] = rubric_dataset
+        print(f"Loaded {args.rubric_dataset}: {rubric_dataset.shape}")
+    return data
+
+
+def frame_hash(*frames) -> str:
+    '''
+    Content hash of one or more DataFrames/arrays, including labels.
+    '''
+    h = hashlib.sha1()
+    for frame in frames:
+        if frame is None:
+            h.update(b'none')
+        elif isinstance(frame, pd.DataFrame):
+            h.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+            h.update(repr(list(frame.columns)).encode())
+        else:
+            h.update(np.asarray(frame).tobytes())
+    return h.hexdigest()
+
+
+def benchmark_slice(df: pd.DataFrame, benchmark_name: str) -> pd.DataFrame:
+    task_columns = [col for col in df.columns if col.startswith(f"{benchmark_name}.")]
+    return df.loc[df['benchmark_name'] == benchmark_name, ['benchmark_name', 'agent_name'] + task_columns]
+
+
+def rubric_slice(df: pd.DataFrame, rubric_name: str) -> pd.DataFrame:
+    return df[['model', 'task_column', rubric_name]]
+
+
+def build_jobs(data: dict, args) -> list[dict]:
+    '''
+    Lists every figure that can be rendered from the loaded inputs together with
+    the hash of the slice it depends on.
+    '''
+    jobs = []
+
+    if 'result_matrix' in data:
+        df = data['result_matrix']
+        for benchmark_name in sorted(df['benchmark_name'].dropna().unique()):
+            jobs.append({
+                'kind': 'benchmark',
+                'key': benchmark_name,
+                'output': os.path.join(args.output, f"{benchmark_name}_matrix.png"),
+                'hash': frame_hash(benchmark_slice(df, benchmark_name)),
+            })
+
+    if 'merged' in data:
+        from analysis import compute_fixed_order
+        order = compute_fixed_order(data['merged'])
+        order_hash = frame_hash(*[o if o is not None else np.array([]) for o in order[:2]])
+        jobs.append({
+            'kind': 'clustered',
+            'key': None,
+            'order': order,
+            'output': os.path.join(args.output, 'response_matrix_visualization.pdf'),
+            'hash': frame_hash(data['merged']) + order_hash,
+        })
+        for rubric_type, rubric_df in data['rubric_matrices'].items():
+            jobs.append({
+                'kind': 'clustered',
+                'key': rubric_type,
+                'order': order,
+                'output': os.path.join(args.output, f'rubrics_{rubric_type}_visualization.pdf'),
+                'hash': frame_hash(rubric_df) + order_hash,
+            })
+
+    if 'rubric_dataset' in data:
+        from analyze_rubric import rubric_names
+        df = data['rubric_dataset']
+        for rubric_name in rubric_names:
+            if rubric_name not in df.columns:
+                continue
+            jobs.append({
+                'kind': 'rubric',
+                'key': rubric_name,
+                'output': os.path.join(args.rubric_output, f"{rubric_name}_matrix.png"),
+                'hash': frame_hash(rubric_slice(df, rubric_name)),
+            })
+    return jobs
+
+
+def render_job(job: dict) -> str:
+    '''
+    Renders a single figure from the shared inputs. Runs inside a worker process.
+    '''
+    kind, key = job['kind'], job['key']
+    if kind == 'benchmark':
+        from compile_traces import plot_benchmark_matrix
+        df = benchmark_slice(_DATA['result_matrix'], key)
+        plot_benchmark_matrix(df, key, os.path.dirname(job['output']))
+    elif kind == 'clustered':
+        from analysis import visualize_response_matrix_clustered
+        df = _DATA['merged'] if key is None else _DATA['rubric_matrices'][key]
+        row_order, col_order, col_display = job['order']
+        visualize_response_matrix_clustered(df, filename=job['output'], row_order=row_order,
+                                            col_order=col_order, col_display=col_display)
+    elif kind == 'rubric':
+        from analyze_rubric import plot_matrix_single_rubric
+        os.makedirs(os.path.dirname(job['output']), exist_ok=True)
+        plot_matrix_single_rubric(_DATA['rubric_dataset'], key, os.path.dirname(job['output']))
+    else:
+        raise ValueError(f"Unknown figure kind: {kind}")
+    return job['output']
+
+
+def load_manifest(path: str) -> dict:
+    if not os.path.isfile(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def render_all(args):
+    data = load_inputs(args)
+    jobs = build_jobs(data, args)
+    if not jobs:
+        print("Nothing to render. Run compile_traces.py --build_matrix and merge.py first.")
+        return
+
+    manifest_path = os.path.join(args.output, MANIFEST_NAME)
+    manifest = {} if args.force else load_manifest(manifest_path)
+    pending = [job for job in jobs
+               if manifest.get(job['output']) != job['hash'] or not os.path.isfile(job['output'])]
+    print(f"{len(jobs)} figures, {len(jobs) - len(pending)} unchanged, {len(pending)} to render")
+    if not pending:
+        return
+
+    # Fork lets the workers read the parent's DataFrames without copying them.
+    # Elsewhere each worker gets one copy through the initializer.
+    if 'fork' in mp.get_all_start_methods():
+        _DATA.update(data)
+        pool = ProcessPoolExecutor(max_workers=args.workers, mp_context=mp.get_context('fork'))
+    else:
+        pool = ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker, initargs=(data,))
+
+    with pool:
+        futures = {pool.submit(render_job, job): job for job in pending}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                future.result()
+                manifest[job['output']] = job['hash']
+            except Exception as e:
+                print(f"  Error rendering {job['output']}: {e}")
+
+    os.makedirs(args.output, exist_ok=True)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"Manifest saved to {manifest_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render all benchmark, result and rubric visualizations in parallel')
+    parser.add_argument('--output', type=str, default='./result', help='Directory with result_matrix.csv / result_matrix_merged.csv, also used for the figures (default: ./result)')
+    parser.add_argument('--rubrics_dir', type=str, default='rubrics', help='Directory with rubrics_matrix_<rubric>.csv files (default: rubrics)')
+    parser.add_argument('--rubric_dataset', type=str, default=None, help='all_benchmarks_merged.csv for the per-rubric heatmaps')
+    parser.add_argument('--rubric_output', type=str, default='plots/rubric', help='Output directory for the per-rubric heatmaps (default: plots/rubric)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Re-render every figure, ignoring the manifest')
+    args = parser.parse_args()
+    render_all(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Split trace files into per-task shards (see util/trace_shards.py).
+
+Each trace is streamed once; its logging entries are copied, undecoded, into
+one small trace-like file per weave_task_id, next to a header.json holding
+the run-level keys (config, results, raw_eval_results) and the shard index.
+Tools can then work on one task at a time, in parallel, without decoding a
+multi-GB trace. Traces whose shards are current are skipped.
+
+Usage:
+    python shard_traces.py traces --output shards
+    python shard_traces.py traces --benchmark corebench_hard --workers 4
+"""
+
+import os
+import time
+import argparse
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tqdm import tqdm
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths
+from util.trace_shards import shard_trace, read_shard_header, is_current, shard_dir_name
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split trace files into per-task shards')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='shards', help='Directory for the shard directories (default: shards)')
+    parser.add_argument('--benchmark', type=str, default=None, help='Only shard traces whose file name starts with this')
+    parser.add_argument('--workers', type=int, default=None, help='Number of traces sharded at once (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rewrite shards even when they are current')
+    args = parser.parse_args()
+
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(args.directory, args.benchmark)))
+    to_shard = [p for p in paths if args.force or not is_current(p, os.path.join(args.output, shard_dir_name(p)))]
+    print(f"{len(paths)} traces: {len(paths) - len(to_shard)} already sharded, {len(to_shard)} to shard")
+
+    start = time.time()
+    tasks = 0
+    if to_shard:
+        os.makedirs(args.output, exist_ok=True)
+        context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=args.workers, mp_context=context) as pool:
+            futures = {pool.submit(shard_trace, path, args.output, args.force): path for path in to_shard}
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Sharding traces"):
+                try:
+                    tasks += len(read_shard_header(future.result())['tasks'])
+                except Exception as e:
+                    tqdm.write(f"  Error sharding {os.path.basename(futures[future])}: {e}")
+    print(f"Wrote {tasks} task shards from {len(to_shard)} traces to {args.output} in {time.time() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Task x task or test-taker x test-taker similarity over a response or rubric matrix.
+
+Uses util/pairwise.py: pairwise-complete observations computed with masked matrix
+products, block by block, so the output can be much larger than memory. A .resmat
+is read straight from its memory-mapped int8 payload (-1 = missing), one block
+at a time.
+
+Usage:
+    python similarity.py result/result_matrix_merged.csv --axis tasks --metric phi
+    python similarity.py rubrics/rubrics_matrix_tooluse.csv --axis test_takers --metric kappa
+    python similarity.py data/resmat_binary_success_rate.resmat --axis tasks --output result/task_phi.npy
+"""
+
+import os
+import argparse
+import numpy as np
+import pandas as pd
+
+from util.pairwise import METRICS, pairwise_matrix, open_output
+from util.resmat_store import SUFFIX, open_resmat
+
+
+def load_matrix(path: str) -> tuple[np.ndarray, pd.Index, pd.Index]:
+    '''
+    Loads a test-taker x task matrix from a CSV (test_taker_id column) or a .resmat.
+    Returns (values, row labels, column labels).
+    '''
+    if path.rstrip('/').endswith(SUFFIX):
+        resmat = open_resmat(path)
+        return resmat.values, resmat.index, resmat.columns
+    df = pd.read_csv(path).set_index('test_taker_id')
+    df = df.select_dtypes(include=[np.number])
+    return df.to_numpy(dtype=float, na_value=np.nan), df.index, df.columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Pairwise similarity of tasks or test takers')
+    parser.add_argument('matrix', type=str, help='Result/rubric matrix CSV (test_taker_id rows) or a .resmat directory')
+    parser.add_argument('--axis', choices=['tasks', 'test_takers'], default='tasks', help='Compare tasks (columns) or test takers (rows)')
+    parser.add_argument('--metric', choices=METRICS, default='pearson', help='Similarity metric (default: pearson)')
+    parser.add_argument('--block_size', type=int, default=2048, help='Columns per block, bounds memory use (default: 2048)')
+    parser.add_argument('--min_periods', type=int, default=1, help='Minimum common observations per pair (default: 1)')
+    parser.add_argument('--output', type=str, default=None, help='Output path; .npy is written as a memmap, anything else as CSV')
+    args = parser.parse_args()
+
+    values, rows, columns = load_matrix(args.matrix)
+    if args.axis == 'test_takers':
+        values, labels = values.T, rows
+    else:
+        labels = columns
+    print(f"Computing {args.metric} between {len(labels)} {args.axis} over {values.shape[0]} observations")
+
+    output = args.output or os.path.join('result', f"{args.axis}_{args.metric}.csv")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    if output.endswith('.npy'):
+        out = open_output(output, len(labels))
+        pairwise_matrix(values, metric=args.metric, block_size=args.block_size,
+                        min_periods=args.min_periods, out=out, dtype=np.float32)
+        out.flush()
+        label_table = labels.to_frame(index=False)
+        if labels.nlevels == 1 and labels.name is None:
+            label_table.columns = ['label']
+        label_table.to_csv(output[:-len('.npy')] + '.labels.csv', index=False)
+    else:
+        result = pairwise_matrix(values, metric=args.metric, block_size=args.block_size,
+                                 min_periods=args.min_periods)
+        pd.DataFrame(result, index=labels, columns=labels).to_csv(output)
+    print(f"Saved {output}")
+
+
+if __name__ == "__main__":
+    main()
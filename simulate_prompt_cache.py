@@ -0,0 +1,158 @@
+"""
+Simulate provider prompt caching over the logged LLM calls of every trace.
+
+Trace costs are computed without caching. This replays each task's calls in
+started_at order under a cache policy (util/prompt_cache.py) and reports how
+many prompt tokens would have been served from the cache and what the prompt
+spend would have been.
+
+    output/prompt_cache.csv   one row per (run, task): prompt, cached and written tokens,
+                              effective prompt tokens and, with --prices, prompt cost
+                              without and with caching (cached tokens at the table's
+                              cached_prompt price when it has one, else read_multiplier)
+
+Traces are scanned in parallel. Rows computed with the same cache rules are
+reused for traces that did not change.
+
+Usage:
+    python simulate_prompt_cache.py traces
+    python simulate_prompt_cache.py traces --preset anthropic --ttl 3600 --prices prices.json
+"""
+
+import os
+import json
+import time
+import argparse
+from datetime import datetime
+from functools import partial
+
+import pandas as pd
+
+from compile_traces import trace_paths_from_dir, dedupe_trace_paths, clean_model_name
+from util.trace_io import read_trace_header, iter_logging_spans, entry_task_id
+from util.trace_table import TRACE_KEY_COLUMNS, trace_stat, read_previous, update_trace_table
+from util.costs import entry_usage, load_prices, model_price, price_cost
+from util.prompt_cache import PRESETS, CacheRules, PrefixChainer, call_messages, simulate_calls, effective_prompt_tokens
+
+COLUMNS = ['benchmark_name', 'agent_name', 'model_name', 'run_id', 'task_id', 'n_calls', 'prompt_tokens',
+           'cached_tokens', 'written_tokens', 'effective_prompt_tokens', 'prompt_cost', 'cached_prompt_cost',
+           'cache_rules'] + TRACE_KEY_COLUMNS
+
+
+def _timestamp(value) -> float:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except (AttributeError, ValueError):
+        return float('inf')
+
+
+def cached_prompt_cost(prices: dict, model: str, totals: dict, rules: CacheRules):
+    '''
+    Prompt cost with caching. Cache reads use the model's cached_prompt price
+    when the table has one and read_multiplier otherwise; writes always use
+    write_multiplier.
+    '''
+    price = model_price(prices, model)
+    if price is None or 'cached_prompt' not in price:
+        return price_cost(prices, model, effective_prompt_tokens(totals, rules), 0)
+    cached = totals['cached_tokens']
+    written = totals['written_tokens']
+    uncached = totals['prompt_tokens'] - cached - written + written * rules.write_multiplier
+    return price_cost(prices, model, uncached + cached, 0, cached=cached)
+
+
+def scan_prompt_cache(path: str, rules: CacheRules, prices: dict = None) -> list[dict]:
+    '''
+    Per-task cache simulation rows of one trace.
+    '''
+    stat = trace_stat(path)
+    header = read_trace_header(path)
+    config = header.get('config', {}) or {}
+    run_model = (config.get('agent_args', {}) or {}).get('model_name', '')
+
+    tasks, chainers = {}, {}
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            entry = json.loads(f.read(end - start))
+            task_id = entry_task_id(entry)
+            if task_id is None:
+                continue
+            hashes, chars = chainers.setdefault(task_id, PrefixChainer())(call_messages(entry))
+            usage = entry_usage(entry)
+            prompt = sum(u['prompt_tokens'] for u in usage) if usage else (chars[-1] // 4 if chars else 0)
+            model = next((u['model'] for u in usage if u['model']), run_model)
+            tasks.setdefault(task_id, []).append({'time': _timestamp(entry.get('started_at')), 'hashes': hashes,
+                                                  'chars': chars, 'prompt_tokens': prompt, 'model': model})
+
+    rows = []
+    for task_id, calls in sorted(tasks.items()):
+        totals = simulate_calls(calls, rules)
+        effective = effective_prompt_tokens(totals, rules)
+        prompt_cost = price_cost(prices or {}, calls[0]['model'], totals['prompt_tokens'], 0)
+        rows.append({
+            'benchmark_name': config.get('benchmark_name', ''),
+            'agent_name': config.get('agent_name', ''),
+            'model_name': clean_model_name(run_model),
+            'run_id': config.get('run_id', ''),
+            'task_id': task_id,
+            'n_calls': len(calls),
+            **totals,
+            'effective_prompt_tokens': effective,
+            'prompt_cost': prompt_cost,
+            'cached_prompt_cost': None if prompt_cost is None else cached_prompt_cost(prices, calls[0]['model'], totals, rules),
+            'cache_rules': repr(rules),
+            **stat,
+        })
+    return rows
+
+
+def simulate_prompt_cache(traces_dir: str, output_dir: str, rules: CacheRules, workers=None, full=False,
+                          prices_path=None) -> pd.DataFrame:
+    paths = dedupe_trace_paths(sorted(trace_paths_from_dir(traces_dir)))
+    csv_path = os.path.join(output_dir, 'prompt_cache.csv')
+    previous = pd.DataFrame(columns=COLUMNS) if full else read_previous(csv_path, COLUMNS, dtype={'task_id': str})
+    # Results of other cache rules are recomputed
+    previous = previous[previous['cache_rules'] == repr(rules)]
+    scan = partial(scan_prompt_cache, rules=rules, prices=load_prices(prices_path))
+    df = update_trace_table(paths, scan, previous, COLUMNS, workers=workers, desc="Replaying calls")
+    df = df.sort_values(['trace_file', 'task_id'], kind='stable').reset_index(drop=True)
+
+    os.makedirs(output_dir, exist_ok=True)
+    df.to_csv(csv_path, index=False)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate prompt-prefix caching over trace LLM calls')
+    parser.add_argument('directory', type=str, nargs='?', default='traces', help='Directory containing trace JSON files (default: traces)')
+    parser.add_argument('--output', type=str, default='./output', help='Directory for prompt_cache.csv (default: ./output)')
+    parser.add_argument('--preset', type=str, default='openai', choices=list(PRESETS), help='Cache policy to start from (default: openai)')
+    parser.add_argument('--min_tokens', type=int, default=None, help='Minimum cacheable prefix in tokens')
+    parser.add_argument('--granularity', type=int, default=None, help='Cached tokens are rounded down to a multiple of this')
+    parser.add_argument('--ttl', type=float, default=None, help='Seconds a cache entry lives after its last use')
+    parser.add_argument('--read_multiplier', type=float, default=None, help='Price of a cached prompt token relative to an uncached one')
+    parser.add_argument('--write_multiplier', type=float, default=None, help='Price of a prompt token written to the cache relative to an uncached one')
+    parser.add_argument('--prices', type=str, default=None, help='JSON price table (USD per million tokens, see util/costs.py)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--full', action='store_true', help='Rescan every trace instead of reusing unchanged ones')
+    args = parser.parse_args()
+
+    rules = CacheRules.preset(args.preset, min_tokens=args.min_tokens, granularity=args.granularity, ttl=args.ttl,
+                              read_multiplier=args.read_multiplier, write_multiplier=args.write_multiplier)
+    print(rules)
+    start = time.time()
+    df = simulate_prompt_cache(args.directory, args.output, rules, workers=args.workers, full=args.full,
+                               prices_path=args.prices)
+    print(f"{len(df)} tasks from {df['trace_file'].nunique()} traces in {time.time() - start:.2f}s, saved to {args.output}")
+    if df.empty:
+        return
+
+    summary = df.groupby(['benchmark_name', 'model_name'])[['prompt_tokens', 'cached_tokens', 'effective_prompt_tokens']].sum()
+    summary['cached_share'] = summary['cached_tokens'] / summary['prompt_tokens']
+    summary['prompt_cost_ratio'] = summary['effective_prompt_tokens'] / summary['prompt_tokens']
+    print(summary.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
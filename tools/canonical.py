@@ -0,0 +1,222 @@
+"""
+Canonical model, scaffold and test taker ids, resolved through a reviewed table.
+
+Raw strings are canonicalized with the rules in naming.py and recorded in
+canonical_names.csv next to this file:
+
+    kind,name,model,canonical,reviewed
+    model,gpt-4.1-2025-04-14,,gpt_4_1_20250414,1
+    scaffold,HAL Generalist Agent,,hal_generalist_agent,1
+    test_taker,HAL Generalist Agent,o3-2025-04-16 high,hal_generalist_agent:o3_20250416_high,0
+
+(model is only used by test_taker rows, whose id depends on both names).
+Lookups are dictionary hits, so scripts that join on these ids agree by
+construction; edit the canonical column to override a mapping everywhere.
+Scripts only read the table: names missing from it are canonicalized with
+the rules in memory and reported on exit. The table is written only by
+--update, which adds the names found in the result matrix, the rubric CSVs
+and the leaderboard tables with reviewed=0; mark rows as reviewed once checked.
+
+Usage:
+    python tools/canonical.py              # rows per kind and rows to review
+    python tools/canonical.py --update     # add names from result/, rubrics and leaderboard
+    python tools/canonical.py --update result/result_matrix.csv
+    python tools/canonical.py --recompute  # re-run naming.py on unreviewed rows
+    python tools/canonical.py --accept     # mark every row as reviewed
+"""
+
+import os
+import sys
+import csv
+import glob
+import atexit
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from naming import get_scaffold, normalize_model_name, generate_test_taker_id
+
+ROOT = Path(__file__).parent.parent
+TABLE_PATH = Path(__file__).parent / 'canonical_names.csv'
+COLUMNS = ['kind', 'name', 'model', 'canonical', 'reviewed']
+# Scanned by --update when no files are given
+UPDATE_SOURCES = ['result/result_matrix.csv', 'hal-trait-analysis/rubrics_merged/*_merged.csv', 'leaderboard/*.csv']
+
+
+def _missing(value) -> bool:
+    return value is None or (not isinstance(value, str) and pd.isna(value)) or str(value).lower() in ('', 'nan')
+
+
+def _test_taker_id(agent_name, model_name):
+    # Empty and NaN models both mean "no model"; the id then falls back to the agent name
+    return generate_test_taker_id(agent_name, None if _missing(model_name) else model_name)
+
+
+RULES = {
+    'model': lambda name, model: normalize_model_name(name),
+    'scaffold': lambda name, model: get_scaffold(name),
+    'test_taker': _test_taker_id,
+}
+
+
+class NameTable:
+    """
+    Raw string -> canonical id table, loaded on first use. Names resolved
+    but not in the table are kept in memory only, until save().
+    """
+
+    def __init__(self, path=TABLE_PATH):
+        self.path = Path(path)
+        self._rows = None
+        self._new = set()
+
+    @property
+    def rows(self) -> dict:
+        """
+        {(kind, name, model): {'canonical': ..., 'reviewed': bool}}
+        """
+        if self._rows is None:
+            self._rows = self._read()
+        return self._rows
+
+    def _read(self) -> dict:
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            return {(row['kind'], row['name'], row['model']): {'canonical': row['canonical'],
+                                                               'reviewed': row['reviewed'] == '1'}
+                    for row in csv.DictReader(f)}
+
+    def resolve(self, kind: str, name, model='') -> str:
+        """
+        Canonical id of a raw name (and model, for test takers).
+        """
+        if not isinstance(name, str):
+            name = '' if _missing(name) else str(name)
+        model = '' if _missing(model) else str(model)
+        key = (kind, name, model)
+        row = self.rows.get(key)
+        if row is None:
+            row = {'canonical': RULES[kind](name, model), 'reviewed': False}
+            self.rows[key] = row
+            self._new.add(key)
+        return row['canonical']
+
+    def update(self, key: tuple, **changes):
+        self.rows[key].update(changes)
+        self._new.add(key)
+
+    def save(self, keep_disk_rows=True):
+        """
+        Writes the table if names were resolved or updated. By default rows
+        already on disk win, so edits made while this process ran are kept.
+        """
+        if not self._new:
+            return
+        rows = {**self.rows, **self._read()} if keep_disk_rows else self.rows
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.canonical_names', suffix='.csv')
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for (kind, name, model), row in sorted(rows.items()):
+                writer.writerow([kind, name, model, row['canonical'], int(row['reviewed'])])
+        os.replace(tmp_path, self.path)
+        self._rows = rows
+        self._new.clear()
+
+
+def names_in_csv(path) -> set:
+    """
+    (kind, name, model) keys of the names in a result matrix (agent_name,
+    model_name), rubric CSV (model) or leaderboard table (Scaffold, Primary
+    Model / Models).
+    """
+    df = pd.read_csv(path, dtype=str)
+    agent_col = next((c for c in df.columns if c in ('agent_name', 'Scaffold', 'scaffold')), None)
+    model_col = next((c for c in df.columns if c in ('model_name', 'model')
+                      or c.startswith(('Primary Model', 'Models'))), None)
+    keys = set()
+    if model_col is not None:
+        keys |= {('model', name, '') for name in df[model_col].dropna().unique()}
+    if agent_col is not None:
+        keys |= {('scaffold', name, '') for name in df[agent_col].dropna().unique()}
+        models = df[model_col] if model_col is not None else pd.Series('', index=df.index)
+        for agent, model in set(zip(df[agent_col], models.fillna(''))):
+            if not _missing(agent):
+                keys.add(('test_taker', agent, model))
+    return keys
+
+
+_TABLE = NameTable()
+
+
+@atexit.register
+def _report_new_names():
+    if _TABLE._new:
+        print(f"{len(_TABLE._new)} names are not in {TABLE_PATH.name}; "
+              f"add them with: python tools/canonical.py --update", file=sys.stderr)
+
+
+def canonical_model(model_name) -> str:
+    return _TABLE.resolve('model', model_name)
+
+
+def canonical_scaffold(agent_name) -> str:
+    return _TABLE.resolve('scaffold', agent_name)
+
+
+def canonical_test_taker(agent_name, model_name) -> str:
+    return _TABLE.resolve('test_taker', agent_name, model_name)
+
+
+def canonical_test_takers(agent_names, model_names) -> list[str]:
+    return [_TABLE.resolve('test_taker', agent, model) for agent, model in zip(agent_names, model_names)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Review the persisted canonical name table')
+    parser.add_argument('--table', type=str, default=str(TABLE_PATH), help=f'Name table (default: {TABLE_PATH})')
+    parser.add_argument('--update', type=str, nargs='*', default=None, metavar='CSV',
+                        help=f'Add the names found in these CSVs (default: {", ".join(UPDATE_SOURCES)})')
+    parser.add_argument('--recompute', action='store_true', help='Re-run the naming rules on unreviewed rows and show what changed')
+    parser.add_argument('--accept', action='store_true', help='Mark every row as reviewed')
+    args = parser.parse_args()
+
+    table = NameTable(args.table)
+    rows = table.rows
+    if args.update is not None:
+        paths = args.update or sorted(p for pattern in UPDATE_SOURCES for p in glob.glob(str(ROOT / pattern)))
+        added = 0
+        for path in paths:
+            for kind, name, model in sorted(names_in_csv(path)):
+                if (kind, name, model) not in rows:
+                    table.resolve(kind, name, model)
+                    added += 1
+        print(f"Added {added} names from {len(paths)} files")
+    if args.recompute:
+        for (kind, name, model), row in sorted(rows.items()):
+            if row['reviewed']:
+                continue
+            canonical = RULES[kind](name, model)
+            if canonical != row['canonical']:
+                print(f"{kind}: {name!r} {model!r}: {row['canonical']} -> {canonical}")
+                table.update((kind, name, model), canonical=canonical)
+    if args.accept:
+        for key, row in rows.items():
+            if not row['reviewed']:
+                table.update(key, reviewed=True)
+    table.save(keep_disk_rows=False)
+
+    kinds = sorted({kind for kind, _, _ in rows})
+    for kind in kinds:
+        pending = sorted((key, row) for key, row in rows.items() if key[0] == kind and not row['reviewed'])
+        print(f"{kind}: {sum(key[0] == kind for key in rows)} names, {len(pending)} to review")
+        for (_, name, model), row in pending:
+            print(f"    {name}{' | ' + model if model else ''} -> {row['canonical']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+'''
+Bit-packed response matrix.
+
+A response matrix cell is either "not attempted" (NaN), "incorrect" (0) or
+"correct" (1). Instead of a float64 DataFrame, BitResponseMatrix keeps two
+bitplanes per row (observed and correct), packed 64 cells per uint64 word.
+That is 2 bits per cell instead of 64, and row/column statistics become
+popcounts.
+'''
+import numpy as np
+import pandas as pd
+
+# Metadata columns of result/result_matrix.csv (see compile_traces.build_matrix)
+RESULT_MATRIX_META_COLUMNS = ['benchmark_name', 'agent_name', 'model_name']
+
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    '''
+    Number of set bits in every element of an unsigned integer array.
+    '''
+    if hasattr(np, 'bitwise_count'):  # numpy >= 2.0
+        return np.bitwise_count(words)
+    as_bytes = _POPCOUNT_TABLE[words.view(np.uint8)].reshape(words.shape + (words.itemsize,))
+    return as_bytes.sum(axis=-1, dtype=np.uint8)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    '''
+    Packs a 2D boolean array row-wise into uint64 words (rows zero-padded to 64 bits).
+    '''
+    packed = np.packbits(bits, axis=1)
+    n_words = (packed.shape[1] + 7) // 8
+    padded = np.zeros((packed.shape[0], n_words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    return padded.view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, n_cols: int) -> np.ndarray:
+    '''
+    Inverse of pack_bits: uint8 array of 0/1 with n_cols columns.
+    '''
+    words = np.ascontiguousarray(words)
+    return np.unpackbits(words.view(np.uint8), axis=-1, count=n_cols)
+
+
+class BitResponseMatrix:
+    '''
+    Test-taker x task response matrix stored as two packed bitplanes.
+
+    observed[i, j] is set when test taker i attempted task j, correct[i, j]
+    when the attempt was successful. correct is always a subset of observed.
+    Both planes are (n_rows, ceil(n_cols / 64)) uint64 arrays, so the payload
+    is 32x smaller than the equivalent float64 values.
+    '''
+
+    def __init__(self, observed: np.ndarray, correct: np.ndarray, n_cols: int,
+                 index: pd.Index, columns: pd.Index):
+        if observed.shape != correct.shape:
+            raise ValueError(f"Bitplane shapes differ: {observed.shape} != {correct.shape}")
+        if observed.shape[1] != (n_cols + 63) // 64:
+            raise ValueError(f"Bitplanes hold {observed.shape[1] * 64} columns, expected {n_cols}")
+        self.observed = observed
+        self.correct = correct
+        self.n_cols = n_cols
+        self.index = index if isinstance(index, pd.Index) else pd.Index(index)
+        self.columns = columns if isinstance(columns, pd.Index) else pd.Index(columns)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.observed.shape[0], self.n_cols)
+
+    @property
+    def nbytes(self) -> int:
+        return self.observed.nbytes + self.correct.nbytes
+
+    def __repr__(self):
+        return f"BitResponseMatrix(shape={self.shape}, nbytes={self.nbytes})"
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_array(cls, values: np.ndarray, index=None, columns=None) -> 'BitResponseMatrix':
+        '''
+        Builds the bitplanes from a float array with NaN for "not attempted".
+        Any value > 0 counts as correct.
+        '''
+        values = np.asarray(values, dtype=float)
+        n_rows, n_cols = values.shape
+        observed = ~np.isnan(values)
+        correct = observed & (np.nan_to_num(values, nan=0.0) > 0)
+        return cls(pack_bits(observed), pack_bits(correct), n_cols,
+                   index if index is not None else pd.RangeIndex(n_rows),
+                   columns if columns is not None else pd.RangeIndex(n_cols))
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, index_col: str = None) -> 'BitResponseMatrix':
+        '''
+        Builds the matrix from one of the DataFrame layouts used in this repo:
+
+        - result/result_matrix_merged.csv (merge.py, analysis.py): pass
+          index_col='test_taker_id', or a frame already indexed by it.
+        - result/result_matrix.csv (compile_traces.build_matrix): the
+          benchmark_name/agent_name/model_name columns become a MultiIndex.
+        '''
+        if index_col is not None:
+            df = df.set_index(index_col)
+        meta_columns = [col for col in RESULT_MATRIX_META_COLUMNS if col in df.columns]
+        if meta_columns:
+            df = df.set_index(meta_columns)
+        task_df = df.select_dtypes(include=[np.number])
+        return cls.from_array(task_df.to_numpy(dtype=float), task_df.index, task_df.columns)
+
+    def to_array(self) -> np.ndarray:
+        '''
+        Dense float array with NaN for "not attempted".
+        '''
+        observed = unpack_bits(self.observed, self.n_cols).astype(bool)
+        values = unpack_bits(self.correct, self.n_cols).astype(float)
+        values[~observed] = np.nan
+        return values
+
+    def to_dataframe(self) -> pd.DataFrame:
+        '''
+        Inverse of from_dataframe. For the result_matrix.csv layout the
+        metadata index is turned back into columns; for the merged layout the
+        test_taker_id index is kept (call reset_index() before to_csv).
+        '''
+        df = pd.DataFrame(self.to_array(), index=self.index, columns=self.columns)
+        if isinstance(df.index, pd.MultiIndex) and set(df.index.names) <= set(RESULT_MATRIX_META_COLUMNS):
+            return df.reset_index()
+        return df
+
+    # ------------------------------------------------------------------
+    # Selection
+    # ------------------------------------------------------------------
+
+    def take_rows(self, rows) -> 'BitResponseMatrix':
+        rows = np.asarray(rows)
+        return BitResponseMatrix(self.observed[rows], self.correct[rows], self.n_cols,
+                                 self.index[rows], self.columns)
+
+    def take_columns(self, cols) -> 'BitResponseMatrix':
+        cols = np.asarray(cols)
+        observed = unpack_bits(self.observed, self.n_cols)[:, cols]
+        correct = unpack_bits(self.correct, self.n_cols)[:, cols]
+        return BitResponseMatrix(pack_bits(observed), pack_bits(correct), observed.shape[1],
+                                 self.index, self.columns[cols])
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def _column_counts(self, plane: np.ndarray) -> np.ndarray:
+        # Column sums without unpacking: add the rows pairwise as bit-sliced
+        # counters (counters[k] holds bit k of every column's partial count),
+        # halving the number of rows per level until one row is left.
+        counters = [plane]
+        while counters[0].shape[0] > 1:
+            if counters[0].shape[0] % 2:
+                counters = [np.vstack([c, np.zeros((1, c.shape[1]), dtype=c.dtype)]) for c in counters]
+            carry = None
+            summed = []
+            for c in counters:
+                a, b = c[0::2], c[1::2]
+                if carry is None:
+                    summed.append(a ^ b)
+                    carry = a & b
+                else:
+                    a_xor_b = a ^ b
+                    summed.append(a_xor_b ^ carry)
+                    carry = (a & b) | (carry & a_xor_b)
+            summed.append(carry)
+            counters = summed
+        counts = np.zeros(self.n_cols, dtype=np.int64)
+        if plane.shape[0] == 0:
+            return counts
+        for k, c in enumerate(counters):
+            counts += unpack_bits(c[0], self.n_cols).astype(np.int64) << k
+        return counts
+
+    def row_counts(self) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        (attempted, correct) counts per test taker.
+        '''
+        return (popcount(self.observed).sum(axis=1, dtype=np.int64),
+                popcount(self.correct).sum(axis=1, dtype=np.int64))
+
+    def column_counts(self) -> tuple[np.ndarray, np.ndarray]:
+        '''
+        (attempted, correct) counts per task.
+        '''
+        return self._column_counts(self.observed), self._column_counts(self.correct)
+
+    def row_accuracy(self) -> pd.Series:
+        '''
+        Per-test-taker accuracy over attempted tasks (NaN if nothing was attempted).
+        '''
+        attempted, correct = self.row_counts()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.Series(correct / attempted, index=self.index, name='accuracy')
+
+    def column_accuracy(self) -> pd.Series:
+        '''
+        Per-task success rate over test takers that attempted it.
+        '''
+        attempted, correct = self.column_counts()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return pd.Series(correct / attempted, index=self.columns, name='accuracy')
+
+    def co_success(self, axis: int = 0, block_size: int = 4096) -> np.ndarray:
+        '''
+        Pairwise co-success counts.
+
+        axis=0: (n_rows, n_rows) matrix, number of tasks both test takers solved.
+        axis=1: (n_cols, n_cols) matrix, number of test takers that solved both tasks.
+
+        Bits are unpacked block by block and multiplied, so the unpacked data
+        held at once is bounded by two blocks of block_size rows/columns.
+        '''
+        if axis == 0:
+            n = self.shape[0]
+            result = np.empty((n, n), dtype=np.int64)
+            for start in range(0, n, block_size):
+                a = unpack_bits(self.correct[start:start + block_size], self.n_cols).astype(np.float32)
+                for start2 in range(0, n, block_size):
+                    b = unpack_bits(self.correct[start2:start2 + block_size], self.n_cols).astype(np.float32)
+                    result[start:start + block_size, start2:start2 + block_size] = a @ b.T
+            return result
+        if axis == 1:
+            n = self.n_cols
+            result = np.empty((n, n), dtype=np.int64)
+            for start in range(0, n, block_size):
+                # Columns start..start+block_size live in whole words when block_size % 64 == 0
+                a = self._unpack_column_block(start, block_size)
+                for start2 in range(0, n, block_size):
+                    b = self._unpack_column_block(start2, block_size)
+                    result[start:start + block_size, start2:start2 + block_size] = a.T @ b
+            return result
+        raise ValueError(f"axis must be 0 or 1, got {axis}")
+
+    def _unpack_column_block(self, start: int, size: int) -> np.ndarray:
+        if start % 64 or size % 64:
+            raise ValueError("Column blocks must be aligned to 64 columns")
+        stop = min(start + size, self.n_cols)
+        words = self.correct[:, start // 64:(stop + 63) // 64]
+        return unpack_bits(words, stop - start).astype(np.float32)
+
+    def co_success_pair(self, i: int, j: int) -> int:
+        '''
+        Number of tasks both test takers i and j solved: one popcount over the
+        AND of two packed rows.
+        '''
+        return int(popcount(self.correct[i] & self.correct[j]).sum())
@@ -0,0 +1,210 @@
+'''
+Vectorized bootstrap over response/rubric matrices.
+
+A batch of bootstrap replicates is represented as a weight matrix W of shape
+(n_replicates, n_items), where W[b, i] is how often item i was drawn in
+replicate b. Resampled statistics then become matrix products, e.g. the
+resampled number of correct answers of every test taker in every replicate
+is W @ correct.T. Replicates are processed in chunks (bounded memory) on a
+thread pool; numpy's matmul releases the GIL so chunks run on all cores.
+
+Items are tasks by default. Runs can be resampled as well: rows of the matrix
+are drawn with replacement within their stratum (for result_matrix.csv, the
+repeated runs of one test taker on one benchmark), the per-run sums are
+reweighted accordingly and pooled per test taker.
+'''
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def resample_weights(rng: np.random.Generator, n_replicates: int, n_items: int) -> np.ndarray:
+    '''
+    (n_replicates, n_items) multiplicity matrix of n_items draws with replacement.
+    '''
+    draws = rng.integers(0, n_items, size=(n_replicates, n_items))
+    draws += (np.arange(n_replicates) * n_items)[:, None]
+    counts = np.bincount(draws.ravel(), minlength=n_replicates * n_items)
+    return counts.reshape(n_replicates, n_items).astype(np.float32)
+
+
+def resample_within_groups(rng: np.random.Generator, n_replicates: int, groups: np.ndarray) -> np.ndarray:
+    '''
+    Like resample_weights, but rows are only drawn from their own group:
+    each group of size k gets k draws from its own members.
+    '''
+    groups = np.asarray(groups)
+    order = np.argsort(groups, kind='stable')
+    sorted_groups = groups[order]
+    starts = np.r_[0, np.flatnonzero(sorted_groups[1:] != sorted_groups[:-1]) + 1]
+    sizes = np.diff(np.r_[starts, len(groups)])
+    row_start = np.repeat(starts, sizes)
+    row_size = np.repeat(sizes, sizes)
+    n_rows = len(groups)
+    picks = row_start + (rng.random((n_replicates, n_rows)) * row_size).astype(np.int64)
+    picks = order[picks] + (np.arange(n_replicates) * n_rows)[:, None]
+    counts = np.bincount(picks.ravel(), minlength=n_replicates * n_rows)
+    return counts.reshape(n_replicates, n_rows).astype(np.float32)
+
+
+def expand_cluster_weights(weights: np.ndarray, clusters: np.ndarray) -> np.ndarray:
+    '''
+    Turns per-cluster weights (n_replicates, n_clusters) into per-row weights
+    for rows labelled with cluster positions.
+    '''
+    return weights[:, clusters]
+
+
+def percentile_interval(replicates: np.ndarray, confidence: float = 0.95) -> tuple[np.ndarray, np.ndarray]:
+    alpha = (1 - confidence) / 2
+    with np.errstate(all='ignore'):
+        lower, upper = np.nanpercentile(replicates, [100 * alpha, 100 * (1 - alpha)], axis=0)
+    return lower, upper
+
+
+def _group_matrix(groups: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    labels, positions = np.unique(groups, return_inverse=True)
+    indicator = np.zeros((len(groups), len(labels)), dtype=np.float32)
+    indicator[np.arange(len(groups)), positions] = 1.0
+    return labels, indicator
+
+
+class Bootstrap:
+    '''
+    Shared replicate generator: every statistic computed from the same
+    Bootstrap instance sees the same resampled tasks (and runs), so the
+    intervals are computed in one pass over one set of replicates.
+    '''
+
+    def __init__(self, n_tasks: int, n_replicates: int = 10000, seed: int = 0,
+                 chunk_size: int = 256, n_jobs: int = None):
+        self.n_tasks = n_tasks
+        self.n_replicates = n_replicates
+        self.chunk_size = chunk_size
+        self.n_jobs = n_jobs or os.cpu_count()
+        sizes = [min(chunk_size, n_replicates - start) for start in range(0, n_replicates, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        self.chunks = list(zip(sizes, seeds))
+
+    def map(self, statistic) -> np.ndarray:
+        '''
+        Runs statistic(rng, task_weights) on every chunk and stacks the results
+        along the replicate axis.
+        '''
+        def run(chunk):
+            size, seed = chunk
+            rng = np.random.default_rng(seed)
+            return statistic(rng, resample_weights(rng, size, self.n_tasks))
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+            results = list(pool.map(run, self.chunks))
+        return np.concatenate(results, axis=0)
+
+
+def accuracy_statistic(values: np.ndarray, run_groups: np.ndarray = None, run_strata: np.ndarray = None):
+    '''
+    Per-test-taker accuracy for a (rows x tasks) matrix with NaN for missing.
+
+    Without run_groups every row is a test taker. With run_groups (one label
+    per row) rows are runs, pooled per test taker: the estimate is the mean
+    over all of a test taker's run/task cells. Runs are resampled within
+    run_strata (one label per row, default run_groups), so that only
+    interchangeable runs (e.g. repeats on the same benchmark) are swapped.
+    Returns (labels, estimate, statistic) where statistic is meant for Bootstrap.map.
+    '''
+    if run_strata is None:
+        run_strata = run_groups
+    observed = (~np.isnan(values)).astype(np.float32)
+    correct = (np.nan_to_num(values, nan=0.0) > 0).astype(np.float32)
+    if run_groups is None:
+        labels = np.arange(values.shape[0])
+        indicator = None
+    else:
+        labels, indicator = _group_matrix(np.asarray(run_groups))
+
+    def pooled(correct_sums, observed_sums):
+        if indicator is not None:
+            correct_sums, observed_sums = correct_sums @ indicator, observed_sums @ indicator
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return correct_sums / observed_sums
+
+    estimate = pooled(correct.sum(axis=1)[None, :], observed.sum(axis=1)[None, :])[0]
+
+    def statistic(rng, task_weights):
+        correct_sums = task_weights @ correct.T
+        observed_sums = task_weights @ observed.T
+        if run_groups is not None:
+            run_weights = resample_within_groups(rng, task_weights.shape[0], run_strata)
+            correct_sums *= run_weights
+            observed_sums *= run_weights
+        return pooled(correct_sums, observed_sums)
+
+    return labels, estimate, statistic
+
+
+def flag_rate_statistic(rubric_matrices: dict[str, np.ndarray]):
+    '''
+    Overall flag rate of each rubric (flagged cells / annotated cells). All
+    matrices must share the task axis. Returns (labels, estimate, statistic).
+    '''
+    labels = list(rubric_matrices)
+    flagged = np.stack([(np.nan_to_num(m, nan=0.0) > 0).sum(axis=0) for m in rubric_matrices.values()], axis=1).astype(np.float32)
+    annotated = np.stack([(~np.isnan(m)).sum(axis=0) for m in rubric_matrices.values()], axis=1).astype(np.float32)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        estimate = flagged.sum(axis=0) / annotated.sum(axis=0)
+
+    def statistic(rng, task_weights):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (task_weights @ flagged) / (task_weights @ annotated)
+
+    return labels, estimate, statistic
+
+
+def correlation_statistic(values: np.ndarray, row_tasks: np.ndarray):
+    '''
+    Pairwise-complete Pearson correlations between the columns of values
+    (rows are annotations, e.g. the correlation.py table), resampling the
+    task each row belongs to. row_tasks gives the task position of every row.
+    Returns (pairs, estimate, statistic); pairs lists the (i, j) column pairs.
+    '''
+    n_cols = values.shape[1]
+    pairs = [(i, j) for i in range(n_cols) for j in range(i + 1, n_cols)]
+    mask = ~np.isnan(values)
+    x = np.nan_to_num(values, nan=0.0)
+    features = []
+    for i, j in pairs:
+        both = (mask[:, i] & mask[:, j]).astype(np.float64)
+        xi, xj = x[:, i] * both, x[:, j] * both
+        features.extend([both, xi, xj, xi * xi, xj * xj, xi * xj])
+    features = np.stack(features, axis=1).astype(np.float64)
+    row_tasks = np.asarray(row_tasks)
+
+    def correlations(sums):
+        sums = sums.reshape(sums.shape[0], len(pairs), 6)
+        n, sx, sy, sxx, syy, sxy = np.moveaxis(sums, -1, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sxy - sx * sy / n
+            var_x = sxx - sx * sx / n
+            var_y = syy - sy * sy / n
+            return cov / np.sqrt(var_x * var_y)
+
+    estimate = correlations(features.sum(axis=0)[None, :])[0]
+
+    def statistic(rng, task_weights):
+        return correlations(expand_cluster_weights(task_weights, row_tasks).astype(np.float64) @ features)
+
+    return pairs, estimate, statistic
+
+
+def summarize(labels, estimate: np.ndarray, replicates: np.ndarray, confidence: float = 0.95,
+              label_name: str = 'label') -> pd.DataFrame:
+    lower, upper = percentile_interval(replicates, confidence)
+    return pd.DataFrame({
+        label_name: list(labels),
+        'estimate': estimate,
+        'ci_lower': lower,
+        'ci_upper': upper,
+        'std_error': np.nanstd(replicates, axis=0),
+    })
@@ -0,0 +1,114 @@
+'''
+Token usage and cost of the LLM calls logged in raw_logging_results.
+
+Depending on the harness and provider, an entry carries its usage in
+summary.usage ({model: {prompt_tokens, completion_tokens, ...}}, written by
+weave) or in output.usage (OpenAI: prompt_tokens/completion_tokens, Anthropic:
+input_tokens/output_tokens). Costs are taken from summary.weave.costs when
+weave computed them, otherwise from a price table.
+
+A price table is a JSON file of USD per million tokens:
+
+    {"gpt-4.1-2025-04-14": {"prompt": 2.0, "completion": 8.0, "cached_prompt": 0.5}, ...}
+
+cached_prompt prices cache reads and cache_write_prompt prices Anthropic cache
+writes; both default to the prompt price.
+'''
+import sys
+import json
+from pathlib import Path
+
+# Add tools to path for shared naming utilities
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+from canonical import canonical_model
+
+
+def _int(value) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def usage_tokens(usage: dict) -> tuple[int, int, int, int]:
+    '''
+    (prompt, completion, cached prompt, cache write) tokens of a usage dict in
+    OpenAI, Anthropic or weave form. prompt includes the cached and written
+    tokens.
+    '''
+    prompt = _int(usage.get('prompt_tokens', usage.get('input_tokens')))
+    completion = _int(usage.get('completion_tokens', usage.get('output_tokens')))
+    details = usage.get('prompt_tokens_details') or usage.get('input_tokens_details') or {}
+    cached = _int(details.get('cached_tokens') if isinstance(details, dict) else 0)
+    # Anthropic reports cache reads and writes separately from (uncached) input tokens
+    cache_read = _int(usage.get('cache_read_input_tokens'))
+    cache_write = _int(usage.get('cache_creation_input_tokens'))
+    prompt += cache_read + cache_write
+    cached += cache_read
+    return prompt, completion, cached, cache_write
+
+
+def entry_usage(entry: dict) -> list[dict]:
+    '''
+    Usage of one logging entry, one dict per model it called:
+    {model, prompt_tokens, completion_tokens, cached_tokens, cache_write_tokens,
+    cost}. cost is None
+    when the entry does not carry one.
+    '''
+    summary = entry.get('summary') if isinstance(entry.get('summary'), dict) else {}
+    costs = (summary.get('weave') or {}).get('costs') or {}
+    usage = summary.get('usage')
+    if isinstance(usage, dict) and usage:
+        per_model = {model: u for model, u in usage.items() if isinstance(u, dict)}
+    else:
+        output = entry.get('output') if isinstance(entry.get('output'), dict) else {}
+        if not isinstance(output.get('usage'), dict):
+            return []
+        per_model = {output.get('model') or (entry.get('inputs') or {}).get('model') or '': output['usage']}
+
+    result = []
+    for model, usage in per_model.items():
+        prompt, completion, cached, cache_write = usage_tokens(usage)
+        cost = costs.get(model) if isinstance(costs, dict) else None
+        if isinstance(cost, dict):
+            cost = float(cost.get('prompt_tokens_total_cost') or 0) + float(cost.get('completion_tokens_total_cost') or 0)
+        else:
+            cost = None
+        result.append({'model': model, 'prompt_tokens': prompt, 'completion_tokens': completion,
+                       'cached_tokens': cached, 'cache_write_tokens': cache_write, 'cost': cost})
+    return result
+
+
+def load_prices(path) -> dict:
+    '''
+    Price table keyed by canonical model name (canonical.canonical_model).
+    '''
+    if not path:
+        return {}
+    with open(path, 'r') as f:
+        prices = json.load(f)
+    return {canonical_model(model): price for model, price in prices.items()}
+
+
+def model_price(prices: dict, model: str):
+    '''
+    Price table entry of a model, or None for an unknown model.
+    '''
+    model = model or ''
+    # Provider prefixes (openai/gpt-4.1) are not part of the priced name
+    return prices.get(canonical_model(model)) or prices.get(canonical_model(model.split('/')[-1]))
+
+
+def price_cost(prices: dict, model: str, prompt: int, completion: int, cached: int = 0, cache_write: int = 0):
+    '''
+    USD cost of a call from the price table, or None for an unknown model.
+    Cached prompt tokens use the cached_prompt price and cache writes the
+    cache_write_prompt price when there is one.
+    '''
+    price = model_price(prices, model)
+    if price is None:
+        return None
+    cached_price = price.get('cached_prompt', price['prompt'])
+    write_price = price.get('cache_write_prompt', price['prompt'])
+    return ((prompt - cached - cache_write) * price['prompt'] + cached * cached_price
+            + cache_write * write_price + completion * price['completion']) / 1e6
@@ -0,0 +1,72 @@
+'''
+Detect byte-identical files without reading them in full.
+
+Files are grouped by size; files sharing a size are compared on a hash of a few
+sampled blocks (start, end and evenly spaced in between), and only files that
+also collide on that are confirmed with a full-content hash. For traces,
+distinct files almost always differ in size, so the common case costs one
+stat() per file.
+'''
+import os
+import hashlib
+from collections import defaultdict
+
+SAMPLE_BLOCK_SIZE = 64 * 1024
+SAMPLE_BLOCKS = 8
+FULL_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def sampled_hash(path, size: int) -> str:
+    '''
+    Hash of the file size and SAMPLE_BLOCKS blocks spread over the file (the
+    whole file when it is smaller than the samples).
+    '''
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, 'rb') as f:
+        if size <= SAMPLE_BLOCK_SIZE * SAMPLE_BLOCKS:
+            digest.update(f.read())
+        else:
+            step = (size - SAMPLE_BLOCK_SIZE) // (SAMPLE_BLOCKS - 1)
+            for i in range(SAMPLE_BLOCKS):
+                f.seek(i * step)
+                digest.update(f.read(SAMPLE_BLOCK_SIZE))
+    return digest.hexdigest()
+
+
+def full_hash(path) -> str:
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(FULL_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _group_by(paths, key) -> list[list]:
+    groups = defaultdict(list)
+    for path in paths:
+        groups[key(path)].append(path)
+    return [group for group in groups.values() if len(group) > 1]
+
+
+def find_duplicates(paths) -> dict:
+    '''
+    Maps every duplicate path to the path that is kept for its content (the
+    first one in sorted order).
+    '''
+    sizes = {path: os.path.getsize(path) for path in paths}
+    duplicates = {}
+    for same_size in _group_by(sorted(paths), sizes.get):
+        for same_sample in _group_by(same_size, lambda path: sampled_hash(path, sizes[path])):
+            for same_content in _group_by(same_sample, full_hash):
+                kept = same_content[0]
+                for path in same_content[1:]:
+                    duplicates[path] = kept
+    return duplicates
+
+
+def unique_paths(paths) -> tuple[list, dict]:
+    '''
+    (paths without duplicates in their original order, find_duplicates(paths)).
+    '''
+    duplicates = find_duplicates(paths)
+    return [path for path in paths if path not in duplicates], duplicates
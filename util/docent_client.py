@@ -0,0 +1,213 @@
+'''
+Asynchronous, resumable upload of agent runs to a Docent collection.
+
+Runs are sent in batches to the Docent REST endpoint
+(POST <server_url>/<collection_id>/agent_runs, {"agent_runs": [...]}) by up to
+max_concurrency concurrent requests. The number of requests in flight adapts
+(additive increase, multiplicative decrease) to 429/5xx responses, and failed
+batches are retried with exponential backoff. Every acknowledged agent run id is
+appended to a local checkpoint, so a rerun only sends what is missing.
+'''
+import os
+import time
+import random
+import asyncio
+
+import aiohttp
+
+DEFAULT_SERVER_URL = 'https://api.docent.transluce.org/rest'
+RETRY_STATUSES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class UploadCheckpoint:
+    '''
+    Append-only file of uploaded agent run ids, one per line.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self.ids = set()
+        if path and os.path.isfile(path):
+            with open(path, 'r') as f:
+                self.ids = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, run_id) -> bool:
+        return run_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, run_ids):
+        new_ids = [run_id for run_id in run_ids if run_id not in self.ids]
+        if not new_ids:
+            return
+        self.ids.update(new_ids)
+        if self.path:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a') as f:
+                f.write(''.join(f"{run_id}\n" for run_id in new_ids))
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class AdaptiveLimiter:
+    '''
+    Concurrency window between 1 and max_concurrency: +1 after window
+    consecutive successes, halved when the server pushes back.
+    '''
+
+    def __init__(self, max_concurrency: int, initial: int = None):
+        self.max_concurrency = max_concurrency
+        self.limit = min(initial or max_concurrency, max_concurrency)
+        self.in_flight = 0
+        self.successes = 0
+        self.paused_until = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            while True:
+                delay = self.paused_until - time.monotonic()
+                if delay <= 0 and self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=delay if delay > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, throttled: bool = False, retry_after: float = None):
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self.successes = 0
+                if retry_after:
+                    self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+            else:
+                self.successes += 1
+                if self.successes >= self.limit and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self.successes = 0
+            self._condition.notify_all()
+
+
+def _run_id(run) -> str:
+    return str(run['id'] if isinstance(run, dict) else run.id)
+
+
+def _payload(run) -> dict:
+    # docent AgentRun objects are pydantic models
+    return run if isinstance(run, dict) else run.model_dump(mode='json')
+
+
+def _retry_after(response) -> float:
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+
+class AsyncDocentUploader:
+
+    def __init__(self, api_key: str, collection_id: str, server_url: str = DEFAULT_SERVER_URL,
+                 batch_size: int = 100, max_concurrency: int = 8, max_retries: int = 6,
+                 backoff: float = 1.0, max_backoff: float = 60.0, checkpoint_path: str = None,
+                 timeout: float = 300.0):
+        self.api_key = api_key
+        self.collection_id = collection_id
+        self.url = f"{server_url.rstrip('/')}/{collection_id}/agent_runs"
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.checkpoint = UploadCheckpoint(checkpoint_path)
+        self.stats = {'uploaded': 0, 'skipped': 0, 'failed': 0, 'retries': 0, 'requests': 0}
+
+    def _add(self, batch, run) -> bool:
+        '''
+        Adds run to batch unless it was already uploaded; True when the batch is full.
+        '''
+        if _run_id(run) in self.checkpoint:
+            self.stats['skipped'] += 1
+            return False
+        batch.append(run)
+        return len(batch) >= self.batch_size
+
+    async def _batches(self, runs):
+        batch = []
+        if hasattr(runs, '__aiter__'):
+            async for run in runs:
+                if self._add(batch, run):
+                    yield batch
+                    batch = []
+        else:
+            for run in runs:
+                if self._add(batch, run):
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    async def _send(self, session, limiter, batch):
+        payload = {'agent_runs': [_payload(run) for run in batch]}
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            throttled, retry_after, error = False, None, None
+            try:
+                self.stats['requests'] += 1
+                async with session.post(self.url, json=payload) as response:
+                    if response.status < 300:
+                        self.checkpoint.add(_run_id(run) for run in batch)
+                        self.stats['uploaded'] += len(batch)
+                        return True
+                    error = f"HTTP {response.status}: {(await response.text())[:200]}"
+                    if response.status not in RETRY_STATUSES:
+                        self.stats['failed'] += len(batch)
+                        print(f"  Batch of {len(batch)} rejected: {error}")
+                        return False
+                    throttled, retry_after = True, _retry_after(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                throttled, error = True, f"{type(e).__name__}: {e}"
+            finally:
+                await limiter.release(throttled=throttled, retry_after=retry_after)
+            if attempt < self.max_retries:
+                self.stats['retries'] += 1
+                delay = retry_after or min(self.max_backoff, self.backoff * 2 ** attempt) * (0.5 + random.random() / 2)
+                await asyncio.sleep(delay)
+        self.stats['failed'] += len(batch)
+        print(f"  Batch of {len(batch)} failed after {self.max_retries} retries: {error}")
+        return False
+
+    async def upload(self, runs) -> dict:
+        '''
+        Uploads the runs (dicts or docent AgentRun objects, from any iterable
+        or async iterable) that are not in the checkpoint. At most
+        2 * max_concurrency batches are buffered, so a lazy source is consumed
+        as uploads complete.
+        '''
+        start = time.time()
+        limiter = AdaptiveLimiter(self.max_concurrency)
+        headers = {'Authorization': f"Bearer {self.api_key}"}
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        pending = set()
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            async for batch in self._batches(runs):
+                pending.add(asyncio.create_task(self._send(session, limiter, batch)))
+                if len(pending) >= 2 * self.max_concurrency:
+                    _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if pending:
+                await asyncio.wait(pending)
+        elapsed = time.time() - start
+        self.stats['seconds'] = elapsed
+        self.stats['runs_per_second'] = self.stats['uploaded'] / elapsed if elapsed > 0 else 0.0
+        return dict(self.stats)
+
+
+def upload_agent_runs(runs, api_key: str, collection_id: str, **kwargs) -> dict:
+    '''
+    Synchronous wrapper around AsyncDocentUploader.upload.
+    '''
+    return asyncio.run(AsyncDocentUploader(api_key, collection_id, **kwargs).upload(runs))
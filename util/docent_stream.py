@@ -0,0 +1,249 @@
+'''
+Streaming conversion of traces into Docent agent runs.
+
+    trace reader -> per-task entries -> converter -> bounded queue -> upload batches
+
+Each stage is a generator, so at any time only one task's logging entries,
+the runs waiting in the queue and the batches in flight are in memory,
+whatever the size of the corpus. Within a trace, the byte range of every
+logging entry is indexed first (util.trace_io.iter_logging_spans) and each
+task's entries are then decoded on their own. Conversion runs in a producer
+thread, and the bounded queue blocks it while uploads are behind
+(backpressure).
+
+The default converter is DocentConverter.convert_to_docent_messages from
+hal-paper-analysis/qualitative/full_pipeline.py, called on one task's entries
+at a time, so uploads match what the full pipeline produces. converter='simple'
+selects task_transcript below instead: the longest LLM call's messages and its
+reply, with agent_run_ids derived from (run_id, task_id).
+'''
+import os
+import json
+import queue
+import asyncio
+import importlib
+import threading
+from functools import lru_cache
+from collections import defaultdict
+
+from util.trace_io import read_trace_header, iter_logging_spans, peek_task_id, agent_run_id
+from util.docent_client import AsyncDocentUploader
+
+CONVERTERS = ('docent', 'simple')
+ROLE_MAP = {'human': 'user', 'ai': 'assistant', 'developer': 'system', 'function': 'tool'}
+
+_SENTINEL = object()
+
+
+def message_text(content) -> str:
+    '''
+    Text of a message content (plain string or list of content parts).
+    '''
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for item in content:
+            if isinstance(item, dict) and 'text' in item:
+                parts.append(item['text'])
+            elif isinstance(item, str):
+                parts.append(item)
+        return '\n'.join(parts)
+    return '' if content is None else str(content)
+
+
+def normalize_messages(messages) -> list[dict]:
+    '''
+    Docent chat messages from an entry's inputs.messages. Handles OpenAI-style
+    dicts and serialized LangChain messages ([[{"kwargs": {...}}]], assistantbench).
+    '''
+    if not isinstance(messages, list):
+        return []
+    if messages and isinstance(messages[0], list):
+        messages = messages[0]
+    result = []
+    for message in messages:
+        if not isinstance(message, dict):
+            continue
+        if 'kwargs' in message:
+            message = dict(message['kwargs'], role=message['kwargs'].get('type'))
+        role = ROLE_MAP.get(message.get('role'), message.get('role')) or 'user'
+        if role not in ('system', 'user', 'assistant', 'tool'):
+            role = 'user'
+        text = message_text(message.get('content'))
+        if text:
+            result.append({'role': role, 'content': text})
+    return result
+
+
+def output_message(output):
+    '''
+    Assistant message of an entry's output (OpenAI chat completion or plain text).
+    '''
+    if isinstance(output, dict):
+        choices = output.get('choices')
+        if isinstance(choices, list) and choices and isinstance(choices[0], dict):
+            message = choices[0].get('message') or {}
+            text = message_text(message.get('content'))
+            if message.get('tool_calls'):
+                text = '\n'.join(filter(None, [text, json.dumps(message['tool_calls'])]))
+            return {'role': 'assistant', 'content': text} if text else None
+        text = message_text(output.get('content'))
+        return {'role': 'assistant', 'content': text} if text else None
+    if isinstance(output, str) and output:
+        return {'role': 'assistant', 'content': output}
+    return None
+
+
+def task_transcript(entries: list[dict]) -> list[dict]:
+    '''
+    Conversation of one task: the inputs of its longest LLM call (calls resend
+    the growing history) followed by that call's output.
+    '''
+    best, best_messages = None, []
+    for entry in sorted(entries, key=lambda e: e.get('started_at') or ''):
+        inputs = entry.get('inputs')
+        messages = normalize_messages(inputs.get('messages')) if isinstance(inputs, dict) else []
+        if messages and len(messages) >= len(best_messages):
+            best, best_messages = entry, messages
+    if best is None:
+        return []
+    reply = output_message(best.get('output'))
+    return best_messages + ([reply] if reply else [])
+
+
+@lru_cache(maxsize=None)
+def docent_converter():
+    '''
+    DocentConverter of the hal-paper-analysis pipeline.
+    '''
+    return importlib.import_module("hal-paper-analysis.qualitative.full_pipeline").DocentConverter
+
+
+def iter_trace_tasks(path, skip=None):
+    '''
+    Yields (header, task_id, entries) for each task of a trace, decoding only
+    that task's entries. Tasks whose agent_run_id satisfies skip are not decoded.
+    '''
+    header = read_trace_header(path)
+    run_id = (header.get('config', {}) or {}).get('run_id', '')
+    spans = defaultdict(list)
+    with open(path, 'rb') as f:
+        for start, end in iter_logging_spans(path):
+            f.seek(start)
+            task_id = peek_task_id(f.read(end - start))
+            if task_id is not None:
+                spans[task_id].append((start, end))
+        for task_id, task_spans in spans.items():
+            if skip is not None and skip(agent_run_id(run_id, task_id)):
+                continue
+            entries = []
+            for start, end in task_spans:
+                f.seek(start)
+                entries.append(json.loads(f.read(end - start)))
+            yield header, task_id, entries
+
+
+def iter_agent_runs(paths, skip=None, converter: str = 'docent', stats: dict = None):
+    '''
+    Docent agent runs for every task of every trace in paths. With the docent
+    converter, runs are whatever DocentConverter returns for the task's entries
+    and its conversion stats are summed into stats; skip is then left to the
+    uploader, as the ids are only known after conversion.
+    '''
+    if converter not in CONVERTERS:
+        raise ValueError(f"Unknown converter {converter!r}, expected one of {CONVERTERS}")
+    if converter == 'docent':
+        convert = docent_converter().convert_to_docent_messages
+        for path in paths:
+            try:
+                for _, _, entries in iter_trace_tasks(path):
+                    runs, conversion_stats = convert(entries)
+                    if stats is not None:
+                        for key, value in conversion_stats.items():
+                            stats[key] = stats.get(key, 0) + value
+                    yield from runs
+            except Exception as e:
+                print(f"  Error converting {os.path.basename(path)}: {e}")
+        return
+
+    for path in paths:
+        try:
+            for header, task_id, entries in iter_trace_tasks(path, skip=skip):
+                config = header.get('config', {}) or {}
+                results = header.get('results', {}) or {}
+                run_id = config.get('run_id', '')
+                messages = task_transcript(entries)
+                if not messages:
+                    continue
+                successful = {str(t) for t in results.get('successful_tasks', []) or []}
+                failed = {str(t) for t in results.get('failed_tasks', []) or []}
+                yield {
+                    'id': agent_run_id(run_id, task_id),
+                    'metadata': {
+                        'benchmark_id': config.get('benchmark_name', ''),
+                        'task_id': task_id,
+                        'run_id': run_id,
+                        'agent_name': config.get('agent_name', ''),
+                        'model': (config.get('agent_args', {}) or {}).get('model_name', ''),
+                        'success': task_id in successful if task_id in successful | failed else None,
+                        'trace_file': os.path.basename(path),
+                    },
+                    'transcripts': {'default': {'messages': messages}},
+                }
+        except Exception as e:
+            print(f"  Error converting {os.path.basename(path)}: {e}")
+
+
+async def _drain(run_queue: queue.Queue):
+    loop = asyncio.get_running_loop()
+    while True:
+        run = await loop.run_in_executor(None, run_queue.get)
+        if run is _SENTINEL:
+            return
+        yield run
+
+
+async def stream_upload(paths, uploader: AsyncDocentUploader, queue_size: int = 256,
+                        converter: str = 'docent', conversion_stats: dict = None) -> dict:
+    '''
+    Converts the traces in a producer thread and uploads the runs as they come.
+    Runs already in the uploader's checkpoint are skipped (with the simple
+    converter, before decoding).
+    '''
+    run_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+
+    def already_uploaded(run_id) -> bool:
+        if run_id in uploader.checkpoint:
+            uploader.stats['skipped'] += 1
+            return True
+        return False
+
+    def produce():
+        try:
+            for run in iter_agent_runs(paths, skip=already_uploaded, converter=converter, stats=conversion_stats):
+                while not stop.is_set():
+                    try:
+                        run_queue.put(run, timeout=0.5)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+        finally:
+            run_queue.put(_SENTINEL)
+
+    producer = threading.Thread(target=produce, name='docent-converter', daemon=True)
+    producer.start()
+    try:
+        return await uploader.upload(_drain(run_queue))
+    finally:
+        stop.set()
+
+
+def convert_and_upload(paths, api_key: str, collection_id: str, queue_size: int = 256,
+                       converter: str = 'docent', conversion_stats: dict = None, **uploader_kwargs) -> dict:
+    uploader = AsyncDocentUploader(api_key, collection_id, **uploader_kwargs)
+    return asyncio.run(stream_upload(paths, uploader, queue_size=queue_size, converter=converter,
+                                     conversion_stats=conversion_stats))
@@ -0,0 +1,105 @@
+'''
+Local stand-in for the Docent agent_runs endpoint, to measure upload
+throughput and exercise retries without touching a real collection.
+
+Usage:
+    # serve on localhost:8765 and point the uploader at --server_url http://localhost:8765
+    python -m util.docent_stub --port 8765 --latency 0.05 --error_rate 0.1
+
+    # upload synthetic runs to an in-process stub and report throughput
+    python -m util.docent_stub --benchmark 20000 --concurrency 16 --batch_size 200
+'''
+import random
+import asyncio
+import argparse
+import tempfile
+import os
+
+from aiohttp import web
+
+from util.docent_client import AsyncDocentUploader
+
+
+class DocentStub:
+    '''
+    Accepts POST /{collection_id}/agent_runs, sleeping latency seconds per
+    request and answering 429 (with Retry-After) or 503 for error_rate of them.
+    '''
+
+    def __init__(self, latency: float = 0.0, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.received = {}
+        self.requests = 0
+        self.errors = 0
+
+    async def agent_runs(self, request):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.random.random() < self.error_rate:
+            self.errors += 1
+            if self.random.random() < 0.5:
+                return web.Response(status=429, text='rate limited', headers={'Retry-After': '0.05'})
+            return web.Response(status=503, text='unavailable')
+        payload = await request.json()
+        for run in payload.get('agent_runs', []):
+            self.received[run['id']] = self.received.get(run['id'], 0) + 1
+        return web.json_response({'status': 'ok', 'count': len(payload.get('agent_runs', []))})
+
+    def app(self) -> web.Application:
+        app = web.Application(client_max_size=1024 ** 3)
+        app.router.add_post('/{collection_id}/agent_runs', self.agent_runs)
+        return app
+
+
+def synthetic_runs(n: int, messages: int = 20, message_chars: int = 400):
+    for i in range(n):
+        yield {
+            'id': f"run-{i}",
+            'metadata': {'benchmark_id': 'stub', 'task_id': str(i)},
+            'transcripts': {'default': {'messages': [
+                {'role': 'user' if j % 2 else 'assistant', 'content': 'x' * message_chars} for j in range(messages)]}},
+        }
+
+
+async def benchmark(args):
+    stub = DocentStub(latency=args.latency, error_rate=args.error_rate)
+    runner = web.AppRunner(stub.app())
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', args.port)
+    await site.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = os.path.join(tmp, 'checkpoint.txt')
+        for attempt in ('first upload', 'rerun'):
+            uploader = AsyncDocentUploader('stub-key', 'stub-collection', server_url=f"http://127.0.0.1:{args.port}",
+                                           batch_size=args.batch_size, max_concurrency=args.concurrency,
+                                           backoff=0.05, checkpoint_path=checkpoint)
+            stats = await uploader.upload(synthetic_runs(args.benchmark))
+            print(f"{attempt}: {stats['uploaded']} uploaded, {stats['skipped']} skipped, {stats['failed']} failed, "
+                  f"{stats['retries']} retries in {stats['seconds']:.2f}s ({stats['runs_per_second']:.0f} runs/s)")
+    duplicates = sum(1 for count in stub.received.values() if count > 1)
+    print(f"stub: {stub.requests} requests, {stub.errors} injected errors, "
+          f"{len(stub.received)} unique runs received, {duplicates} received more than once")
+    await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Docent agent_runs stub server')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.02, help='Seconds per request (default: 0.02)')
+    parser.add_argument('--error_rate', type=float, default=0.0, help='Fraction of requests answered with 429/503')
+    parser.add_argument('--benchmark', type=int, default=None, help='Upload this many synthetic runs to an in-process stub and exit')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--batch_size', type=int, default=100)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        asyncio.run(benchmark(args))
+    else:
+        web.run_app(DocentStub(latency=args.latency, error_rate=args.error_rate).app(), host='127.0.0.1', port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+'''
+Content-addressed storage for extracted task inputs (extract_inputs_simple.py).
+
+A task input is the system prompt and task messages joined by SEPARATOR. Each
+input is split into segments, every distinct segment is stored once, and rows
+refer to their segments by position:
+
+    all_benchmarks_inputs.inputs/
+        meta.json      format version, separator, row/segment counts
+        segments.npy   one record per distinct segment: blake2b digest, offset
+                       and compressed length in blob.bin, decoded length
+        blob.bin       zlib-compressed segments back to back
+        rows.csv       benchmark_id, model, task_id, agent_run_id, any other
+                       columns of the written frame (as text), and the
+                       space-separated segment positions of the input, or
+                       NULL_SEGMENTS (-1) for a missing (None) input
+
+segments.npy and blob.bin are memory-mapped, so opening a store only parses
+meta.json; rows.csv is loaded on first use. A lookup by (benchmark_id, task_id)
+is a dict access plus the decompression of that input's segments, which are
+cached since shared system prompts are requested over and over.
+
+Convert an existing pickle with:
+    python -m util.input_store data/all_benchmarks_inputs.pkl
+'''
+import os
+import sys
+import json
+import zlib
+import pickle
+import hashlib
+from pathlib import Path
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 2
+# Version 1 stores have no null inputs and only ROW_COLUMNS; they read the same
+READABLE_VERSIONS = (1, 2)
+SUFFIX = '.inputs'
+SEPARATOR = '\n\n---\n\n'
+ROW_COLUMNS = ['benchmark_id', 'model', 'task_id', 'agent_run_id']
+NULL_SEGMENTS = '-1'
+SEGMENT_DTYPE = np.dtype([('digest', 'S16'), ('offset', '<u8'), ('length', '<u4'), ('size', '<u4')])
+
+
+def segment_digest(segment: str) -> bytes:
+    return hashlib.blake2b(segment.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def write_inputs(df: pd.DataFrame, path, level: int = 6) -> Path:
+    '''
+    Writes a task input DataFrame (ROW_COLUMNS + task_input) to a .inputs
+    directory. Other columns are kept in rows.csv; missing ROW_COLUMNS are
+    written empty.
+    '''
+    if 'segments' in df.columns:
+        raise ValueError("'segments' is reserved for the segment positions in rows.csv")
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        path = path.with_suffix(SUFFIX)
+    path.mkdir(parents=True, exist_ok=True)
+    df = df.reset_index(drop=True)
+
+    positions = {}
+    records = []
+    row_segments = []
+    offset = 0
+    with open(path / 'blob.bin', 'wb') as blob:
+        for text in df['task_input']:
+            if text is None or (not isinstance(text, str) and pd.isna(text)):
+                row_segments.append(NULL_SEGMENTS)
+                continue
+            text = str(text)
+            refs = []
+            for segment in text.split(SEPARATOR):
+                digest = segment_digest(segment)
+                position = positions.get(digest)
+                if position is None:
+                    data = segment.encode('utf-8', 'surrogatepass')
+                    compressed = zlib.compress(data, level)
+                    blob.write(compressed)
+                    position = positions[digest] = len(records)
+                    records.append((digest, offset, len(compressed), len(data)))
+                    offset += len(compressed)
+                refs.append(str(position))
+            row_segments.append(' '.join(refs))
+    np.save(path / 'segments.npy', np.array(records, dtype=SEGMENT_DTYPE))
+
+    extra = [column for column in df.columns if column not in ROW_COLUMNS and column != 'task_input']
+    rows = pd.DataFrame({column: df[column] if column in df.columns else '' for column in ROW_COLUMNS + extra})
+    rows['segments'] = row_segments
+    rows.to_csv(path / 'rows.csv', index=False)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'separator': SEPARATOR,
+        'compression': 'zlib',
+        'rows': len(rows),
+        'segments': len(records),
+        'blob_bytes': offset,
+        'text_bytes': int(sum(size for *_, size in records)),
+    }
+    with open(path / 'meta.json', 'w') as f:
+        json.dump(meta, f, indent=2)
+    return path
+
+
+class MappedInputs:
+    '''
+    Read-only view of a .inputs directory. Segments are decompressed on demand.
+    '''
+
+    def __init__(self, path, cache_size: int = 4096):
+        self.path = Path(path)
+        with open(self.path / 'meta.json', 'r') as f:
+            self.meta = json.load(f)
+        if self.meta['format_version'] not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported inputs format version {self.meta['format_version']} in {self.path}")
+        self.separator = self.meta['separator']
+        self.segments = np.load(self.path / 'segments.npy', mmap_mode='r')
+        blob_path = self.path / 'blob.bin'
+        self.blob = np.memmap(blob_path, dtype=np.uint8, mode='r') if os.path.getsize(blob_path) else np.empty(0, np.uint8)
+        self.segment = lru_cache(maxsize=cache_size)(self._segment)
+        self._rows = None
+        self._lookup = None
+
+    def __len__(self) -> int:
+        return self.meta['rows']
+
+    def __repr__(self):
+        return f"MappedInputs({str(self.path)!r}, rows={self.meta['rows']}, segments={self.meta['segments']})"
+
+    @property
+    def rows(self) -> pd.DataFrame:
+        if self._rows is None:
+            self._rows = pd.read_csv(self.path / 'rows.csv', dtype=str, keep_default_na=False)
+        return self._rows
+
+    def _segment(self, position: int) -> str:
+        record = self.segments[position]
+        start = int(record['offset'])
+        data = self.blob[start:start + int(record['length'])].tobytes()
+        return zlib.decompress(data).decode('utf-8', 'surrogatepass')
+
+    def text(self, refs: str) -> str:
+        '''
+        Task input of a rows.csv segments field (None for NULL_SEGMENTS).
+        '''
+        if refs == NULL_SEGMENTS:
+            return None
+        return self.separator.join(self.segment(int(ref)) for ref in refs.split())
+
+    def row_input(self, i: int) -> str:
+        return self.text(self.rows['segments'].iat[i])
+
+    def _row_lookup(self) -> dict:
+        if self._lookup is None:
+            lookup = {}
+            for i, key in enumerate(zip(self.rows['benchmark_id'], self.rows['task_id'])):
+                lookup.setdefault(key, i)
+            self._lookup = lookup
+        return self._lookup
+
+    def get(self, benchmark_id: str, task_id, default=None):
+        '''
+        Task input of (benchmark_id, task_id), from the first row that has it.
+        '''
+        i = self._row_lookup().get((benchmark_id, str(task_id)))
+        return default if i is None else self.row_input(i)
+
+    def mapping(self) -> dict:
+        '''
+        {(task_id, benchmark_id): task_input} taking the first row of each pair.
+        '''
+        return {(task_id, benchmark_id): self.row_input(i)
+                for (benchmark_id, task_id), i in self._row_lookup().items()}
+
+    def to_dataframe(self) -> pd.DataFrame:
+        df = self.rows[ROW_COLUMNS].copy()
+        df['task_input'] = pd.Series([self.text(refs) for refs in self.rows['segments']], dtype=object)
+        extra = [column for column in self.rows.columns if column not in ROW_COLUMNS and column != 'segments']
+        return pd.concat([df, self.rows[extra]], axis=1)
+
+
+def open_inputs(path) -> MappedInputs:
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        path = path.with_suffix(SUFFIX)
+    return MappedInputs(path)
+
+
+def load_inputs(path) -> pd.DataFrame:
+    '''
+    Loads task inputs as a DataFrame from either a .inputs directory or a legacy pickle.
+    '''
+    path = Path(path)
+    if path.suffix == '.pkl' and not path.with_suffix(SUFFIX).is_dir():
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    return open_inputs(path).to_dataframe()
+
+
+def convert_pickle(pkl_path) -> Path:
+    '''
+    Converts a pickled task input DataFrame to a .inputs directory next to it.
+    '''
+    with open(pkl_path, 'rb') as f:
+        df = pickle.load(f)
+    return write_inputs(df, Path(pkl_path).with_suffix(SUFFIX))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(f"Usage: python -m util.input_store <inputs.pkl> [...]")
+        sys.exit(1)
+    for pkl_path in sys.argv[1:]:
+        out = convert_pickle(pkl_path)
+        meta = open_inputs(out).meta
+        print(f"Converted {pkl_path} ({os.path.getsize(pkl_path)} bytes) -> {out} "
+              f"({meta['rows']} rows, {meta['segments']} distinct segments, {meta['blob_bytes']} bytes compressed)")
@@ -0,0 +1,357 @@
+'''
+Item response theory (1PL/Rasch and 2PL) fitting over a response matrix.
+
+The model is P(correct) = sigmoid(a_j * (theta_i - b_j)) with ability theta_i
+per test taker, difficulty b_j and discrimination a_j (fixed to 1 for 1PL)
+per task. Responses are handled in long format (row, column, outcome) so only
+observed cells are ever touched; "not attempted" cells never enter the fit.
+
+Fitting maximizes the log posterior (normal priors on theta, b and log a) by
+alternating diagonal Newton steps on abilities and item parameters. Every
+gradient/curvature sum is an np.bincount over the observations, computed in
+mini-batches of batch_size observations so memory stays bounded for large
+matrices.
+'''
+import numpy as np
+import pandas as pd
+
+MODELS = ['1pl', '2pl']
+
+
+class Responses:
+    '''
+    Long-format observed responses of a test-taker x task matrix.
+    '''
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, outcomes: np.ndarray,
+                 row_labels: pd.Index, col_labels: pd.Index):
+        self.rows = rows.astype(np.int64)
+        self.cols = cols.astype(np.int64)
+        self.outcomes = outcomes.astype(np.float64)
+        self.row_labels = pd.Index(row_labels)
+        self.col_labels = pd.Index(col_labels)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.row_labels)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.col_labels)
+
+    def __len__(self):
+        return len(self.outcomes)
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> 'Responses':
+        '''
+        From a test_taker_id-indexed matrix such as result/result_matrix_merged.csv.
+        Values > 0 count as correct, NaN as not attempted.
+        '''
+        df = df.select_dtypes(include=[np.number])
+        values = df.to_numpy(dtype=float, na_value=np.nan)
+        rows, cols = np.nonzero(~np.isnan(values))
+        outcomes = (values[rows, cols] > 0).astype(np.float64)
+        return cls(rows, cols, outcomes, df.index, df.columns)
+
+
+class IRTParameters:
+    '''
+    Fitted abilities (theta) and item parameters (difficulty b, discrimination a).
+    '''
+
+    def __init__(self, theta: np.ndarray, b: np.ndarray, a: np.ndarray, model: str,
+                 row_labels: pd.Index, col_labels: pd.Index,
+                 theta_se: np.ndarray = None, b_se: np.ndarray = None):
+        self.theta = theta
+        self.b = b
+        self.a = a
+        self.model = model
+        self.row_labels = pd.Index(row_labels)
+        self.col_labels = pd.Index(col_labels)
+        self.theta_se = theta_se
+        self.b_se = b_se
+
+    def abilities(self, counts: np.ndarray = None) -> pd.DataFrame:
+        df = pd.DataFrame({'test_taker_id': self.row_labels, 'ability': self.theta})
+        if self.theta_se is not None:
+            df['ability_se'] = self.theta_se
+        if counts is not None:
+            df['n_responses'] = counts
+        return df
+
+    def items(self, counts: np.ndarray = None) -> pd.DataFrame:
+        df = pd.DataFrame({'task': self.col_labels, 'difficulty': self.b, 'discrimination': self.a})
+        if self.b_se is not None:
+            df['difficulty_se'] = self.b_se
+        if counts is not None:
+            df['n_responses'] = counts
+        return df
+
+
+def _sigmoid(x):
+    return 0.5 * (1.0 + np.tanh(0.5 * x))
+
+
+def _accumulate(responses: Responses, theta, b, a, batch_size: int, targets: set) -> dict:
+    '''
+    Sums the gradient/curvature terms in targets ('theta', 'b', 'a') over all
+    observations, batch_size observations at a time. Also returns the log-likelihood.
+    '''
+    sums = {}
+    for name in targets:
+        size = responses.n_rows if name == 'theta' else responses.n_cols
+        sums[name] = (np.zeros(size), np.zeros(size))
+    loglik = 0.0
+    n = len(responses)
+    for start in range(0, n, batch_size or n or 1):
+        stop = min(start + (batch_size or n), n)
+        r, c, y = responses.rows[start:stop], responses.cols[start:stop], responses.outcomes[start:stop]
+        a_c = a[c]
+        diff = theta[r] - b[c]
+        p = np.clip(_sigmoid(a_c * diff), 1e-9, 1 - 1e-9)
+        resid = y - p
+        info = p * (1 - p)
+        loglik += float(np.sum(y * np.log(p) + (1 - y) * np.log(1 - p)))
+        if 'theta' in targets:
+            g, h = sums['theta']
+            g += np.bincount(r, weights=a_c * resid, minlength=responses.n_rows)
+            h += np.bincount(r, weights=a_c * a_c * info, minlength=responses.n_rows)
+        if 'b' in targets:
+            g, h = sums['b']
+            g -= np.bincount(c, weights=a_c * resid, minlength=responses.n_cols)
+            h += np.bincount(c, weights=a_c * a_c * info, minlength=responses.n_cols)
+        if 'a' in targets:
+            # Gradient w.r.t. log a: a * sum((theta - b) * resid)
+            g, h = sums['a']
+            g += np.bincount(c, weights=a_c * diff * resid, minlength=responses.n_cols)
+            h += np.bincount(c, weights=(a_c * diff) ** 2 * info, minlength=responses.n_cols)
+    sums['loglik'] = loglik
+    return sums
+
+
+def _newton_step(value, grad, curvature, prior_mean, prior_sd, max_step):
+    grad = grad - (value - prior_mean) / prior_sd ** 2
+    curvature = curvature + 1.0 / prior_sd ** 2
+    return value + np.clip(grad / curvature, -max_step, max_step), curvature
+
+
+def fit_irt(responses: Responses, model: str = '1pl', max_iter: int = 200, tol: float = 1e-6,
+            batch_size: int = 1_000_000, theta_prior_sd: float = 3.0, b_prior_sd: float = 3.0,
+            log_a_prior_sd: float = 0.5, max_step: float = 1.0, init: IRTParameters = None,
+            fit_theta: bool = True, fit_items: bool = True, verbose: bool = False) -> IRTParameters:
+    '''
+    Fits a 1PL or 2PL model by alternating diagonal Newton updates.
+
+    init warm-starts from previous parameters (labels must match responses).
+    fit_theta / fit_items freeze one side, e.g. scoring new test takers
+    against fixed item parameters.
+    '''
+    if model not in MODELS:
+        raise ValueError(f"Unknown IRT model {model!r}, expected one of {MODELS}")
+    if init is not None:
+        theta, b, log_a = init.theta.copy(), init.b.copy(), np.log(init.a)
+    else:
+        theta = np.zeros(responses.n_rows)
+        log_a = np.zeros(responses.n_cols)
+        # Start difficulties at the logit of each task's failure rate
+        attempts = np.bincount(responses.cols, minlength=responses.n_cols)
+        successes = np.bincount(responses.cols, weights=responses.outcomes, minlength=responses.n_cols)
+        b = -np.log((successes + 0.5) / (attempts - successes + 0.5))
+
+    previous = -np.inf
+    for iteration in range(max_iter):
+        if fit_theta:
+            sums = _accumulate(responses, theta, b, np.exp(log_a), batch_size, {'theta'})
+            theta, _ = _newton_step(theta, *sums['theta'], 0.0, theta_prior_sd, max_step)
+        if fit_items:
+            targets = {'b', 'a'} if model == '2pl' else {'b'}
+            sums = _accumulate(responses, theta, b, np.exp(log_a), batch_size, targets)
+            b, _ = _newton_step(b, *sums['b'], 0.0, b_prior_sd, max_step)
+            if model == '2pl':
+                log_a, _ = _newton_step(log_a, *sums['a'], 0.0, log_a_prior_sd, max_step)
+        if fit_theta and fit_items:
+            # The likelihood only depends on theta - b: pin the mean ability to 0
+            shift = theta.mean()
+            theta -= shift
+            b -= shift
+        loglik = sums['loglik']
+        if verbose:
+            print(f"  iteration {iteration + 1}: log-likelihood {loglik:.4f}")
+        if abs(loglik - previous) < tol * max(1.0, abs(loglik)):
+            break
+        previous = loglik
+
+    params = IRTParameters(theta, b, np.exp(log_a), model, responses.row_labels, responses.col_labels)
+    return with_standard_errors(responses, params, batch_size, theta_prior_sd, b_prior_sd)
+
+
+def with_standard_errors(responses: Responses, params: IRTParameters, batch_size: int = 1_000_000,
+                         theta_prior_sd: float = 3.0, b_prior_sd: float = 3.0) -> IRTParameters:
+    '''
+    Sets theta_se and b_se from the curvature of the log posterior at params.
+    '''
+    sums = _accumulate(responses, params.theta, params.b, params.a, batch_size, {'theta', 'b'})
+    params.theta_se = 1.0 / np.sqrt(sums['theta'][1] + 1.0 / theta_prior_sd ** 2)
+    params.b_se = 1.0 / np.sqrt(sums['b'][1] + 1.0 / b_prior_sd ** 2)
+    return params
+
+
+def response_counts(responses: Responses) -> tuple[np.ndarray, np.ndarray]:
+    '''
+    Number of observed responses per test taker and per task.
+    '''
+    return (np.bincount(responses.rows, minlength=responses.n_rows),
+            np.bincount(responses.cols, minlength=responses.n_cols))
+
+
+# ----------------------------------------------------------------------
+# Incremental updates
+# ----------------------------------------------------------------------
+
+def row_signatures(responses: Responses) -> np.ndarray:
+    '''
+    Order-independent uint64 signature of every test taker's responses, used
+    to find rows that changed since the last fit.
+    '''
+    col_hashes = pd.util.hash_array(responses.col_labels.astype(str).to_numpy())
+    terms = col_hashes[responses.cols] * (2 * responses.outcomes.astype(np.uint64) + np.uint64(1))
+    signatures = np.zeros(responses.n_rows, dtype=np.uint64)
+    np.add.at(signatures, responses.rows, terms)
+    return signatures
+
+
+def matrix_version(responses: Responses, signatures: np.ndarray = None) -> str:
+    '''
+    Version string of the long-format matrix: changes whenever any response,
+    test taker or task changes.
+    '''
+    if signatures is None:
+        signatures = row_signatures(responses)
+    row_hashes = pd.util.hash_array(responses.row_labels.astype(str).to_numpy())
+    col_hashes = pd.util.hash_array(responses.col_labels.astype(str).to_numpy())
+    with np.errstate(over='ignore'):
+        combined = np.sum(row_hashes * (signatures | np.uint64(1)), dtype=np.uint64) ^ np.sum(col_hashes, dtype=np.uint64)
+    return f"{len(responses)}-{int(combined):016x}"
+
+
+class IRTState:
+    '''
+    Persisted fit: parameters, the matrix version they belong to, per-row
+    signatures and the number of incremental updates since the last refinement.
+    '''
+
+    def __init__(self, params: IRTParameters, version: str, signatures: np.ndarray,
+                 updates_since_refine: int = 0):
+        self.params = params
+        self.version = version
+        self.signatures = signatures
+        self.updates_since_refine = updates_since_refine
+
+    def save(self, path):
+        se = {name: value for name, value in (('theta_se', self.params.theta_se), ('b_se', self.params.b_se))
+              if value is not None}
+        np.savez(path,
+                 theta=self.params.theta, b=self.params.b, a=self.params.a,
+                 row_labels=np.array(self.params.row_labels, dtype=str),
+                 col_labels=np.array(self.params.col_labels, dtype=str),
+                 model=self.params.model, version=self.version,
+                 signatures=self.signatures, updates_since_refine=self.updates_since_refine, **se)
+
+    @classmethod
+    def load(cls, path) -> 'IRTState':
+        with np.load(path) as data:
+            # States saved before standard errors were persisted have none
+            se = {name: data[name] for name in ('theta_se', 'b_se') if name in data.files}
+            params = IRTParameters(data['theta'], data['b'], data['a'], str(data['model']),
+                                   pd.Index(data['row_labels']), pd.Index(data['col_labels']), **se)
+            return cls(params, str(data['version']), data['signatures'], int(data['updates_since_refine']))
+
+
+def _subset(responses: Responses, mask: np.ndarray, axis: str) -> tuple[Responses, np.ndarray]:
+    '''
+    Responses restricted to the rows (axis='rows') or columns (axis='cols')
+    selected by mask. Returns the subset and the selected positions.
+    '''
+    positions = np.flatnonzero(mask)
+    remap = np.full(len(mask), -1)
+    remap[positions] = np.arange(len(positions))
+    if axis == 'rows':
+        keep = mask[responses.rows]
+        sub = Responses(remap[responses.rows[keep]], responses.cols[keep], responses.outcomes[keep],
+                        responses.row_labels[positions], responses.col_labels)
+    else:
+        keep = mask[responses.cols]
+        sub = Responses(responses.rows[keep], remap[responses.cols[keep]], responses.outcomes[keep],
+                        responses.row_labels, responses.col_labels[positions])
+    return sub, positions
+
+
+def update_irt(responses: Responses, state: IRTState, refine: bool = False,
+               refine_iter: int = 20, rounds: int = 3, **fit_kwargs) -> IRTState:
+    '''
+    Brings a persisted fit up to date with a grown matrix.
+
+    - Test takers that are new or whose responses changed are scored against
+      the existing (frozen) item parameters.
+    - Tasks that are new are then calibrated against those abilities, and
+      the changed test takers are rescored against all items; the two steps
+      alternate for rounds rounds, so new tasks attempted mostly by new test
+      takers are not calibrated against placeholder abilities.
+    - With refine=True all parameters are then refined jointly for at most
+      refine_iter iterations, warm-started from the current values.
+
+    Standard errors are recomputed from the curvature at the updated
+    parameters, as at the end of fit_irt.
+    '''
+    model = state.params.model
+    signatures = row_signatures(responses)
+    version = matrix_version(responses, signatures)
+    se_kwargs = {k: fit_kwargs[k] for k in ('batch_size', 'theta_prior_sd', 'b_prior_sd') if k in fit_kwargs}
+    if version == state.version and not refine:
+        if state.params.theta_se is None or state.params.b_se is None:
+            with_standard_errors(responses, state.params, **se_kwargs)
+        return state
+
+    old = state.params
+    row_pos = old.row_labels.get_indexer(responses.row_labels)
+    col_pos = old.col_labels.get_indexer(responses.col_labels)
+
+    theta = np.where(row_pos >= 0, old.theta[row_pos], 0.0)
+    b = np.where(col_pos >= 0, old.b[col_pos], 0.0)
+    a = np.where(col_pos >= 0, old.a[col_pos], 1.0)
+
+    old_signatures = np.where(row_pos >= 0, state.signatures[row_pos], 0)
+    changed_rows = (row_pos < 0) | (old_signatures != signatures)
+    new_cols = col_pos < 0
+
+    def score(items: np.ndarray):
+        # Abilities of the changed rows against the frozen parameters of the selected items
+        sub, positions = _subset(responses, changed_rows, 'rows')
+        sub, cols = _subset(sub, items, 'cols')
+        init = IRTParameters(theta[positions], b[cols], a[cols], model, sub.row_labels, sub.col_labels)
+        theta[positions] = fit_irt(sub, model=model, init=init, fit_items=False, **fit_kwargs).theta
+
+    def calibrate():
+        # New items against the frozen abilities
+        sub, positions = _subset(responses, new_cols, 'cols')
+        init = IRTParameters(theta, b[positions], a[positions], model, sub.row_labels, sub.col_labels)
+        fitted = fit_irt(sub, model=model, init=init, fit_theta=False, **fit_kwargs)
+        b[positions], a[positions] = fitted.b, fitted.a
+
+    if changed_rows.any():
+        score(~new_cols)
+    if new_cols.any():
+        for _ in range(max(1, rounds)):
+            calibrate()
+            if changed_rows.any():
+                score(np.ones(len(new_cols), dtype=bool))
+
+    params = IRTParameters(theta, b, a, model, responses.row_labels, responses.col_labels)
+    updates = state.updates_since_refine + 1
+    if refine:
+        params = fit_irt(responses, model=model, init=params, max_iter=refine_iter, **fit_kwargs)
+        updates = 0
+    else:
+        params = with_standard_errors(responses, params, **se_kwargs)
+    return IRTState(params, version, signatures, updates)
@@ -0,0 +1,131 @@
+'''
+Missing-aware pairwise similarity between the columns of a matrix.
+
+Every pair of columns uses only the rows where both are observed
+(pairwise-complete observations, like pandas' DataFrame.corr). Instead of
+looping over pairs, the sufficient statistics of all pairs in a block are
+computed with masked matrix products:
+
+    n   = M_a.T @ M_b          sxy = X_a.T @ X_b
+    sx  = X_a.T @ M_b          sxx = (X_a**2).T @ M_b
+    sy  = M_a.T @ X_b          syy = M_a.T @ (X_b**2)
+
+where M is the observed mask and X the values with NaN replaced by 0. The
+output is filled block by block, so only two column blocks and one output
+tile are held in memory at a time; pass out= a memory-mapped array (see
+open_output) to build e.g. a 50k x 50k matrix on disk. Integer matrices,
+such as the memory-mapped int8 payload of a .resmat (util/resmat_store.py),
+mark missing cells with -1; they are converted block by block, so the input
+is never densified as a whole.
+
+Metrics:
+    pearson  Pearson correlation
+    phi      phi coefficient (Pearson on 0/1 data, checked to be binary)
+    kappa    Cohen's kappa for 0/1 data
+'''
+import numpy as np
+import pandas as pd
+from numpy.lib.format import open_memmap
+
+METRICS = ['pearson', 'phi', 'kappa']
+
+
+def _block_stats(xa, ma, xb, mb):
+    n = ma.T @ mb
+    sx = xa.T @ mb
+    sy = ma.T @ xb
+    sxy = xa.T @ xb
+    return n, sx, sy, sxy, (xa * xa).T @ mb, ma.T @ (xb * xb)
+
+
+def _pearson(n, sx, sy, sxy, sxx, syy):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx * sy / n
+        var_x = sxx - sx * sx / n
+        var_y = syy - sy * sy / n
+        r = cov / np.sqrt(var_x * var_y)
+    r[(var_x <= 0) | (var_y <= 0)] = np.nan
+    return np.clip(r, -1.0, 1.0)
+
+
+def _kappa(n, sx, sy, sxy, sxx, syy):
+    # For 0/1 data: sx = #(x=1), sy = #(y=1), sxy = #(x=1, y=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p_observed = (n - sx - sy + 2 * sxy) / n
+        p_x, p_y = sx / n, sy / n
+        p_expected = p_x * p_y + (1 - p_x) * (1 - p_y)
+        return (p_observed - p_expected) / (1 - p_expected)
+
+
+def _missing(block: np.ndarray) -> np.ndarray:
+    # NaN for float matrices, negative values (-1) for integer ones
+    return block < 0 if np.issubdtype(block.dtype, np.integer) else np.isnan(block)
+
+
+def _check_binary(values: np.ndarray, block_size: int):
+    for start in range(0, values.shape[1], block_size):
+        block = np.asarray(values[:, start:start + block_size])
+        if not np.isin(block[~_missing(block)], [0, 1]).all():
+            raise ValueError("phi and kappa need a 0/1 matrix (NaN or -1 for missing)")
+
+
+def open_output(path, n: int, dtype=np.float32) -> np.ndarray:
+    '''
+    Creates an (n, n) .npy file on disk and returns it as a writable memmap.
+    '''
+    return open_memmap(path, mode='w+', dtype=dtype, shape=(n, n))
+
+
+def pairwise_matrix(values: np.ndarray, metric: str = 'pearson', block_size: int = 2048,
+                    min_periods: int = 1, out: np.ndarray = None, dtype=np.float64) -> np.ndarray:
+    '''
+    Pairwise similarity between the columns of values (NaN = missing, or -1
+    for integer values).
+
+    Returns an (n_cols, n_cols) array, or fills and returns out. Pairs with
+    fewer than min_periods common observations are NaN.
+    '''
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}")
+    values = np.asarray(values)
+    if metric in ('phi', 'kappa'):
+        _check_binary(values, block_size)
+    compute = _kappa if metric == 'kappa' else _pearson
+
+    n_cols = values.shape[1]
+    if out is None:
+        out = np.empty((n_cols, n_cols), dtype=dtype)
+
+    def prepare(start):
+        block = np.asarray(values[:, start:start + block_size])
+        mask = ~_missing(block)
+        return np.where(mask, block, 0).astype(dtype, copy=False), mask.astype(dtype)
+
+    for start_a in range(0, n_cols, block_size):
+        xa, ma = prepare(start_a)
+        stop_a = start_a + xa.shape[1]
+        for start_b in range(start_a, n_cols, block_size):
+            xb, mb = (xa, ma) if start_b == start_a else prepare(start_b)
+            stop_b = start_b + xb.shape[1]
+            stats = _block_stats(xa, ma, xb, mb)
+            tile = compute(*stats)
+            tile[stats[0] < min_periods] = np.nan
+            out[start_a:stop_a, start_b:stop_b] = tile
+            if start_b != start_a:
+                out[start_b:stop_b, start_a:stop_a] = tile.T
+    return out
+
+
+def pairwise_frame(df: pd.DataFrame, metric: str = 'pearson', axis: int = 0, **kwargs) -> pd.DataFrame:
+    '''
+    DataFrame wrapper around pairwise_matrix.
+
+    axis=0 compares columns (e.g. task x task on a test-taker x task matrix,
+    or rubric x rubric like DataFrame.corr), axis=1 compares rows (test taker
+    x test taker).
+    '''
+    labels = df.columns if axis == 0 else df.index
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    if axis == 1:
+        values = values.T
+    return pd.DataFrame(pairwise_matrix(values, metric=metric, **kwargs), index=labels, columns=labels)
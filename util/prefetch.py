@@ -0,0 +1,77 @@
+'''
+Read-ahead for trace files on slow (network-mounted) storage.
+
+Loops over traces read a file, parse it, then request the next one, so the
+link sits idle while the CPU parses and the CPU while the link transfers.
+prefetch() reads the next files in a small thread pool while the current one
+is processed, so a loop takes about max(I/O, CPU) instead of their sum:
+
+    for path, raw in prefetch(paths, depth=4, max_bytes=1 << 30):
+        data = json.loads(raw)
+
+Files are yielded in order. At most depth reads are in flight, and reads are
+only started while the buffered bytes (in flight or yielded but not yet
+released) stay under max_bytes; a single file larger than the cap is still
+read, alone. A buffer counts against the cap until the next item is
+requested, so the consumer must not hold more than one.
+'''
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_DEPTH = 4
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+def read_file(path) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+_END = object()
+
+
+def _read_ahead(items, read, size, depth: int, max_bytes: int):
+    # Yields (item, read(item)) in order with up to depth reads in flight
+    items = iter(items)
+    pending = deque()
+    buffered = 0
+    upcoming = None  # (item, size) taken from items but not started yet
+    with ThreadPoolExecutor(max_workers=depth) as pool:
+        try:
+            while True:
+                while len(pending) < depth:
+                    if upcoming is None:
+                        item = next(items, _END)
+                        if item is _END:
+                            break
+                        upcoming = (item, size(item))
+                    item, n = upcoming
+                    if pending and buffered + n > max_bytes:
+                        break
+                    pending.append((item, pool.submit(read, item), n))
+                    buffered += n
+                    upcoming = None
+                if not pending:
+                    return
+                item, future, n = pending.popleft()
+                try:
+                    yield item, future.result()
+                finally:
+                    buffered -= n
+        finally:
+            for _, future, _ in pending:
+                future.cancel()
+
+
+def prefetch(paths, depth: int = DEFAULT_DEPTH, max_bytes: int = DEFAULT_MAX_BYTES):
+    '''
+    Yields (path, file bytes) for each path, reading up to depth files ahead.
+    depth=0 reads each file when it is requested.
+    '''
+    if depth <= 0:
+        for path in paths:
+            yield path, read_file(path)
+        return
+    yield from _read_ahead(paths, read_file, os.path.getsize, depth, max_bytes)
+
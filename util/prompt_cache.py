@@ -0,0 +1,183 @@
+'''
+Prompt-prefix cache simulation over logged LLM calls.
+
+Agents resend their whole conversation on every call, so consecutive calls of
+a task share long message prefixes that a provider-side prompt cache would
+serve at a discount. Every call is reduced to a chain of prefix hashes,
+
+    h_0 = 0,  h_k = hash((h_{k-1}, digest(message_k)))
+
+so h_k identifies the first k messages. Replaying a task's calls in
+started_at order, the cached part of a call is its longest prefix whose hash
+is still in the cache; prefixes are found by binary search over the chain
+instead of comparing message histories. Building the chains still visits
+every item of every call, but PrefixChainer only digests the items that
+differ from the previous call of the task: the resent history is compared
+item by item (no JSON encoding, no hashing) and its hashes are reused.
+
+Token counts of a prefix are the call's prompt tokens scaled by the share of
+the prompt characters the prefix covers.
+'''
+import json
+import bisect
+
+# Providers' published cache behaviour (read/write price multipliers of the
+# normal prompt price, minimum cacheable prefix, granularity, time to live)
+PRESETS = {
+    'openai': {'min_tokens': 1024, 'granularity': 128, 'ttl': 300.0, 'read_multiplier': 0.5, 'write_multiplier': 1.0},
+    'anthropic': {'min_tokens': 1024, 'granularity': 1, 'ttl': 300.0, 'read_multiplier': 0.1, 'write_multiplier': 1.25},
+    'gemini': {'min_tokens': 1024, 'granularity': 1, 'ttl': 3600.0, 'read_multiplier': 0.25, 'write_multiplier': 1.0},
+}
+
+
+class CacheRules:
+    '''
+    Cache behaviour: prefixes shorter than min_tokens are not cached, cached
+    tokens are rounded down to a multiple of granularity, entries expire ttl
+    seconds after their last use, and cached/newly written prompt tokens cost
+    read_multiplier/write_multiplier times the normal prompt price.
+    '''
+
+    def __init__(self, min_tokens: int = 1024, granularity: int = 128, ttl: float = 300.0,
+                 read_multiplier: float = 0.5, write_multiplier: float = 1.0):
+        self.min_tokens = min_tokens
+        self.granularity = max(1, granularity)
+        self.ttl = ttl
+        self.read_multiplier = read_multiplier
+        self.write_multiplier = write_multiplier
+
+    @classmethod
+    def preset(cls, name: str, **overrides) -> 'CacheRules':
+        if name not in PRESETS:
+            raise ValueError(f"Unknown cache preset {name!r} (choose from {', '.join(PRESETS)})")
+        rules = dict(PRESETS[name])
+        rules.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**rules)
+
+    def __repr__(self):
+        return (f"CacheRules(min_tokens={self.min_tokens}, granularity={self.granularity}, ttl={self.ttl}, "
+                f"read_multiplier={self.read_multiplier}, write_multiplier={self.write_multiplier})")
+
+
+def call_messages(entry: dict) -> list:
+    '''
+    Prompt of a logging entry as a list of items (tool definitions, system
+    prompt, messages) in the order a provider caches them.
+    '''
+    inputs = entry.get('inputs')
+    if not isinstance(inputs, dict):
+        return []
+    messages = inputs.get('messages')
+    if isinstance(messages, list) and messages and isinstance(messages[0], list):
+        messages = messages[0]  # serialized LangChain messages (assistantbench)
+    items = []
+    if inputs.get('tools'):
+        items.append({'tools': inputs['tools']})
+    if inputs.get('system'):
+        items.append({'role': 'system', 'content': inputs['system']})
+    if isinstance(messages, list):
+        items.extend(message.get('kwargs', message) if isinstance(message, dict) else message for message in messages)
+    elif isinstance(inputs.get('prompt'), str):
+        items.append({'role': 'user', 'content': inputs['prompt']})
+    return items
+
+
+_PLAIN_MESSAGE_KEYS = {'role', 'content', 'name', 'tool_call_id'}
+
+
+def _digest(item) -> tuple[int, int]:
+    '''
+    (hash, characters) of one prompt item. Plain text messages are hashed
+    directly, anything else through its canonical JSON.
+    '''
+    if isinstance(item, dict) and isinstance(item.get('content'), str) and item.keys() <= _PLAIN_MESSAGE_KEYS:
+        return hash(tuple(sorted(item.items()))), len(item['content'])
+    text = json.dumps(item, sort_keys=True, default=str)
+    return hash(text), len(text)
+
+
+def prefix_chain(items: list, h: int = 0, total: int = 0) -> tuple[list[int], list[int]]:
+    '''
+    Prefix hashes h_1..h_n and cumulative character counts of a prompt, or
+    of its continuation after a prefix with hash h and total characters.
+    '''
+    hashes, chars = [], []
+    for item in items:
+        digest, length = _digest(item)
+        h = hash((h, digest))
+        total += length
+        hashes.append(h)
+        chars.append(total)
+    return hashes, chars
+
+
+class PrefixChainer:
+    '''
+    prefix_chain over the successive calls of one task. The leading items a
+    call shares with the previous one keep the previous call's hashes; only
+    the rest are digested.
+    '''
+
+    def __init__(self):
+        self.items, self.hashes, self.chars = [], [], []
+
+    def __call__(self, items: list) -> tuple[list[int], list[int]]:
+        previous = self.items
+        shared, limit = 0, min(len(items), len(previous))
+        while shared < limit and (items[shared] is previous[shared] or items[shared] == previous[shared]):
+            shared += 1
+        start = (self.hashes[shared - 1], self.chars[shared - 1]) if shared else (0, 0)
+        hashes, chars = prefix_chain(items[shared:], *start)
+        self.items, self.hashes, self.chars = items, self.hashes[:shared] + hashes, self.chars[:shared] + chars
+        return self.hashes, self.chars
+
+
+class _CacheView:
+    # Sequence view of "is prefix k cached" for bisect (True for k < cached length)
+    def __init__(self, hashes, cache, now, ttl):
+        self.hashes, self.cache, self.now, self.ttl = hashes, cache, now, ttl
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def __getitem__(self, k):
+        last_used = self.cache.get(self.hashes[k])
+        return not (last_used is not None and self.now - last_used <= self.ttl)
+
+
+def simulate_calls(calls: list[dict], rules: CacheRules) -> dict:
+    '''
+    Replays one task's calls ({time, hashes, chars, prompt_tokens}) in time
+    order. Returns prompt, cached (read from cache) and written (added to the
+    cache) token totals.
+    '''
+    cache = {}
+    totals = {'prompt_tokens': 0, 'cached_tokens': 0, 'written_tokens': 0}
+    for call in sorted(calls, key=lambda c: c['time']):
+        hashes, chars, prompt, now = call['hashes'], call['chars'], call['prompt_tokens'], call['time']
+        totals['prompt_tokens'] += prompt
+        if not hashes or not chars[-1]:
+            continue
+        # Prefix membership is monotone: every prefix of a cached prefix is cached
+        cached_len = bisect.bisect_left(_CacheView(hashes, cache, now, rules.ttl), True)
+        per_char = prompt / chars[-1]
+        cached = int(chars[cached_len - 1] * per_char) if cached_len else 0
+        cached = cached // rules.granularity * rules.granularity if cached >= rules.min_tokens else 0
+        totals['cached_tokens'] += cached
+        if prompt >= rules.min_tokens:
+            totals['written_tokens'] += prompt - cached
+            for h in hashes:
+                cache[h] = now
+        else:
+            for h in hashes[:cached_len]:
+                cache[h] = now
+    return totals
+
+
+def effective_prompt_tokens(totals: dict, rules: CacheRules) -> float:
+    '''
+    Prompt tokens weighted by their price relative to an uncached token.
+    '''
+    uncached = totals['prompt_tokens'] - totals['cached_tokens']
+    written = totals['written_tokens']
+    return (uncached - written) + written * rules.write_multiplier + totals['cached_tokens'] * rules.read_multiplier
@@ -0,0 +1,191 @@
+'''
+Memory-mappable storage for response/rubric matrices (resmats).
+
+A resmat is written as a directory:
+
+    resmat_<name>.resmat/
+        meta.json    shape, dtype, missing-value encoding, label level names/dtypes
+        values.npy   row-major array payload, opened with np.load(mmap_mode='r')
+        rows.csv     row label table, one column per index level
+        columns.csv  column label table, one column per column level
+
+Opening a resmat only parses meta.json and the .npy header, so it takes constant
+time regardless of the matrix size. The payload pages are read on demand and
+shared between processes through the OS page cache. Binary matrices are stored
+as int8 with -1 for missing, everything else as float32 with NaN.
+
+Convert existing pickles with:
+    python -m util.resmat_store resmat/*.pkl data/resmat_*.pkl
+'''
+import os
+import sys
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+SUFFIX = '.resmat'
+
+
+def _label_table(labels: pd.Index, default_name: str) -> tuple[pd.DataFrame, list, list]:
+    frame = labels.to_frame(index=False)
+    names = [name if name is not None else f'{default_name}_{i}' for i, name in enumerate(labels.names)]
+    frame.columns = names
+    kinds = [frame[name].dtype.kind for name in names]
+    return frame, list(labels.names), kinds
+
+
+def _read_label_table(path: Path, names: list, kinds: list) -> pd.Index:
+    frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+    for column, kind in zip(frame.columns, kinds):
+        if kind in 'iuf':
+            frame[column] = pd.to_numeric(frame[column])
+    if len(names) == 1:
+        return pd.Index(frame.iloc[:, 0].to_numpy(), name=names[0])
+    return pd.MultiIndex.from_frame(frame, names=names)
+
+
+def write_resmat(df: pd.DataFrame, path) -> Path:
+    '''
+    Writes a resmat DataFrame (rows: test takers, columns: tasks) to a .resmat directory.
+    '''
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        path = path.with_suffix(SUFFIX)
+    path.mkdir(parents=True, exist_ok=True)
+
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    finite = values[~np.isnan(values)]
+    if np.isin(finite, [0.0, 1.0]).all():
+        payload = np.where(np.isnan(values), -1, values).astype(np.int8)
+        missing = -1
+    else:
+        payload = values.astype(np.float32)
+        missing = 'nan'
+    np.save(path / 'values.npy', np.ascontiguousarray(payload))
+
+    rows, row_names, row_kinds = _label_table(df.index, 'row')
+    columns, column_names, column_kinds = _label_table(df.columns, 'column')
+    rows.to_csv(path / 'rows.csv', index=False)
+    columns.to_csv(path / 'columns.csv', index=False)
+
+    meta = {
+        'format_version': FORMAT_VERSION,
+        'shape': list(payload.shape),
+        'dtype': str(payload.dtype),
+        'missing': missing,
+        'row_names': row_names,
+        'row_kinds': row_kinds,
+        'column_names': column_names,
+        'column_kinds': column_kinds,
+    }
+    with open(path / 'meta.json', 'w') as f:
+        json.dump(meta, f, indent=2)
+    return path
+
+
+class MappedResmat:
+    '''
+    Read-only view of a .resmat directory. Values stay on disk until touched,
+    row/column labels are loaded on first use.
+    '''
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / 'meta.json', 'r') as f:
+            self.meta = json.load(f)
+        if self.meta['format_version'] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported resmat format version {self.meta['format_version']} in {self.path}")
+        self.values = np.load(self.path / 'values.npy', mmap_mode='r')
+        self._index = None
+        self._columns = None
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.values.shape
+
+    @property
+    def index(self) -> pd.Index:
+        if self._index is None:
+            self._index = _read_label_table(self.path / 'rows.csv', self.meta['row_names'], self.meta['row_kinds'])
+        return self._index
+
+    @property
+    def columns(self) -> pd.Index:
+        if self._columns is None:
+            self._columns = _read_label_table(self.path / 'columns.csv', self.meta['column_names'], self.meta['column_kinds'])
+        return self._columns
+
+    def __repr__(self):
+        return f"MappedResmat({str(self.path)!r}, shape={self.shape}, dtype={self.values.dtype})"
+
+    def _decode(self, block: np.ndarray) -> np.ndarray:
+        block = np.asarray(block, dtype=float)
+        if self.meta['missing'] == -1:
+            block[block == -1] = np.nan
+        return block
+
+    def _positions(self, labels, axis_index: pd.Index) -> np.ndarray:
+        positions = axis_index.get_indexer(labels)
+        if (positions < 0).any():
+            missing = [label for label, pos in zip(labels, positions) if pos < 0]
+            raise KeyError(f"Labels not found: {missing[:5]}")
+        return positions
+
+    def read(self, rows=None, columns=None) -> pd.DataFrame:
+        '''
+        Reads a sub-matrix by row/column labels (None means all). Only the pages
+        holding the requested rows are touched.
+        '''
+        row_pos = slice(None) if rows is None else self._positions(list(rows), self.index)
+        col_pos = slice(None) if columns is None else self._positions(list(columns), self.columns)
+        block = self.values[row_pos][:, col_pos]
+        return pd.DataFrame(self._decode(block), index=self.index[row_pos], columns=self.columns[col_pos])
+
+    def read_positions(self, rows=slice(None), columns=slice(None)) -> np.ndarray:
+        '''
+        Reads a sub-matrix by integer positions, without loading any labels.
+        '''
+        return self._decode(self.values[rows, columns])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        return self.read()
+
+
+def open_resmat(path) -> MappedResmat:
+    path = Path(path)
+    if path.suffix != SUFFIX:
+        path = path.with_suffix(SUFFIX)
+    return MappedResmat(path)
+
+
+def load_resmat(path) -> pd.DataFrame:
+    '''
+    Loads a resmat as a DataFrame from either a .resmat directory or a legacy pickle.
+    '''
+    path = Path(path)
+    if path.suffix == '.pkl' and not path.with_suffix(SUFFIX).is_dir():
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    return open_resmat(path).to_dataframe()
+
+
+def convert_pickle(pkl_path) -> Path:
+    '''
+    Converts a pickled resmat DataFrame to a .resmat directory next to it.
+    '''
+    with open(pkl_path, 'rb') as f:
+        df = pickle.load(f)
+    return write_resmat(df, Path(pkl_path).with_suffix(SUFFIX))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(f"Usage: python -m util.resmat_store <resmat.pkl> [...]")
+        sys.exit(1)
+    for pkl_path in sys.argv[1:]:
+        out = convert_pickle(pkl_path)
+        print(f"Converted {pkl_path} -> {out} ({os.path.getsize(out / 'values.npy')} bytes payload)")
@@ -0,0 +1,74 @@
+'''
+Whitespace normalization and string interning for extracted task inputs.
+'''
+import re
+import hashlib
+from functools import lru_cache
+
+# Whitespace runs (inside the text) that normalize_whitespace changes: runs
+# containing a newline other than a bare '\n' or '\n\n', and runs of two or
+# more spaces. Every such run is at least two characters long, so the scan
+# skips single spaces between words without entering the Python callback.
+_WHITESPACE_RUN = re.compile(r'\s(?=\s)(?:(?<=[^\S\n])[^\S\n]*\n\s*|(?<=\n)(?:\n?[^\S\n]|\n\n)\s*|(?<= ) +)')
+_NEWLINE_RUNS = re.compile(r'\n+')
+
+
+@lru_cache(maxsize=4096)
+def _newline_run(run: str) -> str:
+    # Line-edge whitespace is stripped; runs of 3+ adjacent newlines keep 2
+    if '\n\n\n' not in run:
+        return '\n' * run.count('\n')
+    return '\n' * sum(min(len(newlines), 2) for newlines in _NEWLINE_RUNS.findall(run))
+
+
+def _replace_run(match) -> str:
+    run = match.group()
+    return _newline_run(run) if '\n' in run else ' '
+
+
+def _edge(run: str) -> str:
+    return _newline_run(run) if '\n' in run else ''
+
+
+def normalize_whitespace(text: str) -> str:
+    '''
+    Collapses runs of spaces to one, runs of 3+ newlines to two, and strips
+    whitespace at line starts/ends, in a single regex pass. Equivalent to
+    re.sub(' {2,}', ' '), re.sub('\\n{3,}', '\\n\\n') and stripping every line,
+    applied in that order.
+    '''
+    core = text.strip()
+    if not core:
+        return _edge(text)
+    start = len(text) - len(text.lstrip())
+    end = start + len(core)
+    return _edge(text[:start]) + _WHITESPACE_RUN.sub(_replace_run, core) + _edge(text[end:])
+
+
+class Interner:
+    '''
+    Stores each distinct string once. Identical task inputs (the same system
+    prompt and task across models and runs) then share one object in memory,
+    and pickle writes them once.
+    '''
+
+    def __init__(self):
+        self._strings = {}
+        self._normalized = {}
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def intern(self, text: str) -> str:
+        return self._strings.setdefault(text, text)
+
+    def normalized(self, text: str) -> str:
+        '''
+        Interned normalize_whitespace(text), computed once per distinct text.
+        Raw texts are remembered by digest only, so they are not kept alive.
+        '''
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        result = self._normalized.get(key)
+        if result is None:
+            result = self._normalized[key] = self.intern(normalize_whitespace(text))
+        return result
@@ -0,0 +1,271 @@
+'''
+Streaming readers for HAL trace files (*_UPLOAD.json).
+
+A trace is one JSON object with run-level keys (config, results,
+raw_eval_results, ...) next to raw_logging_results, which holds every logged
+LLM call and dominates the file size. These readers use ijson so that the
+run-level keys can be read without building raw_logging_results, and logging
+entries can be consumed one at a time.
+
+Scripts that need a whole trace decode it with load_trace / loads_trace, which
+use the fastest installed JSON library (pysimdjson, orjson, then the standard
+library), or the one given with --json_backend or $HAL_JSON_BACKEND. To time
+the backends on your own traces:
+
+    python -m util.trace_io traces/<trace>_UPLOAD.json
+'''
+import os
+import re
+import json
+import mmap
+import time
+import uuid
+import argparse
+import threading
+from functools import lru_cache
+
+import ijson
+
+HEADER_KEYS = ('config', 'results')
+# Decoders for whole traces, tried in this order by the 'auto' backend.
+# orjson and pysimdjson are optional.
+JSON_BACKENDS = ('simdjson', 'orjson', 'stdlib')
+JSON_BACKEND_ENV = 'HAL_JSON_BACKEND'
+LOGGING_KEY = b'"raw_logging_results"'
+
+# Complete JSON strings (escapes included) or structural brackets. Strings are
+# consumed whole, so brackets inside them are never seen.
+_TOKEN = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+_COLON = re.compile(rb'\s*:')
+_TASK_ID = re.compile(rb'"weave_task_id"\s*:\s*(?:"([^"\\]*)"|(-?\d+))')
+_TIMESTAMP = re.compile(rb'"(started_at|ended_at)"\s*:\s*(?:"([^"\\]*)"|null)')
+
+
+def entry_task_id(entry: dict):
+    '''
+    weave_task_id of a raw_logging_results entry. Depending on the harness
+    version it is stored at the top level or under attributes.
+    '''
+    task_id = entry.get('weave_task_id')
+    if task_id is None:
+        attributes = entry.get('attributes')
+        if isinstance(attributes, dict):
+            task_id = attributes.get('weave_task_id')
+    return None if task_id is None else str(task_id)
+
+
+def peek_task_id(raw: bytes):
+    '''
+    weave_task_id of an encoded logging entry, found without decoding it.
+    Falls back to decoding when the id is not a plain string or integer.
+    '''
+    match = _TASK_ID.search(raw)
+    if match:
+        return (match.group(1) or match.group(2)).decode()
+    if b'"weave_task_id"' not in raw:
+        return None
+    return entry_task_id(json.loads(raw))
+
+
+def peek_timestamps(raw: bytes) -> tuple:
+    '''
+    (started_at, ended_at) of an encoded logging entry, None when missing,
+    found without decoding it. Falls back to decoding when a key occurs more
+    than once (nested call data).
+    '''
+    found = {}
+    for match in _TIMESTAMP.finditer(raw):
+        key = match.group(1)
+        if key in found:
+            entry = json.loads(raw)
+            return entry.get('started_at'), entry.get('ended_at')
+        found[key] = None if match.group(2) is None else match.group(2).decode()
+    return found.get(b'started_at'), found.get(b'ended_at')
+
+
+def _orjson_loads():
+    import orjson
+    return orjson.loads
+
+
+def _simdjson_loads():
+    import simdjson
+    # A parser holds one document at a time; keep one per thread
+    local = threading.local()
+
+    def loads(raw):
+        if not hasattr(local, 'parser'):
+            local.parser = simdjson.Parser()
+        return local.parser.parse(raw, recursive=True)
+    return loads
+
+
+_LOADERS = {'orjson': _orjson_loads, 'simdjson': _simdjson_loads, 'stdlib': lambda: json.loads}
+
+
+@lru_cache(maxsize=None)
+def json_loader(backend: str = None) -> tuple:
+    '''
+    (name, loads) of a JSON backend: one of JSON_BACKENDS or 'auto' (default,
+    or $HAL_JSON_BACKEND) for the first one installed. Falls back to the
+    standard library when the requested library is missing.
+    '''
+    backend = backend or os.environ.get(JSON_BACKEND_ENV) or 'auto'
+    if backend != 'auto' and backend not in _LOADERS:
+        raise ValueError(f"Unknown JSON backend {backend!r} (choose from auto, {', '.join(JSON_BACKENDS)})")
+    for name in (JSON_BACKENDS if backend == 'auto' else (backend, 'stdlib')):
+        try:
+            return name, _LOADERS[name]()
+        except ImportError:
+            continue
+
+
+def loads_trace(raw: bytes, backend: str = None):
+    '''
+    Decodes a whole trace with the selected backend. Documents a fast backend
+    rejects but the standard library accepts (NaN, integers beyond 64 bits)
+    are decoded with the standard library.
+    '''
+    name, loads = json_loader(backend)
+    if name == 'stdlib':
+        return loads(raw)
+    try:
+        return loads(raw)
+    except (ValueError, RuntimeError):
+        return json.loads(raw)
+
+
+def load_trace(path, backend: str = None):
+    with open(path, 'rb') as f:
+        return loads_trace(f.read(), backend)
+
+
+def add_json_backend_argument(parser):
+    parser.add_argument('--json_backend', '--json-backend', type=str, default=None,
+                        choices=('auto',) + JSON_BACKENDS,
+                        help=f'JSON decoder for whole traces (default: ${JSON_BACKEND_ENV} or auto, the fastest installed)')
+
+
+def read_trace_header(path, keys=HEADER_KEYS) -> dict:
+    '''
+    Reads the given top-level keys of a trace without materializing any other
+    value. Stops as soon as every key has been found.
+    '''
+    wanted = set(keys)
+    header = {}
+    with open(path, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        for prefix, event, value in events:
+            if prefix != '' or event != 'map_key' or value not in wanted:
+                continue
+            key = value
+            builder = ijson.ObjectBuilder()
+            depth = 0
+            for _, inner_event, inner_value in events:
+                builder.event(inner_event, inner_value)
+                if inner_event in ('start_map', 'start_array'):
+                    depth += 1
+                elif inner_event in ('end_map', 'end_array'):
+                    depth -= 1
+                if depth == 0:
+                    break
+            header[key] = builder.value
+            wanted.discard(key)
+            if not wanted:
+                break
+    return header
+
+
+def iter_logging_entries(path, task_ids=None):
+    '''
+    Yields the raw_logging_results entries of a trace one by one, optionally
+    only those whose weave_task_id is in task_ids.
+    '''
+    if task_ids is not None:
+        task_ids = {str(task_id) for task_id in task_ids}
+    with open(path, 'rb') as f:
+        for entry in ijson.items(f, 'raw_logging_results.item', use_float=True):
+            if task_ids is None or entry_task_id(entry) in task_ids:
+                yield entry
+
+
+def iter_logging_spans(path):
+    '''
+    Yields the (start, end) byte range of every raw_logging_results entry, so
+    entries can be decoded (or re-read later) one at a time. The file is
+    memory-mapped and scanned for brackets outside of strings; no value is
+    decoded.
+    '''
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            depth = 0
+            armed = False
+            in_array = False
+            start = None
+            for match in _TOKEN.finditer(buf):
+                token = match.group()
+                if token[0] == 0x22:  # '"'
+                    armed = False
+                    if depth == 1 and not in_array and token == LOGGING_KEY and _COLON.match(buf, match.end()):
+                        armed = True
+                    continue
+                if token in (b'{', b'['):
+                    if armed:
+                        armed, in_array = False, token == b'['
+                    elif in_array and depth == 2 and token == b'{':
+                        start = match.start()
+                    depth += 1
+                else:
+                    depth -= 1
+                    if in_array and depth == 2 and start is not None:
+                        yield start, match.end()
+                        start = None
+                    elif in_array and depth == 1:
+                        return
+
+
+def read_span(path, start: int, end: int) -> bytes:
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def agent_run_id(run_id: str, task_id) -> str:
+    '''
+    Stable id of one (run, task) transcript, shared by output/transcripts.csv
+    and the Docent uploads.
+    '''
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"hal-trace://{run_id}/{task_id}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the JSON backends on trace files')
+    parser.add_argument('paths', nargs='+', help='Trace files')
+    parser.add_argument('--repeat', type=int, default=3, help='Best of this many decodes per file (default: 3)')
+    args = parser.parse_args()
+
+    raws = []
+    for path in args.paths:
+        with open(path, 'rb') as f:
+            raws.append(f.read())
+    size = sum(len(raw) for raw in raws)
+    baseline = None
+    for backend in ('stdlib',) + tuple(b for b in JSON_BACKENDS if b != 'stdlib'):
+        name, _ = json_loader(backend)
+        if name != backend:
+            print(f"{backend:>9}: not installed")
+            continue
+        seconds = 0.0
+        for raw in raws:
+            best = float('inf')
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                loads_trace(raw, backend)
+                best = min(best, time.perf_counter() - start)
+            seconds += best
+        baseline = baseline or seconds
+        print(f"{backend:>9}: {seconds:.3f}s  {size / seconds / 1e6:.0f} MB/s  {baseline / seconds:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+'''
+Per-task shards of HAL traces.
+
+A trace keeps every logged call of every task in raw_logging_results, so even
+one task cannot be processed without decoding the whole file. shard_trace()
+streams a trace once and writes
+
+    <output>/<trace stem>/header.json        config, results, raw_eval_results and the shard index
+    <output>/<trace stem>/tasks/<task>.json  {"weave_task_id": ..., "raw_logging_results": [...]}
+
+Entries are located with iter_logging_spans and copied byte for byte, never
+decoded, so a shard is a small trace of its own that load_trace,
+iter_logging_entries and the extract-inputs scripts read as usual. Entries
+without a weave_task_id go to tasks/_untasked.json.
+
+Shards are processed task-parallel with map_shards; each worker holds one
+task's entries at a time.
+'''
+import os
+import re
+import json
+import mmap
+import shutil
+import hashlib
+import multiprocessing as mp
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from util.trace_io import read_trace_header, iter_logging_spans, peek_task_id, load_trace
+
+HEADER_NAME = 'header.json'
+TASKS_DIR = 'tasks'
+SHARD_KEYS = ('config', 'results', 'raw_eval_results')
+UNTASKED = '_untasked'
+# Entries are buffered per task and appended to its shard in chunks of this size
+FLUSH_BYTES = 1 << 20
+
+
+def shard_dir_name(trace_path) -> str:
+    return Path(trace_path).stem
+
+
+def _file_name(task_id, used: set) -> str:
+    # Task ids are free-form; keep them readable but safe as file names
+    name = UNTASKED if task_id is None else re.sub(r'[^A-Za-z0-9._-]', '_', task_id)[:100]
+    if name in used or (task_id is not None and name != task_id):
+        name = f"{name}-{hashlib.blake2b(str(task_id).encode(), digest_size=4).hexdigest()}"
+    used.add(name)
+    return name + '.json'
+
+
+class _ShardWriter:
+    # Appends encoded entries to one shard file, wrapping them in a trace-like object
+    def __init__(self, path: Path, task_id):
+        self.path = path
+        self.prefix = b'{"weave_task_id": ' + json.dumps(task_id).encode() + b', "raw_logging_results": ['
+        self.buffer = []
+        self.buffered = 0
+        self.entries = 0
+        self.size = 0
+
+    def add(self, raw: bytes):
+        self.buffer.append(raw)
+        self.buffered += len(raw)
+        if self.buffered >= FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        chunk = b','.join(self.buffer)
+        with open(self.path, 'ab' if self.entries else 'wb') as f:
+            if self.entries:
+                f.write(b',')
+            else:
+                f.write(self.prefix)
+            f.write(chunk)
+        self.entries += len(self.buffer)
+        self.size += len(chunk)
+        self.buffer, self.buffered = [], 0
+
+    def close(self):
+        self.flush()
+        with open(self.path, 'ab') as f:
+            f.write(b']}')
+
+
+def read_shard_header(shard_dir) -> dict:
+    '''
+    header.json of a shard directory, or None when it is missing.
+    '''
+    path = Path(shard_dir) / HEADER_NAME
+    if not path.is_file():
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def is_current(trace_path, shard_dir) -> bool:
+    '''
+    True when shard_dir was written from trace_path as it is now.
+    '''
+    header = read_shard_header(shard_dir)
+    if header is None:
+        return False
+    stat = os.stat(trace_path)
+    source = header.get('source', {})
+    return source.get('size') == stat.st_size and source.get('mtime_ns') == stat.st_mtime_ns
+
+
+def shard_trace(trace_path, output_dir, force=False) -> Path:
+    '''
+    Writes the per-task shards of one trace to output_dir/<trace stem> and
+    returns that directory. Shards that are current are left untouched
+    unless force is set.
+    '''
+    trace_path = Path(trace_path)
+    shard_dir = Path(output_dir) / shard_dir_name(trace_path)
+    if not force and is_current(trace_path, shard_dir):
+        return shard_dir
+    stat = os.stat(trace_path)
+    header = read_trace_header(trace_path, keys=SHARD_KEYS)
+
+    # Written next to the final directory and swapped in once complete
+    tmp_dir = shard_dir.with_name(shard_dir.name + '.tmp')
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    (tmp_dir / TASKS_DIR).mkdir(parents=True)
+    writers, used = {}, set()
+    with open(trace_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        for start, end in iter_logging_spans(trace_path):
+            raw = buf[start:end]
+            task_id = peek_task_id(raw)
+            writer = writers.get(task_id)
+            if writer is None:
+                writer = writers[task_id] = _ShardWriter(tmp_dir / TASKS_DIR / _file_name(task_id, used), task_id)
+            writer.add(raw)
+    for writer in writers.values():
+        writer.close()
+
+    header['source'] = {'file': trace_path.name, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    header['tasks'] = {UNTASKED if task_id is None else task_id:
+                       {'file': writer.path.name, 'entries': writer.entries, 'bytes': writer.size}
+                       for task_id, writer in writers.items()}
+    with open(tmp_dir / HEADER_NAME, 'w') as f:
+        json.dump(header, f)
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    os.replace(tmp_dir, shard_dir)
+    return shard_dir
+
+
+def shard_paths(shard_dir, task_ids=None) -> dict:
+    '''
+    {task_id: shard path} of a shard directory, optionally only for task_ids.
+    '''
+    shard_dir = Path(shard_dir)
+    tasks = (read_shard_header(shard_dir) or {}).get('tasks', {})
+    if task_ids is not None:
+        task_ids = {str(task_id) for task_id in task_ids}
+    return {task_id: shard_dir / TASKS_DIR / info['file'] for task_id, info in tasks.items()
+            if task_ids is None or task_id in task_ids}
+
+
+def load_shard(path, backend: str = None) -> list:
+    '''
+    raw_logging_results entries of one shard.
+    '''
+    return load_trace(path, backend)['raw_logging_results']
+
+
+def map_shards(fn, paths: dict, workers=None):
+    '''
+    Yields (task_id, fn(path)) for each {task_id: shard path}, computed in
+    worker processes, in completion order.
+    '''
+    context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(fn, path): task_id for task_id, path in paths.items()}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
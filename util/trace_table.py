@@ -0,0 +1,101 @@
+'''
+Incremental, parallel tables built from trace files.
+
+A trace table is the concatenation of the rows a scan function returns for
+each trace. Every row carries trace_file, trace_size and trace_mtime_ns, so a
+rebuild reuses the rows of traces whose size and mtime did not change and only
+scans new or modified traces, in worker processes.
+
+Per-task tables can be pivoted into a matrix laid out like
+result/result_matrix.csv (one row per benchmark_name/agent_name/model_name,
+one column per <benchmark>.<task>) with task_matrix.
+'''
+import os
+import csv
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from tqdm import tqdm
+
+TRACE_KEY_COLUMNS = ['trace_file', 'trace_size', 'trace_mtime_ns']
+MATRIX_KEY_COLUMNS = ['benchmark_name', 'agent_name', 'model_name']
+
+
+def trace_stat(path) -> dict:
+    stat = os.stat(path)
+    return {'trace_file': os.path.basename(path), 'trace_size': stat.st_size, 'trace_mtime_ns': stat.st_mtime_ns}
+
+
+def read_previous(csv_path, columns: list[str], dtype=None) -> pd.DataFrame:
+    '''
+    Previously built table, or an empty one when it is missing or has other columns.
+    '''
+    if os.path.isfile(csv_path):
+        previous = pd.read_csv(csv_path, dtype=dtype)
+        if set(columns) <= set(previous.columns):
+            return previous[columns]
+    return pd.DataFrame(columns=columns)
+
+
+def update_trace_table(paths, scan, previous: pd.DataFrame, columns: list[str], workers=None,
+                       desc='Scanning traces') -> pd.DataFrame:
+    '''
+    Rows of previous for unchanged traces plus scan(path) for the others.
+    Rows of traces that no longer exist are dropped.
+    '''
+    current = {os.path.basename(p): (os.path.getsize(p), os.stat(p).st_mtime_ns) for p in paths}
+    previous_key = previous[TRACE_KEY_COLUMNS].drop_duplicates()
+    unchanged = {name for name, size, mtime in previous_key.itertuples(index=False)
+                 if current.get(name) == (int(size), int(mtime))}
+    kept = previous[previous['trace_file'].isin(unchanged)]
+    to_scan = [p for p in paths if os.path.basename(p) not in unchanged]
+    print(f"{len(paths)} traces: {len(unchanged)} unchanged, {len(to_scan)} to scan")
+
+    rows = []
+    if to_scan:
+        context = mp.get_context('fork') if 'fork' in mp.get_all_start_methods() else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = {pool.submit(scan, path): path for path in to_scan}
+            for future in tqdm(as_completed(futures), total=len(futures), desc=desc):
+                try:
+                    rows.extend(future.result())
+                except Exception as e:
+                    tqdm.write(f"  Error scanning {os.path.basename(futures[future])}: {e}")
+
+    frames = [df for df in (kept, pd.DataFrame(rows, columns=columns)) if len(df)]
+    df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+    return df.astype({'trace_size': 'int64', 'trace_mtime_ns': 'int64'})
+
+
+def task_matrix(df: pd.DataFrame, value: str, result_matrix=None) -> pd.DataFrame:
+    '''
+    Pivots a per-task table (MATRIX_KEY_COLUMNS, task_id, value) into a task
+    matrix. When a run appears in several traces, the last trace file (in
+    name order) wins, as in compile_traces.build_matrix. With result_matrix
+    (path to result_matrix.csv), rows and columns follow its layout so both
+    matrices align cell by cell.
+    '''
+    df = df.sort_values('trace_file', kind='stable')
+    latest = df.groupby(MATRIX_KEY_COLUMNS, sort=False)['trace_file'].transform('last')
+    df = df[df['trace_file'] == latest]
+    column = df['benchmark_name'].astype(str) + '.' + df['task_id'].astype(str)
+    matrix = (df.assign(column=column)
+              .groupby(MATRIX_KEY_COLUMNS + ['column'], sort=False)[value].sum(min_count=1)
+              .unstack('column')
+              .reset_index())
+    matrix.columns.name = None
+
+    if result_matrix is not None and os.path.isfile(result_matrix):
+        with open(result_matrix, 'r', newline='') as f:
+            header = next(csv.reader(f))
+        layout = pd.read_csv(result_matrix, usecols=MATRIX_KEY_COLUMNS, dtype=str)
+        matrix = layout.merge(matrix.astype({c: str for c in MATRIX_KEY_COLUMNS}), on=MATRIX_KEY_COLUMNS, how='left')
+        task_columns = [c for c in header if c not in MATRIX_KEY_COLUMNS]
+        matrix = matrix.reindex(columns=MATRIX_KEY_COLUMNS + task_columns)
+    else:
+        task_columns = sorted(c for c in matrix.columns if c not in MATRIX_KEY_COLUMNS)
+        matrix = matrix[MATRIX_KEY_COLUMNS + task_columns]
+    matrix[task_columns] = matrix[task_columns].astype(np.float64)
+    return matrix